@@ -0,0 +1,85 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#
+# Measures the throughput of filtering the rows of documents by column
+# conditions, and of re-evaluating a single changed filter.
+#
+# Usage: python benchmarks/benchmark_document_filter.py [--rows 1M 10M]
+#
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from benchmark_document_reader import parseSize
+from benchmark_document_sorter import createStore
+from document_column_filter import DocumentColumnFilter
+from document_row_filter import DocumentRowFilter
+
+
+def benchmark(store, filters, bitmaps=None, matchAll=True):
+
+    filter = DocumentRowFilter(store, {filter.column(): filter for filter in filters}, bitmaps, matchAll)
+
+    start = time.perf_counter()
+    for _ in filter.filterBlocks():
+        pass
+    elapsed = time.perf_counter() - start
+
+    return filter, elapsed
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measures the throughput of filtering the rows of documents.")
+    parser.add_argument("--rows", nargs="+", default=["1M", "10M"], help="numbers of rows of the synthetic documents")
+    args = parser.parse_args()
+
+    Condition = DocumentColumnFilter.Condition
+
+    filterSets = [
+        ("integer range", [DocumentColumnFilter(0, Condition.Range, "-1000", "1000")]),
+        ("float equal", [DocumentColumnFilter(1, Condition.Equal, "500.00")]),
+        ("text contains", [DocumentColumnFilter(2, Condition.Contains, "123")]),
+        ("text regex", [DocumentColumnFilter(2, Condition.RegularExpression, r"7$")]),
+        ("range and text", [DocumentColumnFilter(0, Condition.Range, "0", ""), DocumentColumnFilter(2, Condition.Contains, "9")]),
+    ]
+
+    print(f"{'Rows':>6}  {'Filters':<16}  {'Shown':>10}  {'s':>8}  {'rows/s':>12}  {'Changed s':>10}")
+
+    for text in args.rows:
+        rowCount = parseSize(text)
+        store = createStore(rowCount)
+
+        for name, filters in filterSets:
+            filter, elapsed = benchmark(store, filters)
+
+            # Changing the last filter keeps the bitmaps of the other columns
+            bitmaps = filter.bitmaps()
+            del bitmaps[filters[-1].column()]
+            _, changed = benchmark(store, filters, bitmaps)
+
+            print(f"{text:>6}  {name:<16}  {len(filter.rowOrder()):>10}  {elapsed:>8.2f}  {rowCount / elapsed:>12,.0f}  {changed:>10.2f}")
+
+        del store
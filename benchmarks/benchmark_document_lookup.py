@@ -0,0 +1,104 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#
+# Measures opening, finding and closing many documents in the main window.
+# Runs without a display; the compiled resource modules must be importable.
+#
+# Usage: python benchmarks/benchmark_document_lookup.py [--counts 100 1000] [--directory DIR]
+#
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from PySide2.QtCore import QCoreApplication
+from PySide2.QtWidgets import QApplication
+
+from main_window import MainWindow
+
+
+def createFiles(directory, count):
+
+    # Documents share file names in groups of ten directories
+    fileNames = []
+    for number in range(count):
+        path = os.path.join(directory, f"dir{number % 10}")
+        os.makedirs(path, exist_ok=True)
+
+        fileName = os.path.join(path, f"document{number // 10}.csv")
+        with open(fileName, "w", encoding="utf-8") as file:
+            file.write(f"{number},a,b\n")
+        fileNames.append(fileName)
+
+    return fileNames
+
+
+def measure(function, *args):
+
+    start = time.perf_counter()
+    function(*args)
+    QCoreApplication.processEvents()
+
+    return time.perf_counter() - start
+
+
+def benchmark(window, fileNames):
+
+    openTime = measure(window.openDocuments, fileNames)
+    findTime = measure(window.openDocuments, fileNames)
+
+    window._loadPool.waitForDone()
+    QCoreApplication.processEvents()
+
+    closeTime = measure(window._documentArea.closeAllSubWindows)
+
+    return openTime, findTime, closeTime
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measures opening, finding and closing many documents.")
+    parser.add_argument("--counts", nargs="+", type=int, default=[100, 1000], help="numbers of documents")
+    parser.add_argument("--directory", default=None, help="directory of the synthetic documents")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setOrganizationName("Tabulator-QtPy Benchmarks")
+    app.setApplicationName("Tabulator-QtPy Benchmarks")
+
+    window = MainWindow()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+
+        print(f"{'Documents':>9}  {'Open s':>8}  {'Find s':>8}  {'Close s':>8}  {'Open ms/doc':>11}")
+
+        for count in args.counts:
+            fileNames = createFiles(os.path.join(directory, str(count)), count)
+
+            openTime, findTime, closeTime = benchmark(window, fileNames)
+
+            print(f"{count:>9}  {openTime:>8.2f}  {findTime:>8.2f}  {closeTime:>8.2f}  {openTime * 1000 / count:>11.2f}")
@@ -0,0 +1,110 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#
+# Measures the throughput of the chunked document reader.
+#
+# Usage: python benchmarks/benchmark_document_reader.py [--sizes 10M 1G 5G] [--directory DIR]
+#
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from document_reader import DocumentReader
+
+
+def parseSize(text):
+
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3}
+
+    unit = text[-1:].upper()
+    if unit in units:
+        return int(float(text[:-1]) * units[unit])
+
+    return int(text)
+
+
+def syntheticBlock(columnCount=10, rowCount=10000):
+
+    lines = []
+    for row in range(rowCount):
+        values = []
+        for column in range(columnCount):
+            if column % 4 == 0:
+                values.append(str(row * columnCount + column))
+            elif column % 4 == 1:
+                values.append(f"{row * 0.25:.2f}")
+            elif column % 4 == 2:
+                values.append(f"text {row % 97} {column}")
+            else:
+                values.append(f"\"quoted, {row % 13}\"")
+        lines.append(",".join(values))
+
+    return ("\r\n".join(lines) + "\r\n").encode("utf-8")
+
+
+def createFile(fileName, size):
+
+    block = syntheticBlock()
+
+    with open(fileName, "wb") as file:
+        written = 0
+        while written < size:
+            file.write(block)
+            written += len(block)
+
+
+def benchmark(fileName):
+
+    reader = DocumentReader(fileName)
+
+    rowCount = 0
+    start = time.perf_counter()
+    for block in reader.readBlocks():
+        rowCount += len(block)
+    elapsed = time.perf_counter() - start
+
+    return reader.bytesTotal(), rowCount, elapsed
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measures the throughput of the chunked document reader.")
+    parser.add_argument("--sizes", nargs="+", default=["10M", "1G", "5G"], help="sizes of the synthetic documents")
+    parser.add_argument("--directory", default=None, help="directory of the synthetic documents")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+
+        print(f"{'Size':>8}  {'Rows':>12}  {'Seconds':>9}  {'MB/s':>8}")
+
+        for text in args.sizes:
+            fileName = os.path.join(directory, f"synthetic_{text}.csv")
+            createFile(fileName, parseSize(text))
+
+            bytesTotal, rowCount, elapsed = benchmark(fileName)
+            os.remove(fileName)
+
+            print(f"{text:>8}  {rowCount:>12}  {elapsed:>9.2f}  {bytesTotal / elapsed / 1e6:>8.1f}")
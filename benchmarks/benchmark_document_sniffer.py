@@ -0,0 +1,80 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#
+# Measures the cost of detecting the dialect of documents of growing size.
+#
+# Usage: python benchmarks/benchmark_document_sniffer.py [--sizes 10M 1G 5G] [--directory DIR]
+#
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from benchmark_document_reader import parseSize, syntheticBlock
+from document_sniffer import DocumentSniffer
+
+
+def createFile(fileName, size, delimiter):
+
+    block = syntheticBlock().replace(b",", delimiter.encode("utf-8"))
+
+    # Only the head of the document holds rows; the rest is left sparse
+    with open(fileName, "wb") as file:
+        file.write(block[:size])
+        file.truncate(size)
+
+
+def benchmark(fileName, repeat=20):
+
+    sniffer = DocumentSniffer(fileName)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        sniffer.sniff()
+    elapsed = (time.perf_counter() - start) / repeat
+
+    return sniffer, elapsed
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measures the cost of detecting the dialect of documents.")
+    parser.add_argument("--sizes", nargs="+", default=["10M", "1G", "5G"], help="sizes of the synthetic documents")
+    parser.add_argument("--directory", default=None, help="directory of the synthetic documents")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+
+        print(f"{'Size':>8}  {'Delimiter':>9}  {'Quote':>5}  {'Encoding':>8}  {'Header':>6}  {'ms':>8}")
+
+        for text in args.sizes:
+            for delimiter in [",", ";", "\t"]:
+                fileName = os.path.join(directory, f"synthetic_{text}.csv")
+                createFile(fileName, parseSize(text), delimiter)
+
+                sniffer, elapsed = benchmark(fileName)
+                os.remove(fileName)
+
+                print(f"{text:>8}  {sniffer.delimiter()!r:>9}  {sniffer.quoteChar():>5}  {sniffer.encoding():>8}  {str(sniffer.hasHeader()):>6}  {elapsed * 1000:>8.2f}")
@@ -0,0 +1,100 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#
+# Measures the throughput of sorting the rows of documents by one or more
+# columns, in memory and as an external merge sort on temporary files.
+#
+# Usage: python benchmarks/benchmark_document_sorter.py [--rows 1M 10M 100M] [--budget MIB] [--external-budget MIB]
+#
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from benchmark_document_reader import parseSize
+from document_row_sorter import DocumentRowSorter
+from document_store import DocumentStore
+
+
+def createStore(rowCount, blockSize=65536):
+
+    # Integer, float and text columns of reproducible random values
+    generator = random.Random(rowCount)
+    store = DocumentStore()
+
+    for first in range(0, rowCount, blockSize):
+        count = min(blockSize, rowCount - first)
+        integers = map(str, (generator.randrange(-10 ** 6, 10 ** 6) for _ in range(count)))
+        floats = (f"{generator.random() * 1000:.2f}" for _ in range(count))
+        texts = (f"text {generator.randrange(10 ** 5)}" for _ in range(count))
+        store.appendRows(list(map(list, zip(integers, floats, texts))))
+
+    return store
+
+
+def benchmark(store, keys, memoryBudget):
+
+    sorter = DocumentRowSorter(store, keys, memoryBudget)
+
+    start = time.perf_counter()
+    for _ in sorter.sortBlocks():
+        pass
+    elapsed = time.perf_counter() - start
+
+    return sorter, elapsed
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measures the throughput of sorting the rows of documents.")
+    parser.add_argument("--rows", nargs="+", default=["1M", "10M"], help="numbers of rows of the synthetic documents")
+    parser.add_argument("--budget", type=int, default=512, help="memory budget in MiB of the in-memory sorts")
+    parser.add_argument("--external-budget", type=int, default=32, help="memory budget in MiB forcing external sorts")
+    args = parser.parse_args()
+
+    keySets = [
+        ("integer", [(0, False)]),
+        ("float desc", [(1, True)]),
+        ("text", [(2, False)]),
+        ("text, integer", [(2, False), (0, False)]),
+    ]
+
+    print(f"{'Rows':>6}  {'Keys':<14}  {'Sort':<8}  {'Runs':>5}  {'s':>8}  {'rows/s':>12}")
+
+    for text in args.rows:
+        rowCount = parseSize(text)
+        store = createStore(rowCount)
+
+        for name, keys in keySets:
+            for budget in [args.budget, args.external_budget]:
+                sorter, elapsed = benchmark(store, keys, budget * 1024 * 1024)
+                kind = "external" if sorter.isExternal() else "memory"
+
+                print(f"{text:>6}  {name:<14}  {kind:<8}  {sorter.runCount():>5}  {elapsed:>8.2f}  {rowCount / elapsed:>12,.0f}")
+
+                if not sorter.isExternal() and budget == args.external_budget:
+                    break
+
+        del store
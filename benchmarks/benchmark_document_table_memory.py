@@ -0,0 +1,130 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#
+# Compares the memory per cell of a QTableWidget and of plain lists of strings with the
+# one of the document table model, for text cells or for numeric telemetry-like cells.
+#
+# Usage: python benchmarks/benchmark_document_table_memory.py [--rows 20000] [--columns 50] [--data text|numeric]
+#
+
+import argparse
+import gc
+import os
+import resource
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+
+def residentSize():
+
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak resident size; in kilobytes on Linux, in bytes on macOS
+        size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return size if sys.platform == "darwin" else size * 1024
+
+
+def syntheticValue(row, column, data):
+
+    if data == "text":
+        return f"{row}:{column}"
+
+    # Counters, measurements with fixed decimals, and status codes
+    if column % 4 == 0:
+        return str(row * 1000 + column)
+    elif column % 4 == 1:
+        return f"{(row * 7919 + column) % 100000 / 100:.2f}"
+    elif column % 4 == 2:
+        return str((row * column) % 1024)
+    else:
+        return ["OK", "WARN", "FAIL"][(row + column) % 3]
+
+
+def syntheticBlocks(rowCount, columnCount, data="text", blockSize=1000):
+
+    for first in range(0, rowCount, blockSize):
+        yield [[syntheticValue(row, column, data) for column in range(columnCount)] for row in range(first, min(first + blockSize, rowCount))]
+
+
+def measure(variant, rowCount, columnCount, data):
+
+    from PySide2.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+    from document_table_model import DocumentTableModel
+
+    app = QApplication([])
+
+    gc.collect()
+    before = residentSize()
+
+    if variant == "widget":
+        table = QTableWidget(rowCount, columnCount)
+        row = 0
+        for block in syntheticBlocks(rowCount, columnCount, data):
+            for values in block:
+                for column, text in enumerate(values):
+                    table.setItem(row, column, QTableWidgetItem(text))
+                row += 1
+    elif variant == "lists":
+        table = []
+        for block in syntheticBlocks(rowCount, columnCount, data):
+            table.extend(block)
+    else:
+        table = DocumentTableModel()
+        for block in syntheticBlocks(rowCount, columnCount, data):
+            table.appendRows(block)
+
+    gc.collect()
+    after = residentSize()
+
+    return after - before
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Compares the memory per cell of a QTableWidget with the one of the document table model.")
+    parser.add_argument("--rows", type=int, default=20000, help="number of rows")
+    parser.add_argument("--columns", type=int, default=50, help="number of columns")
+    parser.add_argument("--data", choices=["text", "numeric"], default="text", help="kind of cell texts")
+    parser.add_argument("--variant", choices=["widget", "lists", "model"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        print(measure(args.variant, args.rows, args.columns, args.data))
+        sys.exit(0)
+
+    environment = dict(os.environ)
+    environment.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    cellCount = args.rows * args.columns
+    print(f"{'Variant':>8}  {'Cells':>10}  {'Bytes':>12}  {'Bytes/cell':>10}")
+
+    # Each variant is measured in a fresh process
+    for variant in ["widget", "lists", "model"]:
+        output = subprocess.run([sys.executable, __file__, "--variant", variant, "--rows", str(args.rows), "--columns", str(args.columns), "--data", args.data],
+                                env=environment, capture_output=True, text=True, check=True).stdout
+        size = int(output.split()[-1])
+
+        print(f"{variant:>8}  {cellCount:>10}  {size:>12}  {size / cellCount:>10.1f}")
@@ -0,0 +1,105 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+#
+# Measures the generation of header labels, one by one and in batches.
+#
+# Usage: python benchmarks/benchmark_header_labels.py [--count 1000000]
+#
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from document_table_header_labels import DocumentTableHeaderLabels
+from preferences import Preferences
+
+
+def singleLabels(count, type, parameter):
+
+    if type == Preferences.HeaderLabel.Custom:
+        numberToText = DocumentTableHeaderLabels.numberToCustom
+    elif type == Preferences.HeaderLabel.Binary:
+        numberToText = DocumentTableHeaderLabels.numberToBinary
+    elif type == Preferences.HeaderLabel.Octal:
+        numberToText = DocumentTableHeaderLabels.numberToOctal
+    elif type == Preferences.HeaderLabel.Decimal:
+        numberToText = DocumentTableHeaderLabels.numberToDecimal
+    elif type == Preferences.HeaderLabel.Hexadecimal:
+        numberToText = DocumentTableHeaderLabels.numberToHexadecimal
+    else:
+        numberToText = DocumentTableHeaderLabels.numberToLetter
+
+    return [numberToText(number, parameter) for number in range(count)]
+
+
+def batchLabels(count, type, parameter):
+
+    DocumentTableHeaderLabels.itemTexts.cache_clear()
+
+    return DocumentTableHeaderLabels.itemTexts(type, parameter, 0, count)
+
+
+def sectionLabels(count, type, parameter):
+
+    DocumentTableHeaderLabels.itemTexts.cache_clear()
+
+    labels = DocumentTableHeaderLabels(type, parameter)
+
+    return [labels.text(section) for section in range(count)]
+
+
+def measure(function, *args):
+
+    start = time.perf_counter()
+    result = function(*args)
+
+    return time.perf_counter() - start, result
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Measures the generation of header labels.")
+    parser.add_argument("--count", type=int, default=1000000, help="number of labels per type")
+    args = parser.parse_args()
+
+    schemes = [
+        ("Letter", Preferences.HeaderLabel.Letter, "upper"),
+        ("Binary", Preferences.HeaderLabel.Binary, "0b"),
+        ("Octal", Preferences.HeaderLabel.Octal, "0o"),
+        ("Decimal", Preferences.HeaderLabel.Decimal, "1"),
+        ("Hexadecimal", Preferences.HeaderLabel.Hexadecimal, "0x"),
+        ("Custom", Preferences.HeaderLabel.Custom, "Column #"),
+    ]
+
+    print(f"{'Type':>12}  {'Single s':>9}  {'Batch s':>9}  {'Sections s':>10}  {'Speedup':>8}")
+
+    for name, type, parameter in schemes:
+        singleTime, single = measure(singleLabels, args.count, type, parameter)
+        batchTime, batch = measure(batchLabels, args.count, type, parameter)
+        sectionTime, sections = measure(sectionLabels, args.count, type, parameter)
+
+        if list(batch) != single or sections != single:
+            sys.exit(f"{name}: batch labels differ from single labels")
+
+        print(f"{name:>12}  {singleTime:>9.3f}  {batchTime:>9.3f}  {sectionTime:>10.3f}  {singleTime / batchTime:>7.1f}x")
@@ -0,0 +1,335 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Times loading, scrolling, sorting, filtering, searching, relabeling all
+# columns and saving synthetic documents through the document window, on the
+# offscreen platform, and compares the times with a stored baseline.
+#
+# Usage: python benchmarks/benchmark_suite.py [--kinds wide tall quoted unicode numeric] [--scale 1.0]
+#            [--repeat 3] [--output FILE] [--baseline FILE] [--update-baseline] [--tolerance 0.25]
+#
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import PySide2
+from PySide2.QtCore import QEventLoop, QTimer
+from PySide2.QtWidgets import QApplication, QLineEdit
+
+from document import Document
+from document_column_filter import DocumentColumnFilter
+from document_find_bar import DocumentFindBar
+from document_table import DocumentTable
+from preferences import Preferences
+from synthetic_documents import Kinds, writeDocument
+
+import icons_rc
+
+
+Operations = ["load", "scroll", "sort", "filter", "search", "relabel-all", "save"]
+
+DefaultBaseline = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Operations taking longer are abandoned
+Timeout = 600
+
+
+def waitFor(signal):
+
+    # Returns the arguments of the signal, or None after the timeout
+    loop = QEventLoop()
+    arguments = []
+
+    def onSignal(*values):
+        arguments.extend(values)
+        loop.quit()
+
+    signal.connect(onSignal)
+    QTimer.singleShot(Timeout * 1000, loop.quit)
+    loop.exec_()
+    signal.disconnect(onSignal)
+
+    if not arguments:
+        raise TimeoutError(f"No result within {Timeout} s")
+
+    return arguments
+
+
+def timed(function):
+
+    start = time.perf_counter()
+    function()
+
+    return time.perf_counter() - start
+
+
+class DocumentBenchmark:
+
+    def __init__(self, fileName, workDirectory):
+
+        self._fileName = os.path.realpath(fileName)
+        self._workDirectory = workDirectory
+        self._document = None
+        self._runs = 0
+
+
+    def close(self):
+
+        if self._document:
+            self._document.close()
+            self._document.deleteLater()
+            self._document = None
+            QApplication.processEvents()
+
+
+    def load(self):
+
+        self.close()
+
+        self._document = Document()
+        self._document.resize(1280, 800)
+        self._document.show()
+
+        if not self._document.load(self._fileName):
+            raise OSError(f"Cannot read {self._fileName}")
+        self._document.startLoading()
+
+        succeeded, errorMessage = waitFor(self._document.loadFinished)
+        if not succeeded:
+            raise OSError(errorMessage)
+
+
+    def scroll(self, pageCount=100):
+
+        # Pages down through the rows and across the columns, painting each one
+        table = self._document.findChild(DocumentTable)
+
+        for scrollBar in [table.verticalScrollBar(), table.horizontalScrollBar()]:
+            step = max(scrollBar.pageStep(), (scrollBar.maximum() - scrollBar.minimum()) // pageCount)
+            for value in range(scrollBar.minimum(), scrollBar.maximum() + 1, step):
+                scrollBar.setValue(value)
+                table.viewport().repaint()
+            scrollBar.setValue(scrollBar.minimum())
+
+
+    def sort(self):
+
+        if not self._document.sortRows(1, self._runs % 2 == 1):
+            raise RuntimeError("Document cannot be sorted")
+
+        succeeded, errorMessage = waitFor(self._document.sortFinished)
+        if not succeeded:
+            raise RuntimeError(errorMessage)
+
+
+    def clearSort(self):
+
+        self._document.clearSort()
+
+
+    def filter(self):
+
+        self._document.setColumnFilter(DocumentColumnFilter(1, DocumentColumnFilter.Condition.Contains, str(self._runs % 10)))
+
+        succeeded, errorMessage = waitFor(self._document.filterFinished)
+        if not succeeded:
+            raise RuntimeError(errorMessage)
+
+
+    def clearFilters(self):
+
+        self._document.clearFilters()
+
+
+    def search(self):
+
+        # Each run searches for other text; matches of a query are kept
+        findBar = self._document.findChild(DocumentFindBar)
+        findBar.findChild(QLineEdit).setText(str(42 + self._runs))
+        self._document.findAll()
+
+        succeeded, errorMessage = waitFor(self._document.searchFinished)
+        if not succeeded:
+            raise RuntimeError(errorMessage)
+
+
+    def relabelAll(self):
+
+        # Labels all columns and paints the header
+        table = self._document.findChild(DocumentTable)
+        table.onActionLabelAllHorizontalTriggered(Preferences.HeaderLabel.Letter if self._runs % 2 == 0 else Preferences.HeaderLabel.Decimal)
+        table.horizontalHeader().viewport().repaint()
+
+
+    def save(self):
+
+        fileName = os.path.join(self._workDirectory, f"saved-{self._runs}.csv")
+        if not self._document.save(fileName):
+            raise RuntimeError("Document cannot be saved")
+
+        succeeded, errorMessage = waitFor(self._document.saveFinished)
+        if not succeeded:
+            raise OSError(errorMessage)
+
+        os.remove(fileName)
+
+
+    def run(self, repeat):
+
+        # Seconds of every run by operation
+        times = {operation: [] for operation in Operations}
+
+        for self._runs in range(repeat):
+            times["load"].append(timed(self.load))
+            times["scroll"].append(timed(self.scroll))
+            times["sort"].append(timed(self.sort))
+            self.clearSort()
+            times["filter"].append(timed(self.filter))
+            self.clearFilters()
+            times["search"].append(timed(self.search))
+            times["relabel-all"].append(timed(self.relabelAll))
+            times["save"].append(timed(self.save))
+
+        self.close()
+
+        return times
+
+
+def runSuite(kinds, scale, repeat, directory):
+
+    results = {}
+
+    for kind in kinds:
+        defaultRowCount, columnCount = Kinds[kind]
+        fileName = os.path.join(directory, f"{kind}.csv")
+        rowCount, columnCount = writeDocument(fileName, kind, max(int(defaultRowCount * scale), 1), columnCount)
+
+        times = DocumentBenchmark(fileName, directory).run(repeat)
+
+        results[kind] = {
+            "rows": rowCount,
+            "columns": columnCount,
+            "bytes": os.path.getsize(fileName),
+            "operations": {operation: {"median": statistics.median(seconds), "minimum": min(seconds), "runs": seconds} for operation, seconds in times.items()},
+        }
+
+        os.remove(fileName)
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+
+    # Rows of kind, operation, seconds, baseline seconds and change; operations
+    # slower than the baseline by more than the tolerance are regressions.
+    rows = []
+    regressions = []
+
+    for kind, result in results.items():
+        for operation, measure in result["operations"].items():
+            baselineMeasure = baseline.get("results", {}).get(kind, {}).get("operations", {}).get(operation) if baseline else None
+            baselineSeconds = baselineMeasure["median"] if baselineMeasure else None
+
+            change = measure["median"] / baselineSeconds - 1 if baselineSeconds else None
+            rows.append((kind, operation, measure["median"], baselineSeconds, change))
+
+            if change is not None and change > tolerance:
+                regressions.append((kind, operation))
+
+    return rows, regressions
+
+
+def printComparison(rows, file):
+
+    print(f"{'Kind':<8}  {'Operation':<11}  {'s':>9}  {'Baseline s':>10}  {'Change':>8}", file=file)
+
+    for kind, operation, seconds, baselineSeconds, change in rows:
+        baselineText = f"{baselineSeconds:>10.3f}" if baselineSeconds is not None else f"{'-':>10}"
+        changeText = f"{change:>+8.1%}" if change is not None else f"{'-':>8}"
+        print(f"{kind:<8}  {operation:<11}  {seconds:>9.3f}  {baselineText}  {changeText}", file=file)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Times the main paths of the application on synthetic documents.")
+    parser.add_argument("--kinds", nargs="+", choices=sorted(Kinds), default=list(Kinds), help="kinds of synthetic documents")
+    parser.add_argument("--scale", type=float, default=1.0, help="factor of the default numbers of rows")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each operation; their median is compared")
+    parser.add_argument("--directory", help="directory of the synthetic documents")
+    parser.add_argument("--output", help="JSON file of the results; written to the standard output if not given")
+    parser.add_argument("--baseline", default=DefaultBaseline, help="JSON file of earlier results to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="stores the results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="slowdown relative to the baseline reported as regression")
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv[:1])
+    app.setOrganizationName("NotNypical")
+    app.setApplicationName("Tabulator-QtPy Benchmarks")
+
+    with tempfile.TemporaryDirectory(dir=args.directory) as directory:
+        results = runSuite(args.kinds, args.scale, args.repeat, directory)
+
+    report = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pyside": PySide2.__version__,
+        "platform": platform.platform(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": results,
+    }
+
+    # Times of other numbers of rows are not comparable
+    baseline = None
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+        if baseline.get("scale") != args.scale:
+            print(f"Baseline of scale {baseline.get('scale')} not compared", file=sys.stderr)
+            baseline = None
+
+    rows, regressions = compare(results, baseline, args.tolerance)
+    printComparison(rows, sys.stderr)
+
+    text = json.dumps(report, indent=4) + "\n"
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    else:
+        sys.stdout.write(text)
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    if regressions:
+        print("Regressions: " + ", ".join(f"{kind} {operation}" for kind, operation in regressions), file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,156 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+#
+# Writes reproducible synthetic documents of several kinds; the same kind,
+# shape and seed give the same bytes on every platform and Python version.
+#
+# Usage: python benchmarks/synthetic_documents.py KIND FILE [--rows N] [--columns N] [--seed N]
+#
+
+import argparse
+import csv
+import random
+
+
+# Default numbers of rows and columns by kind
+Kinds = {
+    "wide": (2000, 1000),
+    "tall": (500000, 8),
+    "quoted": (100000, 10),
+    "unicode": (100000, 10),
+    "numeric": (200000, 12),
+}
+
+Words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta", "iota", "kappa", "lambda", "omicron"]
+UnicodeWords = ["Grüße", "naïve", "façade", "Ελλάδα", "Москва", "שלום", "مرحبا", "日本語", "한국어", "ไทย", "emoji 😀", "∑∫√"]
+
+
+class ValueGenerator:
+
+    def __init__(self, seed):
+
+        # Only random() is guaranteed to give the same sequence everywhere;
+        # all values are derived from it.
+        self._random = random.Random(seed)
+
+
+    def integer(self, lower, upper):
+
+        return lower + int(self._random.random() * (upper - lower))
+
+
+    def choice(self, values):
+
+        return values[self.integer(0, len(values))]
+
+
+    def decimal(self, lower, upper, digits=2):
+
+        return f"{lower + self._random.random() * (upper - lower):.{digits}f}"
+
+
+    def words(self, values, count):
+
+        return " ".join(self.choice(values) for _ in range(count))
+
+
+def rowValues(kind, generator, row, columnCount):
+
+    if kind == "wide" or kind == "tall":
+        # Identifiers, counters, measurements and short texts
+        values = []
+        for column in range(columnCount):
+            if column % 4 == 0:
+                values.append(str(row * columnCount + column))
+            elif column % 4 == 1:
+                values.append(str(generator.integer(0, 100000)))
+            elif column % 4 == 2:
+                values.append(generator.decimal(-1000, 1000))
+            else:
+                values.append(generator.choice(Words))
+        return values
+
+    elif kind == "quoted":
+        # Delimiters, quotes and line breaks within fields
+        values = [str(row)]
+        for column in range(1, columnCount):
+            words = generator.words(Words, generator.integer(1, 6))
+            variant = generator.integer(0, 4)
+            if variant == 0:
+                words = words.replace(" ", ", ")
+            elif variant == 1:
+                words = f"\"{words}\" said {generator.choice(Words)}"
+            elif variant == 2:
+                words = words.replace(" ", "\n", 1)
+            values.append(words)
+        return values
+
+    elif kind == "unicode":
+        values = [str(row)]
+        for column in range(1, columnCount):
+            values.append(generator.words(UnicodeWords, generator.integer(1, 4)))
+        return values
+
+    elif kind == "numeric":
+        # Integers, decimals, scientific notation and negative values
+        values = [str(row)]
+        for column in range(1, columnCount):
+            if column % 3 == 0:
+                values.append(str(generator.integer(-10 ** 9, 10 ** 9)))
+            elif column % 3 == 1:
+                values.append(generator.decimal(-10 ** 4, 10 ** 4, 4))
+            else:
+                values.append(f"{generator.integer(1, 10 ** 6) * 1.0e-3:.6e}")
+        return values
+
+    raise ValueError(f"Unknown kind of document: {kind}")
+
+
+def writeDocument(fileName, kind, rowCount=None, columnCount=None, seed=0, blockSize=10000):
+
+    # Returns the numbers of rows and columns written
+    defaultRowCount, defaultColumnCount = Kinds[kind]
+    rowCount = rowCount if rowCount is not None else defaultRowCount
+    columnCount = columnCount if columnCount is not None else defaultColumnCount
+
+    generator = ValueGenerator(f"{kind}:{seed}")
+
+    with open(fileName, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file, lineterminator="\n")
+
+        for first in range(0, rowCount, blockSize):
+            last = min(first + blockSize, rowCount)
+            writer.writerows(rowValues(kind, generator, row, columnCount) for row in range(first, last))
+
+    return rowCount, columnCount
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Writes a reproducible synthetic document.")
+    parser.add_argument("kind", choices=sorted(Kinds), help="kind of document")
+    parser.add_argument("file", help="document written")
+    parser.add_argument("--rows", type=int, help="number of rows; depends on the kind if not given")
+    parser.add_argument("--columns", type=int, help="number of columns; depends on the kind if not given")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the values")
+    args = parser.parse_args()
+
+    rowCount, columnCount = writeDocument(args.file, args.kind, args.rows, args.columns, args.seed)
+    print(f"{rowCount} rows and {columnCount} columns written to {args.file}")
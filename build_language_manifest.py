@@ -0,0 +1,64 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+import sys
+import xml.etree.ElementTree as ElementTree
+
+from PySide2.QtCore import QLocale
+
+
+# Languages of the translations compiled into the resources are described
+# once, when the resources are built, so that listing them at runtime does
+# not need to load every translation.
+
+def buildManifest(collectionFileName):
+
+    directory = os.path.dirname(os.path.abspath(collectionFileName))
+
+    manifest = []
+    for resource in ElementTree.parse(collectionFileName).getroot().iter("qresource"):
+        if resource.get("prefix") != "/translations":
+            continue
+
+        for file in resource.iter("file"):
+            if not file.text.endswith(".qm"):
+                continue
+
+            # The language is declared by the source of the translation
+            source = os.path.join(directory, os.path.splitext(file.text)[0] + ".ts")
+            language = ElementTree.parse(source).getroot().get("language")
+
+            locale = QLocale(language)
+            manifest.append({"code": file.get("alias", os.path.basename(file.text)), "language": language,
+                             "name": locale.languageToString(locale.language()), "nativeName": locale.nativeLanguageName()})
+
+    return manifest
+
+
+if __name__ == "__main__":
+
+    collectionFileName = sys.argv[1] if len(sys.argv) > 1 else "translations.qrc"
+    manifestFileName = sys.argv[2] if len(sys.argv) > 2 else os.path.join("translations", "languages.json")
+
+    with open(manifestFileName, "w", encoding="utf-8") as file:
+        json.dump(buildManifest(collectionFileName), file, ensure_ascii=False, indent=4)
+        file.write("\n")
@@ -18,15 +18,66 @@
 # along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-from PySide2.QtCore import QFileInfo, Qt, Signal
-from PySide2.QtWidgets import QWidget
+import csv
+import os
+import re
+from bisect import bisect_right
 
+from PySide2.QtCore import QFileInfo, QItemSelection, QItemSelectionModel, QStandardPaths, Qt, QThreadPool, QTimer, Signal
+from PySide2.QtWidgets import QApplication, QFileDialog, QMessageBox, QVBoxLayout, QWidget
+
+from document_clipboard_reader import DocumentClipboardReader
+from document_clipboard_writer import DocumentClipboardWriter
+from document_column_filter import DocumentColumnFilter
+from document_copier import DocumentCopier
+from document_filter_bar import DocumentFilterBar
+from document_filterer import DocumentFilterer
+from document_find_bar import DocumentFindBar
+from document_finder import DocumentFinder
+from document_index_cache import DocumentIndexCache
+from document_index_reader import DocumentIndexReader
+from document_indexer import DocumentIndexer
+from document_journal import DocumentJournal
+from document_loader import DocumentLoader
+from document_mapped_store import DocumentMappedStore
+from document_paster import DocumentPaster
+from document_reader import DocumentReader
+from document_row_filter import DocumentRowFilter
+from document_row_sorter import DocumentRowSorter
+from document_saver import DocumentSaver
+from document_searcher import DocumentSearcher
+from document_sniffer import DocumentSniffer
+from document_sorter import DocumentSorter
+from document_table import DocumentTable
+from document_writer import DocumentWriter
 from preferences import Preferences
 
 
 class Document(QWidget):
 
+    # Find All selects no more matches than this
+    MaximumSelectedMatches = 10000
+
+    # Larger selections are copied, and larger texts parsed for pasting, on
+    # worker threads
+    BackgroundCopyCells = 100000
+    BackgroundPasteCharacters = 1048576
+
     aboutToClose = Signal(str)
+    loadProgressChanged = Signal("qint64", "qint64")
+    loadFinished = Signal(bool, str)
+    saveProgressChanged = Signal("qint64", "qint64", float)
+    saveFinished = Signal(bool, str)
+    sortProgressChanged = Signal("qint64", "qint64")
+    sortFinished = Signal(bool, str)
+    filterFinished = Signal(bool, str)
+    searchFinished = Signal(bool, str)
+    copyFinished = Signal(bool, str)
+    pasteFinished = Signal(bool, str)
+    historyChanged = Signal()
+    journalStarted = Signal(str)
+    journalFailed = Signal(str)
+    recoveryFinished = Signal(bool, str)
 
 
     def __init__(self, parent=None):
@@ -37,12 +88,117 @@ class Document(QWidget):
         self._preferences = Preferences()
         self._canonicalName = None
         self._canonicalIndex = 0
+        self._delimiter = ","
+        self._quoteChar = "\""
+        self._encoding = "utf-8"
+        self._hasHeader = False
+        self._loader = None
+        self._indexCache = None
+        self._saver = None
+        self._saveFileName = None
+        self._saveDelimiter = None
+        self._saveCopy = False
+        self._closeAfterSave = False
+
+        # Clipboard texts are serialised and parsed in one pass; the cell
+        # where a text parsed in the background is pasted is kept.
+        self._copier = None
+        self._paster = None
+        self._pasteRow = 0
+        self._pasteColumn = 0
+
+        # Rows are shown in the order of the sort keys: (column, descending)
+        self._sorter = None
+        self._sortKeys = []
+        self._sortOrder = None
+        self._sortPositions = None
+
+        # Rows shown have to match all or any of the filters by column; the
+        # bitmaps of the rows matching each filter are kept until the cells change.
+        self._filterer = None
+        self._columnFilters = {}
+        self._filterBitmaps = {}
+        self._filterMatchAll = True
+
+        # Matches of the last query, sorted by row and column; they are kept
+        # until the cells change and streamed in while the search runs.
+        self._finder = None
+        self._searchQuery = None
+        self._searchMatches = []
+        self._searchComplete = False
+        self._searchIndexes = {}
+        self._searchIndexStore = None
+        self._findNextPending = False
+        self._findAllPending = False
+
+        # Edits of the store are recorded in a journal next to the document,
+        # written on a timer; the journal of an earlier session is replayed
+        # once the rows have been read.
+        self._journal = None
+        self._journalTimer = QTimer(self)
+        self._journalTimer.setSingleShot(True)
+        self._journalTimer.timeout.connect(self.flushJournal)
+        self._recoveryJournalName = None
+
+        # View of an earlier session: the dialect is used instead of sniffing,
+        # sort keys and filters are applied once the rows have been read, and
+        # the rows are scrolled to once they are shown in that order.
+        self._viewState = None
+        self._pendingScrollPosition = None
+
+        self._table = DocumentTable()
+
+        model = self._table.model()
+        model.dataChanged.connect(self._onTableChanged)
+        model.rowsInserted.connect(self._onTableChanged)
+        model.rowsRemoved.connect(self._onTableChanged)
+        model.columnsInserted.connect(self._onTableChanged)
+        model.columnsRemoved.connect(self._onTableChanged)
+        model.modelReset.connect(self._onTableReset)
+        model.rowsInserted.connect(self._onTableStructureChanged)
+        model.rowsRemoved.connect(self._onTableStructureChanged)
+        model.columnsInserted.connect(self._onTableStructureChanged)
+        model.columnsRemoved.connect(self._onTableStructureChanged)
+        model.storeEdited.connect(self._onTableStoreEdited)
+
+        undoStack = self._table.undoStack()
+        undoStack.indexChanged.connect(self.historyChanged)
+        undoStack.canUndoChanged.connect(self.historyChanged)
+        undoStack.canRedoChanged.connect(self.historyChanged)
+
+        self._table.sortRequested.connect(self.sortRows)
+        self._table.sortCleared.connect(self.clearSort)
+
+        self._filterBar = DocumentFilterBar()
+        self._filterBar.setVisible(False)
+        self._filterBar.columnChanged.connect(self._onFilterBarColumnChanged)
+        self._filterBar.applyRequested.connect(self._onFilterBarApplyRequested)
+        self._filterBar.removeRequested.connect(lambda: self.removeColumnFilter(self._filterBar.column()))
+        self._filterBar.clearRequested.connect(self.clearFilters)
+        self._filterBar.matchAllChanged.connect(self.setFilterMatchAll)
+
+        self._findBar = DocumentFindBar()
+        self._findBar.setVisible(False)
+        self._findBar.findNextRequested.connect(self.findNext)
+        self._findBar.findAllRequested.connect(self.findAll)
+
+        # Main layout
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._filterBar)
+        layout.addWidget(self._table)
+        layout.addWidget(self._findBar)
 
 
     def setPreferences(self, preferences):
 
         self._preferences = preferences
 
+        self._table.setPreferences(preferences)
+
+        if preferences.autosaveInterval() <= 0:
+            self._removeJournal()
+
 
     def setCanonicalName(self, canonicalName):
 
@@ -64,6 +220,41 @@ class Document(QWidget):
         return self._canonicalIndex
 
 
+    def setDelimiter(self, delimiter):
+
+        self._delimiter = delimiter
+
+
+    def delimiter(self):
+
+        return self._delimiter
+
+
+    def quoteChar(self):
+
+        return self._quoteChar
+
+
+    def encoding(self):
+
+        return self._encoding
+
+
+    def hasHeader(self):
+
+        return self._hasHeader
+
+
+    def isReadOnly(self):
+
+        return self._table.isReadOnly()
+
+
+    def isModified(self):
+
+        return self._table.isModified()
+
+
     def documentTitle(self):
 
         return self.windowTitle()
@@ -74,25 +265,1088 @@ class Document(QWidget):
         fileName = QFileInfo(self._canonicalName).fileName() if self._canonicalName else self.tr("Untitled")
 
         if self._canonicalIndex > 1:
-            self.setWindowTitle(self.tr("{0} ({1})").format(fileName, self._canonicalIndex))
+            title = self.tr("{0} ({1})").format(fileName, self._canonicalIndex)
         else:
-            self.setWindowTitle(fileName)
+            title = fileName
 
+        if self.isReadOnly():
+            title = self.tr("{0} [Read-Only]").format(title)
 
-    def closeEvent(self, event):
+        if self.isLoading():
+            title = self.tr("{0} [Loading]").format(title)
 
-        if True:
-            # Document will be closed
-            self.aboutToClose.emit(self._canonicalName)
+        self.setWindowTitle(title)
 
-            event.accept()
-        else:
+
+    def isLoading(self):
+
+        return self._loader is not None
+
+
+    def cancelLoading(self):
+
+        if self._loader:
+            self._loader.cancel()
+
+
+    def isSaving(self):
+
+        return self._saver is not None
+
+
+    def byteSize(self):
+
+        # Memory taken by the cells and the history of their edits
+        return self._table.store().byteSize() + self._table.undoStack().byteSize()
+
+
+    def closeEvent(self, event):
+
+        # Edits are saved or discarded first; the document is closed once they
+        # have been saved.
+        if self._closeAfterSave:
             event.ignore()
+            return
+        elif self.isModified():
+            answer = self._askSaveChanges()
+            if answer == QMessageBox.Save:
+                self._saveBeforeClose()
+                event.ignore()
+                return
+            elif answer != QMessageBox.Discard:
+                event.ignore()
+                return
+
+        self.cancelLoading()
+        if self._saver:
+            self._saver.cancel()
+        self._cancelSearch()
+        if self._sorter:
+            self._sorter.cancel()
+        if self._filterer:
+            self._filterer.cancel()
+        if self._copier:
+            self._copier.cancel()
+        if self._paster:
+            self._paster.cancel()
+
+        # Files mapped by the store are released, so they can be written again
+        self._table.store().close()
+
+        # The journal is removed only with edits saved or discarded by the user;
+        # a journal still to be recovered is kept.
+        self._removeJournal()
+
+        self.aboutToClose.emit(self._canonicalName)
+
+        event.accept()
+
+
+    def _askSaveChanges(self):
+
+        messageBox = QMessageBox(QMessageBox.Warning, self.tr("Close Document"),
+            self.tr("The document {0} has been modified.\nDo you want to save your changes or discard them?").format(self.documentTitle()), parent=self)
+        messageBox.addButton(QMessageBox.Save)
+        messageBox.addButton(QMessageBox.Discard)
+        messageBox.addButton(QMessageBox.Cancel)
+        messageBox.setDefaultButton(QMessageBox.Save)
+
+        return messageBox.exec_()
 
 
-    def load(self, canonicalName):
+    def _saveBeforeClose(self):
+
+        fileName = self._canonicalName
+        if not fileName:
+            fileName = QFileDialog.getSaveFileName(self, self.tr("Save Document"), QStandardPaths.writableLocation(QStandardPaths.HomeLocation),
+                self.tr("CSV Files (*.csv);;All Files (*.*)"))[0]
+            if not fileName:
+                return False
+
+        self._closeAfterSave = self.save(fileName)
+
+        return self._closeAfterSave
+
+
+    def viewState(self):
+
+        # Only plain values are kept, to be stored between sessions
+        filters = [[filter.column(), filter.condition().name, filter.text(), filter.upperText(), filter.isCaseSensitive()] for filter in self._columnFilters.values()]
+
+        return {"dialect": [self._delimiter, self._quoteChar, self._encoding, self._hasHeader],
+                "columnWidths": self._table.columnWidths(), "scrollPosition": self._table.scrollPosition(),
+                "sortKeys": self._sortKeys, "filters": filters, "filterMatchAll": self._filterMatchAll}
+
+
+    def setViewState(self, state):
+
+        # Applies to the document loaded next
+        self._viewState = state
+
+
+    def load(self, canonicalName, readOnly=False, journalName=None):
 
         self.setCanonicalName(canonicalName)
 
+        if not canonicalName:
+            self._table.newDocument()
+            return True
+
+        if not QFileInfo(canonicalName).isReadable():
+            return False
+
+        # The dialect is detected from the head of the document, unless it is known
+        sniffer = DocumentSniffer(canonicalName)
+        if self._viewState and self._viewState.get("dialect"):
+            self._delimiter, self._quoteChar, self._encoding, self._hasHeader = self._viewState["dialect"]
+        elif sniffer.sniff():
+            self._delimiter = sniffer.delimiter()
+            self._quoteChar = sniffer.quoteChar()
+            self._encoding = sniffer.encoding()
+            self._hasHeader = sniffer.hasHeader()
+
+        # Rows can be indexed by their bytes only in ASCII-compatible encodings
+        if self._encoding == "utf-16":
+            readOnly = False
+
+        self._table.loadDocument(canonicalName)
+
+        if not readOnly:
+            # Rows are read on a worker thread and streamed into the table
+            self._loader = DocumentLoader(DocumentReader(canonicalName, self._delimiter, self._quoteChar, self._encoding))
+            self._loader.signals.blockLoaded.connect(self._table.appendRows)
+
+            if journalName:
+                # Cells cannot be edited until the journal has been replayed
+                self._recoveryJournalName = journalName
+                self._table.setLocked(True)
+            else:
+                self._startJournal()
+        else:
+            # The document is mapped into memory; a worker thread indexes the
+            # rows and the fields are parsed only for rows shown in the table.
+            try:
+                store = DocumentMappedStore(canonicalName, self._delimiter, self._quoteChar, self._encoding)
+            except (OSError, ValueError):
+                return False
+
+            # Row offsets are kept on disk; the index of an unchanged document
+            # is read instead of the document.
+            if self._preferences.indexCacheBudget() > 0:
+                directory = os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "indexes")
+                self._indexCache = DocumentIndexCache(directory, self._preferences.indexCacheBudget() * 1024 * 1024)
+
+            cachedIndex = self._indexCache.find(canonicalName, self._delimiter, self._quoteChar, self._encoding) if self._indexCache else None
+            if cachedIndex:
+                metadata, offsetsFileName = cachedIndex
+                store.setColumnCount(metadata.get("columnCount", 0))
+                self._table.setStore(store)
+
+                self._loader = DocumentLoader(DocumentIndexReader(offsetsFileName))
+            else:
+                self._table.setStore(store)
+
+                indexer = DocumentIndexer(canonicalName, self._quoteChar, self._encoding)
+                if self._indexCache:
+                    try:
+                        self._indexCache.prepare()
+                        indexer.setOffsetsFileName(self._indexCache.temporaryFileName(canonicalName, self._delimiter))
+                    except OSError:
+                        self._indexCache = None
+
+                self._loader = DocumentLoader(indexer)
+
+            self._loader.signals.blockLoaded.connect(self._table.appendRowOffsets)
+
+        self._loader.signals.progressChanged.connect(self.loadProgressChanged)
+        self._loader.signals.finished.connect(self._onLoaderFinished)
+
+        if self._viewState:
+            self._applyViewState(self._viewState)
+
+        return True
+
+
+    def startLoading(self, threadPool=None):
+
+        # Rows are read once the loader has been started
+        if self._loader:
+            (threadPool if threadPool else QThreadPool.globalInstance()).start(self._loader)
+
+
+    def save(self, fileName, delimiter=None, copy=False, threadPool=None):
+
+        if self._loader or self._saver:
+            return False
+
+        self._saveFileName = fileName
+        self._saveDelimiter = delimiter if delimiter else self._delimiter
+        self._saveCopy = copy
+
+        # Rows are written from the store on a worker thread; editing is
+        # disabled until the document has been written.
+        self._table.setLocked(True)
+
+        self._saver = DocumentSaver(DocumentWriter(fileName, self._table.store(), self._saveDelimiter, self._quoteChar, self._encoding))
+        self._saver.signals.progressChanged.connect(self.saveProgressChanged)
+        self._saver.signals.finished.connect(self._onSaverFinished)
+        (threadPool if threadPool else QThreadPool.globalInstance()).start(self._saver)
 
         return True
+
+
+    def flushJournal(self):
+
+        self._journalTimer.stop()
+
+        if not self._journal:
+            return
+
+        started = self._journal.isStarted()
+        try:
+            self._journal.flush()
+        except OSError as error:
+            # Edits are no longer recorded; the incomplete journal is dropped
+            self._removeJournal()
+            self.journalFailed.emit(str(error))
+            return
+
+        if not started and self._journal.isStarted():
+            self.journalStarted.emit(self._journal.fileName())
+
+
+    def _startJournal(self):
+
+        # Edits are recorded from the state of the document as saved
+        self._journal = None
+
+        if self._preferences.autosaveInterval() <= 0 or not self._canonicalName or self.isReadOnly():
+            return
+
+        try:
+            header = DocumentJournal.documentHeader(self._canonicalName, self._delimiter, self._quoteChar, self._encoding)
+        except OSError:
+            return
+
+        self._journal = DocumentJournal(DocumentJournal.journalName(self._canonicalName), header)
+
+
+    def _removeJournal(self):
+
+        self._journalTimer.stop()
+
+        if self._journal:
+            try:
+                self._journal.remove()
+            except OSError:
+                pass
+            self._journal = None
+
+
+    def _recoverJournal(self, journalName):
+
+        model = self._table.model()
+        edits = 0
+
+        try:
+            for edit in DocumentJournal.readEdits(journalName):
+                model.applyStoreEdit(edit)
+                edits += 1
+        except (OSError, ValueError, TypeError, KeyError, IndexError) as error:
+            # Edits replayed so far are kept; the journal is left for inspection
+            errorMessage = str(error)
+        else:
+            errorMessage = ""
+
+            # Further edits are appended to the journal replayed
+            if self._preferences.autosaveInterval() > 0:
+                self._journal = DocumentJournal(journalName)
+
+        # The document differs from the saved one, whatever is undone
+        if edits:
+            self._table.undoStack().resetClean()
+
+        self.recoveryFinished.emit(not errorMessage, errorMessage)
+
+
+    def canUndo(self):
+
+        return self._table.undoStack().canUndo()
+
+
+    def canRedo(self):
+
+        return self._table.undoStack().canRedo()
+
+
+    def undoText(self):
+
+        return self._table.undoStack().undoText()
+
+
+    def redoText(self):
+
+        return self._table.undoStack().redoText()
+
+
+    def undo(self):
+
+        # The store is not changed while worker threads read it
+        if self._table.model().isLocked():
+            return False
+
+        self._table.undoStack().undo()
+        return True
+
+
+    def redo(self):
+
+        if self._table.model().isLocked():
+            return False
+
+        self._table.undoStack().redo()
+        return True
+
+
+    def copy(self, threadPool=None):
+
+        # Rows still being read cannot be copied consistently
+        if self._copier or self._loader:
+            return False
+
+        rows, columns = self._selectedRowsAndColumns()
+        if not rows or not columns:
+            return False
+
+        # Cells are read from the store in the order the rows are shown
+        model = self._table.model()
+        storeRows = rows if model.rowOrder() is None else list(map(model.storeRow, rows))
+        writer = DocumentClipboardWriter(self._table.store(), storeRows, columns)
+
+        if writer.cellCount() < self.BackgroundCopyCells:
+            for _ in writer.writeBlocks():
+                pass
+
+            QApplication.clipboard().setText(writer.text())
+            self.copyFinished.emit(True, "")
+            return True
+
+        self._table.setLocked(True)
+
+        self._copier = DocumentCopier(writer)
+        self._copier.signals.finished.connect(self._onCopierFinished)
+        (threadPool if threadPool else QThreadPool.globalInstance()).start(self._copier)
+
+        return True
+
+
+    def paste(self, threadPool=None):
+
+        model = self._table.model()
+        if self._paster or self.isReadOnly() or model.isLocked():
+            return False
+
+        # Comma-separated values are read only when offered as such
+        clipboard = QApplication.clipboard()
+        mimeData = clipboard.mimeData()
+        if mimeData.hasFormat("text/csv"):
+            text = mimeData.data("text/csv").data().decode("utf-8", errors="replace")
+            delimiter = ","
+        else:
+            text = mimeData.text()
+            delimiter = "\t"
+        if not text:
+            return False
+
+        # Cells are pasted from the top left cell of the selection on
+        rows, columns = self._selectedRowsAndColumns()
+        self._pasteRow = rows[0] if rows else 0
+        self._pasteColumn = columns[0] if columns else 0
+
+        reader = DocumentClipboardReader(text, delimiter)
+
+        if len(text) < self.BackgroundPasteCharacters:
+            try:
+                for _ in reader.readBlocks():
+                    pass
+            except csv.Error as error:
+                self.pasteFinished.emit(False, str(error))
+                return False
+
+            return self._pasteRows(reader.rows())
+
+        # The cells are not edited until the text has been parsed
+        self._table.setLocked(True)
+
+        self._paster = DocumentPaster(reader)
+        self._paster.signals.finished.connect(self._onPasterFinished)
+        (threadPool if threadPool else QThreadPool.globalInstance()).start(self._paster)
+
+        return True
+
+
+    def _pasteRows(self, rows):
+
+        model = self._table.model()
+
+        if not model.pasteRows(self._pasteRow, self._pasteColumn, rows):
+            self.pasteFinished.emit(False, self.tr("No cells can be pasted here"))
+            return False
+
+        # The pasted cells are selected
+        rowCount = min(len(rows), model.rowCount() - self._pasteRow)
+        columnCount = min(max(map(len, rows)), model.columnCount() - self._pasteColumn)
+        selection = QItemSelection(model.index(self._pasteRow, self._pasteColumn), model.index(self._pasteRow + rowCount - 1, self._pasteColumn + columnCount - 1))
+        self._table.selectionModel().select(selection, QItemSelectionModel.ClearAndSelect)
+
+        self.pasteFinished.emit(True, "")
+        return True
+
+
+    def _selectedRowsAndColumns(self):
+
+        # Rows and columns of the selected cells, in the order shown; a single
+        # range of cells is returned as ranges.
+        selection = self._table.selectionModel().selection()
+
+        if selection.isEmpty():
+            index = self._table.currentIndex()
+            return ([index.row()], [index.column()]) if index.isValid() else ([], [])
+
+        if len(selection) == 1:
+            selectionRange = selection[0]
+            return range(selectionRange.top(), selectionRange.bottom() + 1), range(selectionRange.left(), selectionRange.right() + 1)
+
+        rows = set()
+        columns = set()
+        for selectionRange in selection:
+            rows.update(range(selectionRange.top(), selectionRange.bottom() + 1))
+            columns.update(range(selectionRange.left(), selectionRange.right() + 1))
+
+        return sorted(rows), sorted(columns)
+
+
+    def _onCopierFinished(self, succeeded, errorMessage):
+
+        writer = self._copier.writer()
+
+        self._copier = None
+        self._table.setLocked(False)
+
+        if succeeded:
+            QApplication.clipboard().setText(writer.text())
+
+        self.copyFinished.emit(succeeded, errorMessage)
+
+
+    def _onPasterFinished(self, succeeded, errorMessage):
+
+        reader = self._paster.reader()
+
+        self._paster = None
+        self._table.setLocked(False)
+
+        if not succeeded:
+            self.pasteFinished.emit(False, errorMessage)
+            return
+
+        self._pasteRows(reader.rows())
+
+
+    def isSorting(self):
+
+        return self._sorter is not None
+
+
+    def sortKeys(self):
+
+        return list(self._sortKeys)
+
+
+    def sortRows(self, column, descending=False, thenBy=False, threadPool=None):
+
+        if self._loader or self._sorter or column < 0:
+            return False
+
+        # Further keys sort the rows which are equal in the keys before
+        keys = [key for key in self._sortKeys if key[0] != column] if thenBy else []
+        keys.append((column, descending))
+
+        self._startSorting(keys, threadPool)
+
+        return True
+
+
+    def _startSorting(self, keys, threadPool=None):
+
+        # Only a permutation of the rows is sorted on a worker thread; editing
+        # is disabled until the rows are shown in their new order.
+        self._table.setLocked(True)
+
+        memoryBudget = self._preferences.sortMemoryBudget() * 1024 * 1024
+        self._sorter = DocumentSorter(DocumentRowSorter(self._table.store(), keys, memoryBudget))
+        self._sorter.signals.progressChanged.connect(self.sortProgressChanged)
+        self._sorter.signals.finished.connect(self._onSorterFinished)
+        (threadPool if threadPool else QThreadPool.globalInstance()).start(self._sorter)
+
+
+    def clearSort(self):
+
+        if self._sorter:
+            self._sorter.cancel()
+            self._sorter = None
+
+        self._sortKeys = []
+        self._sortOrder = None
+        self._sortPositions = None
+        self._table.setSortIndicator(-1, False)
+
+        self._updateRowOrder()
+
+
+    def showFilterBar(self):
+
+        model = self._table.model()
+        columnLabels = [model.headerData(column, Qt.Horizontal) for column in range(model.columnCount())]
+
+        self._filterBar.activate(columnLabels, self._table.currentIndex().column())
+
+
+    def columnFilters(self):
+
+        return dict(self._columnFilters)
+
+
+    def setColumnFilter(self, filter):
+
+        self._columnFilters[filter.column()] = filter
+        self._filterBitmaps.pop(filter.column(), None)
+
+        self._updateRowOrder()
+
+
+    def removeColumnFilter(self, column):
+
+        if column in self._columnFilters:
+            del self._columnFilters[column]
+            self._filterBitmaps.pop(column, None)
+
+            self._updateRowOrder()
+
+
+    def clearFilters(self):
+
+        self._columnFilters.clear()
+        self._filterBitmaps.clear()
+
+        self._updateRowOrder()
+
+
+    def setFilterMatchAll(self, matchAll):
+
+        # Only the bitmaps are combined anew
+        if matchAll != self._filterMatchAll:
+            self._filterMatchAll = matchAll
+            if self._columnFilters:
+                self._updateRowOrder()
+
+
+    def filterMatchAll(self):
+
+        return self._filterMatchAll
+
+
+    def _updateRowOrder(self, threadPool=None):
+
+        if self._filterer:
+            self._filterer.cancel()
+            self._filterer = None
+
+        if not self._columnFilters:
+            self._table.setRowOrder(self._sortOrder, self._sortPositions)
+            self._filterBar.setStatus("")
+            return
+
+        if self._loader:
+            self._filterBar.setStatus(self.tr("Document is still loading"))
+            return
+
+        # Columns without a bitmap are evaluated on a worker thread, the
+        # bitmaps combined and the matching rows taken in sorted order.
+        self._table.setLocked(True)
+
+        self._filterer = DocumentFilterer(DocumentRowFilter(self._table.store(), self._columnFilters, self._filterBitmaps, self._filterMatchAll, self._sortOrder))
+        self._filterer.signals.progressChanged.connect(self._onFiltererProgressChanged)
+        self._filterer.signals.finished.connect(self._onFiltererFinished)
+        (threadPool if threadPool else QThreadPool.globalInstance()).start(self._filterer)
+
+
+    def _onLoaderFinished(self, succeeded, errorMessage):
+
+        reader = self._loader.reader()
+
+        self._loader = None
+        self.updateDocumentTitle()
+
+        if isinstance(reader, DocumentIndexer) and reader.offsetsFileName():
+            self._commitIndex(succeeded)
+
+        self.loadFinished.emit(succeeded, errorMessage)
+
+        if self._recoveryJournalName:
+            journalName, self._recoveryJournalName = self._recoveryJournalName, None
+            self._table.setLocked(False)
+
+            # A journal of a document not read completely is kept for later
+            if succeeded:
+                self._recoverJournal(journalName)
+
+        if succeeded:
+            self._restoreViewState()
+        self._table.applyPendingViewState()
+
+
+    def _applyViewState(self, state):
+
+        # Columns are resized and rows scrolled to as they are read, unless the
+        # rows are to be shown in another order first
+        self._table.setColumnWidths(state.get("columnWidths", []))
+
+        row, column = state.get("scrollPosition", (0, 0))
+        if state.get("sortKeys") or state.get("filters"):
+            self._pendingScrollPosition = (row, column)
+        else:
+            self._table.setScrollPosition(row, column)
+
+
+    def _commitIndex(self, succeeded):
+
+        # Offsets of a document indexed completely are kept for the next time
+        try:
+            if succeeded:
+                store = self._table.store()
+                self._indexCache.commit(self._canonicalName, self._delimiter, self._quoteChar, self._encoding, store.rowCount(), store.columnCount())
+            else:
+                self._indexCache.discard(self._canonicalName, self._delimiter)
+        except OSError:
+            self._indexCache.discard(self._canonicalName, self._delimiter)
+
+
+    def _restoreViewState(self):
+
+        state, self._viewState = self._viewState, None
+        if not state:
+            return
+
+        # Sort keys and filters of columns no longer there are dropped
+        columnCount = self._table.model().columnCount()
+
+        sortKeys = [(column, bool(descending)) for column, descending in state.get("sortKeys", []) if 0 <= column < columnCount]
+
+        for column, condition, text, upperText, caseSensitive in state.get("filters", []):
+            if 0 <= column < columnCount:
+                try:
+                    self._columnFilters[column] = DocumentColumnFilter(column, DocumentColumnFilter.Condition[condition], text, upperText, caseSensitive)
+                except (KeyError, re.error):
+                    pass
+        self._filterMatchAll = bool(state.get("filterMatchAll", True))
+
+        if sortKeys:
+            self._startSorting(sortKeys)
+        elif self._columnFilters:
+            self._updateRowOrder()
+
+        self._restoreScrollPosition()
+
+
+    def _restoreScrollPosition(self):
+
+        # The rows are scrolled to once they are shown in the restored order
+        if self._pendingScrollPosition and not self._sorter and not self._filterer:
+            self._table.setScrollPosition(*self._pendingScrollPosition)
+            self._pendingScrollPosition = None
+
+
+    def _onSorterFinished(self, succeeded, errorMessage):
+
+        # Every sorter has locked the table, canceled ones as well
+        self._table.setLocked(False)
+
+        if self._sorter is None or self.sender() is not self._sorter.signals:
+            return
+
+        sorter = self._sorter.sorter()
+        self._sorter = None
+
+        if succeeded:
+            self._sortKeys = sorter.keys()
+            self._sortOrder = sorter.rowOrder()
+            self._sortPositions = sorter.rowPositions()
+            self._table.setSortIndicator(*self._sortKeys[0])
+
+            self._updateRowOrder()
+
+        self._restoreScrollPosition()
+
+        self.sortFinished.emit(succeeded, errorMessage)
+
+
+    def _onFiltererProgressChanged(self, rowsRead, rowsToRead):
+
+        if self._filterer is None or self.sender() is not self._filterer.signals:
+            return
+
+        percent = rowsRead * 100 // rowsToRead if rowsToRead > 0 else 100
+        self._filterBar.setStatus(self.tr("Filtering … {0} %").format(percent))
+
+
+    def _onFiltererFinished(self, succeeded, errorMessage):
+
+        # Every filterer has locked the table, canceled ones as well
+        self._table.setLocked(False)
+
+        if self._filterer is None or self.sender() is not self._filterer.signals:
+            return
+
+        filter = self._filterer.filter()
+        self._filterer = None
+
+        if succeeded:
+            self._filterBitmaps = filter.bitmaps()
+            self._table.setRowOrder(filter.rowOrder(), filter.rowPositions())
+            self._filterBar.setStatus(self.tr("{0} of {1} rows").format(len(filter.rowOrder()), self._table.store().rowCount()))
+        elif errorMessage:
+            self._filterBar.setStatus(self.tr("Filter failed: {0}").format(errorMessage))
+
+        self._restoreScrollPosition()
+
+        self.filterFinished.emit(succeeded, errorMessage)
+
+
+    def _onFilterBarColumnChanged(self, column):
+
+        self._filterBar.setFilter(self._columnFilters.get(column))
+
+
+    def _onFilterBarApplyRequested(self):
+
+        column = self._filterBar.column()
+        if column < 0:
+            return
+
+        if not self._filterBar.text() and not self._filterBar.upperText():
+            self.removeColumnFilter(column)
+            return
+
+        try:
+            filter = DocumentColumnFilter(column, self._filterBar.condition(), self._filterBar.text(), self._filterBar.upperText(), self._filterBar.isCaseSensitive())
+
+            # Bounds of ranges have to be comparable with the cells of the column
+            if filter.condition() == DocumentColumnFilter.Condition.Range:
+                for text in (filter.text(), filter.upperText()):
+                    if text:
+                        self._table.store().sortKey(column, text)
+
+        except re.error as error:
+            self._filterBar.setStatus(self.tr("Invalid regular expression: {0}").format(error))
+            return
+        except ValueError:
+            self._filterBar.setStatus(self.tr("Bounds do not fit the values of the column"))
+            return
+
+        self.setColumnFilter(filter)
+
+
+    def _onSaverFinished(self, succeeded, errorMessage):
+
+        self._saver = None
+        self._table.setLocked(False)
+
+        if succeeded and not self._saveCopy:
+            canonicalName = QFileInfo(self._saveFileName).canonicalFilePath()
+            if canonicalName != self._canonicalName:
+                # The index is assigned anew for the new name
+                self.setCanonicalName(canonicalName)
+                self.setCanonicalIndex(0)
+
+            self.setDelimiter(self._saveDelimiter)
+            self._table.setModified(False)
+
+            # Edits are recorded anew from the document as saved
+            self._removeJournal()
+            self._startJournal()
+
+        self.saveFinished.emit(succeeded, errorMessage)
+
+        # A document still modified, when saving failed, stays open
+        closeAfterSave, self._closeAfterSave = self._closeAfterSave, False
+        if succeeded and closeAfterSave:
+            self.close()
+
+
+    def showFindBar(self):
+
+        self._findBar.activate()
+
+
+    def findNext(self):
+
+        if not self._findBar.text():
+            self.showFindBar()
+            return
+
+        if self._startSearch():
+            self._findNextPending = True
+            self._findAllPending = False
+            self._selectNextMatch()
+
+
+    def findAll(self):
+
+        if not self._findBar.text():
+            self.showFindBar()
+            return
+
+        if self._startSearch():
+            self._findNextPending = False
+            self._findAllPending = True
+            if self._searchComplete:
+                self._selectAllMatches()
+
+
+    def _startSearch(self):
+
+        # Matches of the same query are reused as long as the cells are unchanged
+        column = self._table.currentIndex().column() if self._findBar.isCurrentColumnOnly() else None
+        query = (self._findBar.text(), self._findBar.mode(), self._findBar.isCaseSensitive(), column)
+        if query == self._searchQuery:
+            return True
+
+        self._cancelSearch()
+
+        if self.isLoading():
+            self._findBar.setStatus(self.tr("Document is still loading"))
+            return False
+
+        if column is not None and column < 0:
+            self._findBar.setStatus(self.tr("No column selected"))
+            return False
+
+        # Indexes hold rows of the store; they remain valid while the rows are reordered
+        if self._table.store() is not self._searchIndexStore:
+            self._searchIndexes = {}
+            self._searchIndexStore = self._table.store()
+
+        text, mode, caseSensitive, column = query
+        indexes = self._searchIndexes if self._preferences.buildSearchIndexes() and column is not None else None
+
+        try:
+            searcher = DocumentSearcher(self._table.store(), text, mode, caseSensitive, indexes, column)
+        except re.error as error:
+            self._findBar.setStatus(self.tr("Invalid regular expression: {0}").format(error))
+            return False
+
+        # Only the index of the column searched is kept; columns found too
+        # large to be indexed are remembered.
+        if indexes is not None:
+            for other in [other for other, index in indexes.items() if index and other != column]:
+                del indexes[other]
+
+        self._searchQuery = query
+        self._searchMatches = []
+        self._searchComplete = False
+
+        # Cells are searched on a worker thread; matches are streamed in by
+        # blocks of rows. Cells cannot be edited until the search has finished.
+        self._table.setLocked(True)
+
+        self._finder = DocumentFinder(searcher)
+        self._finder.signals.matchesFound.connect(self._onFinderMatchesFound)
+        self._finder.signals.progressChanged.connect(self._onFinderProgressChanged)
+        self._finder.signals.finished.connect(self._onFinderFinished)
+        QThreadPool.globalInstance().start(self._finder)
+
+        return True
+
+
+    def _cancelSearch(self):
+
+        if self._finder:
+            self._finder.cancel()
+            self._finder = None
+
+        self._searchQuery = None
+        self._findNextPending = False
+        self._findAllPending = False
+
+
+    def _selectNextMatch(self):
+
+        current = self._table.currentIndex()
+        position = (current.row(), current.column()) if current.isValid() else (-1, -1)
+
+        # Reordered rows are found out of order; the next match is known
+        # only once all rows have been searched
+        if not self._searchComplete and self._table.model().rowOrder() is not None:
+            return
+
+        number = bisect_right(self._searchMatches, position)
+        if number < len(self._searchMatches):
+            self._selectMatch(number)
+        elif self._searchComplete:
+            # Continue from the top of the document
+            if self._searchMatches:
+                self._selectMatch(0)
+            else:
+                self._findBar.setStatus(self.tr("No matches"))
+            self._findNextPending = False
+
+
+    def _selectMatch(self, number):
+
+        row, column = self._searchMatches[number]
+        index = self._table.model().index(row, column)
+
+        self._table.setCurrentIndex(index)
+        self._table.scrollTo(index)
+
+        self._findNextPending = False
+        if self._searchComplete:
+            self._findBar.setStatus(self.tr("Match {0} of {1}").format(number + 1, len(self._searchMatches)))
+
+
+    def _selectAllMatches(self):
+
+        self._findAllPending = False
+
+        if not self._searchMatches:
+            self._findBar.setStatus(self.tr("No matches"))
+            return
+
+        model = self._table.model()
+        selection = QItemSelection()
+        for row, column in self._searchMatches[:self.MaximumSelectedMatches]:
+            index = model.index(row, column)
+            selection.select(index, index)
+
+        self._table.selectionModel().select(selection, self._table.selectionModel().ClearAndSelect)
+        self._table.scrollTo(model.index(*self._searchMatches[0]))
+
+        if len(self._searchMatches) > self.MaximumSelectedMatches:
+            self._findBar.setStatus(self.tr("{0} matches; the first {1} are selected").format(len(self._searchMatches), self.MaximumSelectedMatches))
+        else:
+            self._findBar.setStatus(self.tr("{0} matches").format(len(self._searchMatches)))
+
+
+    def _isCurrentFinder(self):
+
+        # Signals of canceled searches may still be queued
+        return self._finder is not None and self.sender() is self._finder.signals
+
+
+    def _onFinderMatchesFound(self, matches):
+
+        if not self._isCurrentFinder():
+            return
+
+        model = self._table.model()
+        if model.rowOrder() is not None:
+            # Matches are found in the order of the store
+            # Rows filtered out have no position
+            matches = ((model.viewRow(row), column) for row, column in matches)
+            self._searchMatches.extend(match for match in matches if match[0] >= 0)
+            self._searchMatches.sort()
+        else:
+            self._searchMatches.extend(matches)
+
+        if self._findNextPending:
+            self._selectNextMatch()
+
+
+    def _onFinderProgressChanged(self, rowsSearched, rowCount):
+
+        if not self._isCurrentFinder():
+            return
+
+        percent = rowsSearched * 100 // rowCount if rowCount > 0 else 100
+        self._findBar.setStatus(self.tr("Searching … {0} % ({1} matches)").format(percent, len(self._searchMatches)))
+
+
+    def _onFinderFinished(self, succeeded, errorMessage):
+
+        # Every finder has locked the table, canceled ones as well
+        self._table.setLocked(False)
+
+        if not self._isCurrentFinder():
+            return
+
+        self._finder = None
+
+        if not succeeded:
+            self._searchQuery = None
+            self._findNextPending = False
+            self._findAllPending = False
+            if errorMessage:
+                self._findBar.setStatus(self.tr("Search failed: {0}").format(errorMessage))
+            self.searchFinished.emit(False, errorMessage)
+            return
+
+        self._searchComplete = True
+        self._findBar.setStatus(self.tr("{0} matches").format(len(self._searchMatches)))
+
+        if self._findAllPending:
+            self._selectAllMatches()
+        elif self._findNextPending:
+            self._selectNextMatch()
+
+        self.searchFinished.emit(True, "")
+
+
+    def _onTableChanged(self):
+
+        # Matches and search indexes no longer reflect the cells
+        if self._searchQuery is not None or self._searchIndexes:
+            self._cancelSearch()
+            self._searchIndexes = {}
+
+        # Rows stay shown as filtered until the filters are applied again
+        self._filterBitmaps.clear()
+
+
+    def _onTableStructureChanged(self):
+
+        # Sort keys and filters refer to columns and rows which have moved;
+        # rows are shown in their original order again.
+        if self._loader or (not self._sortKeys and not self._columnFilters and not self._sorter):
+            return
+
+        if self._sorter:
+            self._sorter.cancel()
+            self._sorter = None
+
+        self._sortKeys = []
+        self._sortOrder = None
+        self._sortPositions = None
+        self._table.setSortIndicator(-1, False)
+
+        self._columnFilters.clear()
+        self._filterBitmaps.clear()
+
+        self._updateRowOrder()
+
+
+    def _onTableStoreEdited(self, edit):
+
+        if not self._journal:
+            return
+
+        self._journal.append(edit)
+        if not self._journalTimer.isActive():
+            self._journalTimer.start(self._preferences.autosaveInterval() * 1000)
+
+
+    def _onTableReset(self):
+
+        # Rows have been replaced or reordered; indexes are checked against the store
+        if self._searchQuery is not None:
+            self._cancelSearch()
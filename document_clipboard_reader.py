@@ -0,0 +1,94 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import csv
+import io
+from itertools import islice
+
+
+class DocumentClipboardReader:
+
+    def __init__(self, text, delimiter="\t", quoteChar="\""):
+
+        # Texts copied from this application and from spreadsheets are
+        # separated by tabs; other delimiters are given explicitly.
+        self._text = text
+        self._delimiter = delimiter
+        self._quoteChar = quoteChar
+
+        # Rows are parsed in blocks in one pass over the text
+        self._blockSize = 8192
+
+        self._rows = []
+
+
+    def setBlockSize(self, blockSize):
+
+        self._blockSize = blockSize
+
+
+    def blockSize(self):
+
+        return self._blockSize
+
+
+    def delimiter(self):
+
+        return self._delimiter
+
+
+    def rowsRead(self):
+
+        return len(self._rows)
+
+
+    def rowsToRead(self):
+
+        # Estimated by the number of lines; quoted fields may span lines
+        return self._text.count("\n") + 1
+
+
+    def rows(self):
+
+        return self._rows
+
+
+    def readBlocks(self):
+
+        # Yields after each block of rows parsed; raises csv.Error if the text
+        # cannot be parsed
+        self._rows = []
+
+        # A single cell copied as tab-separated text is not quoted
+        cell = self._text[:-1] if self._text.endswith("\n") else self._text
+        if self._delimiter == "\t" and "\t" not in cell and "\n" not in cell:
+            self._rows = [[cell[:-1] if cell.endswith("\r") else cell]]
+            yield 1
+            return
+
+        reader = csv.reader(io.StringIO(self._text, newline=""), delimiter=self._delimiter, quotechar=self._quoteChar)
+
+        while True:
+            rows = list(islice(reader, self._blockSize))
+            if not rows:
+                break
+
+            self._rows.extend(rows)
+            yield len(self._rows)
@@ -0,0 +1,103 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import csv
+import io
+
+
+class DocumentClipboardWriter:
+
+    def __init__(self, store, rows, columns, delimiter="\t", quoteChar="\""):
+
+        # Rows of the store in the order they are shown, and columns
+        self._store = store
+        self._rows = rows
+        self._columns = columns
+        self._delimiter = delimiter
+        self._quoteChar = quoteChar
+
+        # Rows are serialised in blocks into one buffer
+        self._blockSize = 8192
+
+        self._rowsWritten = 0
+        self._text = ""
+
+
+    def setBlockSize(self, blockSize):
+
+        self._blockSize = blockSize
+
+
+    def blockSize(self):
+
+        return self._blockSize
+
+
+    def rowsWritten(self):
+
+        return self._rowsWritten
+
+
+    def rowCount(self):
+
+        return len(self._rows)
+
+
+    def cellCount(self):
+
+        return len(self._rows) * len(self._columns)
+
+
+    def text(self):
+
+        return self._text
+
+
+    def writeBlocks(self):
+
+        # Yields after each block of rows serialised; the text is complete
+        # once all blocks have been written.
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=self._delimiter, quotechar=self._quoteChar, lineterminator="\n")
+
+        self._rowsWritten = 0
+        self._text = ""
+
+        # A single cell is copied as a plain text, without quotes
+        if self.cellCount() == 1:
+            self._text = self._store.value(self._rows[0], self._columns[0])
+            self._rowsWritten = 1
+            yield self._rowsWritten
+            return
+
+        for first in range(0, len(self._rows), self._blockSize):
+            rows = self._rows[first:first + self._blockSize]
+
+            if isinstance(rows, range) and rows.step == 1:
+                # Consecutive rows are read column by column from the store
+                writer.writerows(self._store.rows(rows.start, rows.stop, self._columns))
+            else:
+                writer.writerows([self._store.value(row, column) for column in self._columns] for row in rows)
+
+            self._rowsWritten += len(rows)
+            yield self._rowsWritten
+
+        # The last line is not terminated
+        self._text = buffer.getvalue()[:-1]
@@ -0,0 +1,178 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from array import array
+from itertools import accumulate, repeat
+from operator import add, eq
+
+from document_column_type import DocumentColumnType
+
+
+class DocumentColumn:
+
+    def __init__(self, count=0):
+
+        # Cell texts are stored UTF-8 encoded in one buffer; each cell is
+        # described by the start and the length of its bytes in the buffer.
+        self._buffer = bytearray()
+        self._starts = array("Q", bytes(8 * count))
+        self._lengths = array("I", bytes(4 * count))
+
+        # Number of bytes in the buffer no longer referenced by a cell
+        self._garbage = 0
+
+
+    def __len__(self):
+
+        return len(self._starts)
+
+
+    def type(self):
+
+        return DocumentColumnType.String
+
+
+    def byteSize(self):
+
+        return len(self._buffer) + self._starts.itemsize * len(self._starts) + self._lengths.itemsize * len(self._lengths)
+
+
+    def value(self, index):
+
+        start = self._starts[index]
+        return self._buffer[start:start + self._lengths[index]].decode("utf-8")
+
+
+    def values(self, first=0, last=None):
+
+        buffer = self._buffer
+        starts = self._starts[first:last]
+        lengths = self._lengths[first:last]
+
+        # Slicing and decoding are mapped in C over the whole range
+        slices = map(slice, starts, map(add, starts, lengths))
+
+        return list(map(bytearray.decode, map(buffer.__getitem__, slices)))
+
+
+    def sortKeys(self, first=0, last=None):
+
+        # Texts compare as they are; empty cells have the key None
+        return [text if text else None for text in self.values(first, last)]
+
+
+    def matchText(self, text, first=0, last=None):
+
+        return bytes(map(eq, self.values(first, last), repeat(text)))
+
+
+    def matchValues(self, function, first=0, last=None):
+
+        return function(self.values(first, last))
+
+
+    def sortKey(self, text):
+
+        return text
+
+
+    def setValue(self, index, text):
+
+        data = text.encode("utf-8")
+
+        self._garbage += self._lengths[index]
+        self._starts[index] = len(self._buffer)
+        self._lengths[index] = len(data)
+        self._buffer += data
+
+        if self._garbage > len(self._buffer) // 2:
+            self._compact()
+
+        return True
+
+
+    def setValues(self, index, texts):
+
+        data = [text.encode("utf-8") for text in texts]
+        lengths = array("I", map(len, data))
+
+        starts = array("Q", accumulate(lengths, initial=len(self._buffer)))
+        starts.pop()
+
+        self._garbage += sum(self._lengths[index:index + len(data)])
+        self._buffer += b"".join(data)
+        self._starts[index:index + len(data)] = starts
+        self._lengths[index:index + len(data)] = lengths
+
+        if self._garbage > len(self._buffer) // 2:
+            self._compact()
+
+        return True
+
+
+    def appendValues(self, values):
+
+        self._appendData([text.encode("utf-8") for text in values])
+
+        return True
+
+
+    def _appendData(self, data):
+
+        lengths = array("I", map(len, data))
+
+        starts = array("Q", accumulate(lengths, initial=len(self._buffer)))
+        starts.pop()
+
+        self._buffer += b"".join(data)
+        self._starts += starts
+        self._lengths += lengths
+
+
+    def insertValues(self, index, count):
+
+        self._starts[index:index] = array("Q", bytes(8 * count))
+        self._lengths[index:index] = array("I", bytes(4 * count))
+
+        return True
+
+
+    def removeValues(self, index, count):
+
+        self._garbage += sum(self._lengths[index:index + count])
+
+        del self._starts[index:index + count]
+        del self._lengths[index:index + count]
+
+        if self._garbage > len(self._buffer) // 2:
+            self._compact()
+
+
+    def _compact(self):
+
+        buffer = self._buffer
+        data = [buffer[start:start + length] for start, length in zip(self._starts, self._lengths)]
+
+        self._buffer = bytearray()
+        self._starts = array("Q")
+        self._lengths = array("I")
+        self._garbage = 0
+
+        self._appendData(data)
@@ -0,0 +1,123 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import re
+from enum import Enum
+from itertools import repeat
+from operator import and_, contains, eq, ge, is_not, le
+
+
+class DocumentColumnFilter:
+
+    class Condition(Enum):
+        Equal = 0
+        Range = 1
+        Contains = 2
+        RegularExpression = 3
+
+
+    def __init__(self, column, condition, text, upperText="", caseSensitive=False):
+
+        self._column = column
+        self._condition = condition
+        self._text = text
+        self._upperText = upperText
+        self._caseSensitive = caseSensitive
+
+        # Raises re.error if the regular expression is not valid
+        self._pattern = re.compile(text, 0 if caseSensitive else re.IGNORECASE) if condition == self.Condition.RegularExpression else None
+
+
+    def column(self):
+
+        return self._column
+
+
+    def condition(self):
+
+        return self._condition
+
+
+    def text(self):
+
+        return self._text
+
+
+    def upperText(self):
+
+        return self._upperText
+
+
+    def isCaseSensitive(self):
+
+        return self._caseSensitive
+
+
+    def matchBlock(self, store, first, last):
+
+        # Returns one byte per row, 1 for the rows which match; raises
+        # ValueError if a bound of a range does not fit the column
+        if self._condition == self.Condition.Range:
+            return bytes(self._matchRange(store, first, last))
+
+        if self._condition == self.Condition.Equal and (self._caseSensitive or self._text == self._text.casefold() == self._text.upper()):
+            # Texts without cased letters are compared with the typed values
+            return store.matchText(self._column, self._text, first, last)
+
+        return store.matchValues(self._column, self._matchValues, first, last)
+
+
+    def _matchValues(self, values):
+
+        if self._condition == self.Condition.RegularExpression:
+            return bytes(map(is_not, map(self._pattern.search, values), repeat(None)))
+
+        if self._caseSensitive:
+            text = self._text
+        else:
+            text = self._text.casefold()
+            values = map(str.casefold, values)
+
+        if self._condition == self.Condition.Equal:
+            return bytes(map(eq, values, repeat(text)))
+        else:
+            return bytes(map(contains, values, repeat(text)))
+
+
+    def _matchRange(self, store, first, last):
+
+        # Bounds compare like the typed values of the column; an empty bound
+        # leaves the range open at its side.
+        keys = store.sortKeys([self._column], first, last)[0]
+        lower = store.sortKey(self._column, self._text) if self._text else None
+        upper = store.sortKey(self._column, self._upperText) if self._upperText else None
+
+        if None in keys:
+            # Empty cells never match
+            return [key is not None and (lower is None or lower <= key) and (upper is None or key <= upper) for key in keys]
+
+        if lower is not None and upper is not None:
+            return map(and_, map(le, repeat(lower), keys), map(ge, repeat(upper), keys))
+        elif lower is not None:
+            return map(le, repeat(lower), keys)
+        elif upper is not None:
+            return map(ge, repeat(upper), keys)
+        else:
+            return repeat(True, len(keys))
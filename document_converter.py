@@ -0,0 +1,265 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from document_reader import DocumentReader
+from document_sniffer import DocumentSniffer
+from document_table_header_labels import DocumentTableHeaderLabels
+from document_writer import DocumentWriter
+
+
+class DocumentConverter:
+
+    # Names of delimiters given on the command line
+    Delimiters = {"comma": ",", "semicolon": ";", "tab": "\t", "colon": ":", "pipe": "|", "space": " "}
+
+    def __init__(self, inputName, outputName):
+
+        self._inputName = inputName
+        self._outputName = outputName
+
+        # The dialect of the input is sniffed unless given; the output keeps
+        # what is not given.
+        self._inputDelimiter = None
+        self._inputQuoteChar = None
+        self._inputEncoding = None
+        self._delimiter = None
+        self._quoteChar = None
+        self._encoding = None
+
+        # Rows and columns are numbered from 0; the last of a range is not
+        # included, None is the end of the document or the row.
+        self._rows = (0, None)
+        self._columns = None
+
+        # Header row with labels of the output columns written first; it
+        # replaces the header row of the input, detected unless given.
+        self._headerLabel = None
+        self._inputHeader = None
+
+        self._rowsRead = 0
+        self._rowsWritten = 0
+        self._bytesRead = 0
+        self._bytesWritten = 0
+
+
+    @staticmethod
+    def delimiterOf(text):
+
+        # A name or the delimiter itself; None if neither
+        if text.lower() in DocumentConverter.Delimiters:
+            return DocumentConverter.Delimiters[text.lower()]
+        elif text == "\\t":
+            return "\t"
+
+        return text if len(text) == 1 else None
+
+
+    @staticmethod
+    def rangesOf(text):
+
+        # Comma-separated ranges of numbers counted from 1 such as "1,3,5-8,10-",
+        # returned as ranges counted from 0; raises ValueError.
+        ranges = []
+        for part in text.split(","):
+            first, separator, last = part.strip().partition("-")
+
+            first = int(first) if first else 1
+            last = (int(last) if last else None) if separator else first
+            if first < 1 or (last is not None and last < first):
+                raise ValueError(part)
+
+            ranges.append((first - 1, last))
+
+        return ranges
+
+
+    def setInputDialect(self, delimiter=None, quoteChar=None, encoding=None):
+
+        self._inputDelimiter = delimiter
+        self._inputQuoteChar = quoteChar
+        self._inputEncoding = encoding
+
+
+    def setDialect(self, delimiter=None, quoteChar=None, encoding=None):
+
+        self._delimiter = delimiter
+        self._quoteChar = quoteChar
+        self._encoding = encoding
+
+
+    def setRows(self, first, last=None):
+
+        self._rows = (first, last)
+
+
+    def setColumns(self, ranges):
+
+        self._columns = list(ranges) if ranges else None
+
+
+    def setHeaderLabel(self, type, parameter=None):
+
+        self._headerLabel = (type, parameter if parameter is not None else DocumentTableHeaderLabels.defaultParameter(type)) if type is not None else None
+
+
+    def setInputHeader(self, hasHeader):
+
+        self._inputHeader = hasHeader
+
+
+    def rowsRead(self):
+
+        return self._rowsRead
+
+
+    def rowsWritten(self):
+
+        return self._rowsWritten
+
+
+    def bytesRead(self):
+
+        return self._bytesRead
+
+
+    def bytesWritten(self):
+
+        return self._bytesWritten
+
+
+    def convertBlocks(self):
+
+        # Yields after each block of rows written. Rows are streamed from the
+        # input to the output block by block, whatever the size of the document;
+        # reading stops after the last row asked for.
+        sniffer = DocumentSniffer(self._inputName)
+        sniffHeader = self._headerLabel is not None and self._inputHeader is None
+        if (sniffHeader or None in (self._inputDelimiter, self._inputQuoteChar, self._inputEncoding)) and not sniffer.sniff():
+            raise OSError(f"Cannot read {self._inputName}")
+
+        inputDelimiter = self._inputDelimiter if self._inputDelimiter is not None else sniffer.delimiter()
+        inputQuoteChar = self._inputQuoteChar if self._inputQuoteChar is not None else sniffer.quoteChar()
+        inputEncoding = self._inputEncoding if self._inputEncoding is not None else sniffer.encoding()
+
+        # A byte order mark is read once; it is written again only if asked for
+        encoding = self._encoding if self._encoding is not None else inputEncoding.replace("utf-8-sig", "utf-8")
+
+        reader = DocumentReader(self._inputName, inputDelimiter, inputQuoteChar, inputEncoding)
+        writer = DocumentWriter(self._outputName, None,
+            self._delimiter if self._delimiter is not None else inputDelimiter,
+            self._quoteChar if self._quoteChar is not None else inputQuoteChar,
+            encoding)
+
+        self._rowsRead = 0
+        self._rowsWritten = 0
+
+        readBlocks = reader.readBlocks()
+        try:
+            inputHeader = sniffer.hasHeader() if sniffHeader else bool(self._inputHeader)
+            blocks = writer.writeRowBlocks(self._convertRows(readBlocks, inputHeader))
+            for rowsWritten in blocks:
+                self._rowsWritten = rowsWritten
+                self._bytesRead = reader.bytesRead()
+                self._bytesWritten = writer.bytesWritten()
+                yield rowsWritten
+
+        finally:
+            readBlocks.close()
+
+
+    def _convertRows(self, readBlocks, inputHeader=False):
+
+        first, last = self._rows
+        columns = self._columnSelector()
+        header = self._headerLabel is not None
+        headerCount = None
+
+        for block in readBlocks:
+            start = self._rowsRead
+            self._rowsRead += len(block)
+
+            # Rows of the block within the rows asked for
+            if self._rowsRead <= first:
+                continue
+            block = block[max(first - start, 0):last - start if last is not None else None]
+
+            if columns is not None:
+                block = list(map(columns, block))
+            if header and inputHeader and start == 0 and first == 0 and block:
+                # The header row of the input is replaced by the labels
+                headerCount = len(block.pop(0))
+            if block:
+                # Output columns are labeled by their position; their number is
+                # that of the first row.
+                if header:
+                    block.insert(0, self._headerRow(headerCount if headerCount is not None else len(block[0])))
+                    header = False
+                yield block
+
+            if last is not None and self._rowsRead >= last:
+                break
+
+        # The input is closed before the output replaces any file
+        readBlocks.close()
+
+        if header:
+            yield [self._headerRow(headerCount if headerCount is not None else self._columnCount())]
+
+
+    def _columnSelector(self):
+
+        if self._columns is None:
+            return None
+
+        # Ranges with an end are taken by position; open ranges run to the end
+        # of each row. Missing values are empty.
+        ranges = self._columns
+        if all(last is not None for _, last in ranges):
+            positions = [column for first, last in ranges for column in range(first, last)]
+
+            def select(row):
+                count = len(row)
+                return [row[column] if column < count else "" for column in positions]
+
+        else:
+            def select(row):
+                count = len(row)
+                values = []
+                for first, last in ranges:
+                    values.extend(row[column] if column < count else "" for column in range(first, last if last is not None else max(count, first + 1)))
+                return values
+
+        return select
+
+
+    def _columnCount(self):
+
+        # Number of output columns without any row to count them in
+        if self._columns is None:
+            return 0
+
+        return sum((last if last is not None else first + 1) - first for first, last in self._columns)
+
+
+    def _headerRow(self, count):
+
+        type, parameter = self._headerLabel
+
+        return list(DocumentTableHeaderLabels.itemTexts(type, parameter, 0, count))
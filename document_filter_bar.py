@@ -0,0 +1,186 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from PySide2.QtCore import Qt, Signal
+from PySide2.QtGui import QIcon
+from PySide2.QtWidgets import QCheckBox, QComboBox, QHBoxLayout, QLabel, QLineEdit, QPushButton, QToolButton, QWidget
+
+from document_column_filter import DocumentColumnFilter
+
+
+class DocumentFilterBar(QWidget):
+
+    columnChanged = Signal(int)
+    applyRequested = Signal()
+    removeRequested = Signal()
+    clearRequested = Signal()
+    matchAllChanged = Signal(bool)
+
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._cmbColumn = QComboBox()
+        self._cmbColumn.setToolTip(self.tr("Column to filter"))
+        self._cmbColumn.currentIndexChanged.connect(self.columnChanged)
+
+        self._cmbCondition = QComboBox()
+        self._cmbCondition.addItem(self.tr("Equals"), DocumentColumnFilter.Condition.Equal)
+        self._cmbCondition.addItem(self.tr("Between"), DocumentColumnFilter.Condition.Range)
+        self._cmbCondition.addItem(self.tr("Contains"), DocumentColumnFilter.Condition.Contains)
+        self._cmbCondition.addItem(self.tr("Regular Expression"), DocumentColumnFilter.Condition.RegularExpression)
+        self._cmbCondition.setToolTip(self.tr("How the cells of the column are matched"))
+        self._cmbCondition.currentIndexChanged.connect(self._onConditionChanged)
+
+        self._ledText = QLineEdit()
+        self._ledText.setClearButtonEnabled(True)
+        self._ledText.returnPressed.connect(self.applyRequested)
+
+        self._ledUpperText = QLineEdit()
+        self._ledUpperText.setPlaceholderText(self.tr("To"))
+        self._ledUpperText.setClearButtonEnabled(True)
+        self._ledUpperText.returnPressed.connect(self.applyRequested)
+
+        self._chkCaseSensitive = QCheckBox(self.tr("Match case"))
+
+        apply = QPushButton(self.tr("Apply"))
+        apply.setToolTip(self.tr("Filter the rows by the column"))
+        apply.clicked.connect(self.applyRequested)
+
+        remove = QPushButton(self.tr("Remove"))
+        remove.setToolTip(self.tr("Remove the filter of the column"))
+        remove.clicked.connect(self.removeRequested)
+
+        self._cmbMatchAll = QComboBox()
+        self._cmbMatchAll.addItem(self.tr("All Filters"), True)
+        self._cmbMatchAll.addItem(self.tr("Any Filter"), False)
+        self._cmbMatchAll.setToolTip(self.tr("Which filters the rows shown have to match"))
+        self._cmbMatchAll.currentIndexChanged.connect(lambda: self.matchAllChanged.emit(self.isMatchAll()))
+
+        clear = QPushButton(self.tr("Clear All"))
+        clear.setToolTip(self.tr("Remove all filters and show all rows"))
+        clear.clicked.connect(self.clearRequested)
+
+        self._lblStatus = QLabel()
+
+        close = QToolButton()
+        close.setIcon(QIcon.fromTheme("window-close", QIcon(":/icons/actions/16/document-close.svg")))
+        close.setAutoRaise(True)
+        close.setToolTip(self.tr("Close the filter bar; the filters remain applied"))
+        close.clicked.connect(self.hide)
+
+        # Main layout
+        self._layout = QHBoxLayout(self)
+        self._layout.addWidget(self._cmbColumn)
+        self._layout.addWidget(self._cmbCondition)
+        self._layout.addWidget(self._ledText, 1)
+        self._layout.addWidget(self._ledUpperText, 1)
+        self._layout.addWidget(self._chkCaseSensitive)
+        self._layout.addWidget(apply)
+        self._layout.addWidget(remove)
+        self._layout.addWidget(self._cmbMatchAll)
+        self._layout.addWidget(clear)
+        self._layout.addWidget(self._lblStatus)
+        self._layout.addWidget(close)
+
+        self._onConditionChanged()
+
+
+    def keyPressEvent(self, event):
+
+        if event.key() == Qt.Key_Escape:
+            self.hide()
+        else:
+            super().keyPressEvent(event)
+
+
+    def activate(self, columnLabels, column):
+
+        # Labels of the columns may have changed since the bar was shown last
+        self._cmbColumn.blockSignals(True)
+        self._cmbColumn.clear()
+        self._cmbColumn.addItems(columnLabels)
+        self._cmbColumn.blockSignals(False)
+
+        self._cmbColumn.setCurrentIndex(max(column, 0))
+        self.columnChanged.emit(self.column())
+
+        self.show()
+        self._ledText.setFocus()
+        self._ledText.selectAll()
+
+
+    def column(self):
+
+        return self._cmbColumn.currentIndex()
+
+
+    def condition(self):
+
+        return self._cmbCondition.currentData()
+
+
+    def text(self):
+
+        return self._ledText.text()
+
+
+    def upperText(self):
+
+        return self._ledUpperText.text() if self.condition() == DocumentColumnFilter.Condition.Range else ""
+
+
+    def isCaseSensitive(self):
+
+        return self._chkCaseSensitive.isChecked()
+
+
+    def isMatchAll(self):
+
+        return self._cmbMatchAll.currentData()
+
+
+    def setFilter(self, filter):
+
+        # Shows the filter of the current column, if any
+        if filter:
+            for index in range(self._cmbCondition.count()):
+                if self._cmbCondition.itemData(index) == filter.condition():
+                    self._cmbCondition.setCurrentIndex(index)
+            self._ledText.setText(filter.text())
+            self._ledUpperText.setText(filter.upperText())
+            self._chkCaseSensitive.setChecked(filter.isCaseSensitive())
+        else:
+            self._ledText.clear()
+            self._ledUpperText.clear()
+
+
+    def setStatus(self, text):
+
+        self._lblStatus.setText(text)
+
+
+    def _onConditionChanged(self):
+
+        range = self.condition() == DocumentColumnFilter.Condition.Range
+
+        self._ledText.setPlaceholderText(self.tr("From") if range else self.tr("Text"))
+        self._ledUpperText.setVisible(range)
+        self._chkCaseSensitive.setEnabled(not range)
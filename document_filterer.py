@@ -0,0 +1,70 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from PySide2.QtCore import QObject, QRunnable, Signal
+
+
+class DocumentFiltererSignals(QObject):
+
+    progressChanged = Signal("qint64", "qint64")
+    finished = Signal(bool, str)
+
+
+class DocumentFilterer(QRunnable):
+
+    def __init__(self, filter):
+        super().__init__()
+
+        self.signals = DocumentFiltererSignals()
+
+        self._filter = filter
+        self._canceled = False
+
+
+    def filter(self):
+
+        return self._filter
+
+
+    def cancel(self):
+
+        self._canceled = True
+
+
+    def isCanceled(self):
+
+        return self._canceled
+
+
+    def run(self):
+
+        try:
+            blocks = self._filter.filterBlocks()
+            for rowsRead in blocks:
+                if self._canceled:
+                    break
+
+                self.signals.progressChanged.emit(rowsRead, self._filter.rowsToRead())
+
+        except (TypeError, ValueError) as error:
+            self.signals.finished.emit(False, str(error))
+            return
+
+        self.signals.finished.emit(not self._canceled, "")
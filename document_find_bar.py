@@ -0,0 +1,126 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from PySide2.QtCore import Qt, Signal
+from PySide2.QtGui import QIcon
+from PySide2.QtWidgets import QCheckBox, QComboBox, QHBoxLayout, QLabel, QLineEdit, QPushButton, QToolButton, QWidget
+
+from document_searcher import DocumentSearcher
+
+
+class DocumentFindBar(QWidget):
+
+    findNextRequested = Signal()
+    findAllRequested = Signal()
+    queryChanged = Signal()
+
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._ledText = QLineEdit()
+        self._ledText.setPlaceholderText(self.tr("Find"))
+        self._ledText.setClearButtonEnabled(True)
+        self._ledText.textChanged.connect(self.queryChanged)
+        self._ledText.returnPressed.connect(self.findNextRequested)
+
+        self._cmbMode = QComboBox()
+        self._cmbMode.addItem(self.tr("Substring"), DocumentSearcher.Mode.Substring)
+        self._cmbMode.addItem(self.tr("Whole Cell"), DocumentSearcher.Mode.WholeCell)
+        self._cmbMode.addItem(self.tr("Regular Expression"), DocumentSearcher.Mode.RegularExpression)
+        self._cmbMode.setToolTip(self.tr("How the text is matched against the cells"))
+        self._cmbMode.currentIndexChanged.connect(self.queryChanged)
+
+        self._chkCaseSensitive = QCheckBox(self.tr("Match case"))
+        self._chkCaseSensitive.stateChanged.connect(self.queryChanged)
+
+        self._chkCurrentColumnOnly = QCheckBox(self.tr("Current column only"))
+        self._chkCurrentColumnOnly.setToolTip(self.tr("Only the column of the current cell is searched"))
+        self._chkCurrentColumnOnly.stateChanged.connect(self.queryChanged)
+
+        findNext = QPushButton(self.tr("Find Next"))
+        findNext.clicked.connect(self.findNextRequested)
+
+        findAll = QPushButton(self.tr("Find All"))
+        findAll.clicked.connect(self.findAllRequested)
+
+        self._lblStatus = QLabel()
+
+        close = QToolButton()
+        close.setIcon(QIcon.fromTheme("window-close", QIcon(":/icons/actions/16/document-close.svg")))
+        close.setAutoRaise(True)
+        close.setToolTip(self.tr("Close the find bar"))
+        close.clicked.connect(self.hide)
+
+        # Main layout
+        self._layout = QHBoxLayout(self)
+        self._layout.addWidget(self._ledText, 1)
+        self._layout.addWidget(self._cmbMode)
+        self._layout.addWidget(self._chkCaseSensitive)
+        self._layout.addWidget(self._chkCurrentColumnOnly)
+        self._layout.addWidget(findNext)
+        self._layout.addWidget(findAll)
+        self._layout.addWidget(self._lblStatus)
+        self._layout.addWidget(close)
+
+
+    def keyPressEvent(self, event):
+
+        if event.key() == Qt.Key_Escape:
+            self.hide()
+        else:
+            super().keyPressEvent(event)
+
+
+    def activate(self):
+
+        self.show()
+        self._ledText.setFocus()
+        self._ledText.selectAll()
+
+
+    def text(self):
+
+        return self._ledText.text()
+
+
+    def mode(self):
+
+        return self._cmbMode.currentData()
+
+
+    def isCaseSensitive(self):
+
+        return self._chkCaseSensitive.isChecked()
+
+
+    def setCurrentColumnOnly(self, checked):
+
+        self._chkCurrentColumnOnly.setChecked(checked)
+
+
+    def isCurrentColumnOnly(self):
+
+        return self._chkCurrentColumnOnly.isChecked()
+
+
+    def setStatus(self, text):
+
+        self._lblStatus.setText(text)
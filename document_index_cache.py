@@ -0,0 +1,181 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import hashlib
+import json
+import os
+import time
+
+
+class DocumentIndexCache:
+
+    # Row offsets of a document are kept in a file of their own, described by
+    # a metadata file written last; a document has an index per delimiter, as
+    # the number of columns depends on it.
+    Version = 2
+
+    # The head and the tail of a document are compared, besides its size and
+    # modification time
+    SampleSize = 64 * 1024
+
+    # Offsets files not committed within this time are left over
+    TemporaryLifetime = 24 * 60 * 60
+
+    def __init__(self, directory, diskBudget):
+
+        self._directory = directory
+        self._diskBudget = diskBudget
+
+
+    def directory(self):
+
+        return self._directory
+
+
+    def diskBudget(self):
+
+        return self._diskBudget
+
+
+    def temporaryFileName(self, canonicalName, delimiter):
+
+        # Offsets are written here while the document is indexed
+        return self._baseName(canonicalName, delimiter) + ".offsets.tmp"
+
+
+    def prepare(self):
+
+        os.makedirs(self._directory, exist_ok=True)
+
+
+    def find(self, canonicalName, delimiter, quoteChar, encoding):
+
+        # Returns the metadata and the offsets file of a valid index, or None
+        baseName = self._baseName(canonicalName, delimiter)
+        offsetsName = baseName + ".offsets"
+
+        try:
+            with open(baseName + ".json", "r", encoding="utf-8") as file:
+                metadata = json.load(file)
+
+            valid = (isinstance(metadata, dict) and metadata.get("version") == self.Version and metadata.get("document") == canonicalName
+                     and metadata.get("delimiter") == delimiter and metadata.get("quoteChar") == quoteChar and metadata.get("encoding") == encoding
+                     and metadata.get("fingerprint") == self._fingerprint(canonicalName)
+                     and os.path.getsize(offsetsName) == 8 * metadata.get("rowCount", -1))
+        except (OSError, ValueError):
+            valid = False
+
+        if not valid:
+            self._remove(baseName)
+            return None
+
+        # Indexes used recently are evicted last
+        os.utime(baseName + ".json")
+
+        return metadata, offsetsName
+
+
+    def commit(self, canonicalName, delimiter, quoteChar, encoding, rowCount, columnCount):
+
+        # The offsets written while indexing become the index of the document
+        baseName = self._baseName(canonicalName, delimiter)
+
+        metadata = {"version": self.Version, "document": canonicalName, "fingerprint": self._fingerprint(canonicalName),
+                    "delimiter": delimiter, "quoteChar": quoteChar, "encoding": encoding, "rowCount": rowCount, "columnCount": columnCount}
+
+        os.replace(baseName + ".offsets.tmp", baseName + ".offsets")
+        with open(baseName + ".json", "w", encoding="utf-8") as file:
+            json.dump(metadata, file, ensure_ascii=False)
+
+        self.evict()
+
+
+    def discard(self, canonicalName, delimiter):
+
+        try:
+            os.remove(self.temporaryFileName(canonicalName, delimiter))
+        except OSError:
+            pass
+
+
+    def evict(self):
+
+        # Indexes used least recently are removed while the cache takes more
+        # disk space than the budget
+        try:
+            entries = list(os.scandir(self._directory))
+        except OSError:
+            return
+
+        now = time.time()
+        sizes = {}
+        usages = {}
+        for entry in entries:
+            name, _, suffix = entry.name.partition(".")
+            baseName = os.path.join(self._directory, name)
+            try:
+                status = entry.stat()
+            except OSError:
+                continue
+
+            if suffix == "offsets.tmp" and now - status.st_mtime > self.TemporaryLifetime:
+                self._remove(baseName)
+                continue
+
+            sizes[baseName] = sizes.get(baseName, 0) + status.st_size
+            if suffix == "json":
+                usages[baseName] = status.st_mtime
+
+        diskSize = sum(sizes.values())
+        for baseName in sorted(usages, key=usages.get):
+            if diskSize <= self._diskBudget:
+                break
+            self._remove(baseName)
+            diskSize -= sizes[baseName]
+
+
+    def _baseName(self, canonicalName, delimiter):
+
+        key = "{0}\0{1}".format(canonicalName, delimiter)
+
+        return os.path.join(self._directory, hashlib.sha1(key.encode("utf-8")).hexdigest())
+
+
+    def _remove(self, baseName):
+
+        for suffix in (".json", ".offsets", ".offsets.tmp"):
+            try:
+                os.remove(baseName + suffix)
+            except OSError:
+                pass
+
+
+    @classmethod
+    def _fingerprint(cls, canonicalName):
+
+        with open(canonicalName, "rb") as file:
+            status = os.fstat(file.fileno())
+
+            digest = hashlib.sha1(file.read(cls.SampleSize))
+            if status.st_size > cls.SampleSize:
+                file.seek(max(cls.SampleSize, status.st_size - cls.SampleSize))
+                digest.update(file.read(cls.SampleSize))
+
+        return [status.st_size, status.st_mtime_ns, digest.hexdigest()]
@@ -0,0 +1,83 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+from array import array
+
+
+class DocumentIndexReader:
+
+    def __init__(self, fileName):
+
+        self._fileName = fileName
+
+        # The first block is kept small to show the first rows at once
+        self._firstBlockSize = 4096
+        self._blockSize = 1024 * 1024
+
+        self._bytesRead = 0
+        self._bytesTotal = 0
+
+
+    def fileName(self):
+
+        return self._fileName
+
+
+    def setBlockSize(self, blockSize, firstBlockSize=None):
+
+        self._blockSize = blockSize
+        self._firstBlockSize = firstBlockSize if firstBlockSize else blockSize
+
+
+    def bytesRead(self):
+
+        return self._bytesRead
+
+
+    def bytesTotal(self):
+
+        return self._bytesTotal
+
+
+    def readBlocks(self):
+
+        # Yields the end offsets of the rows as written by the indexer, one
+        # array per block read
+        with open(self._fileName, "rb") as file:
+
+            self._bytesTotal = os.fstat(file.fileno()).st_size
+            self._bytesRead = 0
+
+            blockSize = self._firstBlockSize
+
+            while True:
+                offsets = array("Q")
+                try:
+                    offsets.fromfile(file, blockSize)
+                except EOFError:
+                    pass
+                blockSize = self._blockSize
+
+                if not offsets:
+                    break
+
+                self._bytesRead += offsets.itemsize * len(offsets)
+                yield offsets
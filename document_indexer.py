@@ -0,0 +1,148 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+from array import array
+from itertools import accumulate, count
+from operator import add
+
+
+class DocumentIndexer:
+
+    def __init__(self, fileName, quoteChar="\"", encoding="utf-8"):
+
+        self._fileName = fileName
+        # Byte order marks are not part of the quote character
+        self._quote = quoteChar.encode("utf-8" if encoding == "utf-8-sig" else encoding)
+
+        # The first chunk is kept small to show the first rows early
+        self._firstChunkSize = 64 * 1024
+        self._chunkSize = 4 * 1024 * 1024
+
+        self._bytesRead = 0
+        self._bytesTotal = 0
+
+        # Offsets are also written to this file as they are found
+        self._offsetsFileName = None
+
+
+    def fileName(self):
+
+        return self._fileName
+
+
+    def setOffsetsFileName(self, fileName):
+
+        self._offsetsFileName = fileName
+
+
+    def offsetsFileName(self):
+
+        return self._offsetsFileName
+
+
+    def setChunkSize(self, chunkSize, firstChunkSize=None):
+
+        self._chunkSize = chunkSize
+        self._firstChunkSize = firstChunkSize if firstChunkSize else chunkSize
+
+
+    def bytesRead(self):
+
+        return self._bytesRead
+
+
+    def bytesTotal(self):
+
+        return self._bytesTotal
+
+
+    def readBlocks(self):
+
+        if not self._offsetsFileName:
+            yield from self._readBlocks()
+            return
+
+        with open(self._offsetsFileName, "wb") as offsetsFile:
+            for ends in self._readBlocks():
+                ends.tofile(offsetsFile)
+                yield ends
+
+
+    def _readBlocks(self):
+
+        # Yields the end offsets of the rows, one array per chunk read. The end
+        # of a row is the start of the next one; line breaks within quoted
+        # fields do not end a row.
+        with open(self._fileName, "rb") as file:
+
+            self._bytesTotal = os.fstat(file.fileno()).st_size
+            self._bytesRead = 0
+
+            chunkSize = self._firstChunkSize
+            newline = None
+            inQuotes = False
+            pending = b""
+            lastEnd = 0
+
+            while True:
+                data = file.read(chunkSize)
+                chunkSize = self._chunkSize
+
+                self._bytesRead += len(data)
+
+                if newline is None and data:
+                    # Line feeds end the lines, unless there are carriage returns only
+                    newline = b"\r" if b"\n" not in data and b"\r" in data else b"\n"
+
+                if not data:
+                    # The rest of the document forms the last row
+                    if lastEnd < self._bytesRead:
+                        yield array("Q", [self._bytesRead])
+                    break
+
+                data = pending + data
+                start = self._bytesRead - len(data)
+
+                last = data.rfind(newline)
+                if last < 0:
+                    pending = data
+                    continue
+
+                pending = data[last + 1:]
+                lines = data[:last + 1].split(newline)
+                lines.pop()
+
+                if not inQuotes and self._quote not in data[:last + 1]:
+                    # Every line break ends a row
+                    ends = array("Q", map(add, accumulate(map(len, lines)), count(start + 1)))
+                else:
+                    ends = array("Q")
+                    end = start
+                    for line in lines:
+                        end += len(line) + 1
+                        if line.count(self._quote) % 2:
+                            inQuotes = not inQuotes
+                        if not inQuotes:
+                            ends.append(end)
+
+                if ends:
+                    lastEnd = ends[-1]
+                    yield ends
@@ -0,0 +1,175 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+
+
+class DocumentJournal:
+
+    # The journal is a line of JSON describing the document, followed by one
+    # line of JSON per edit of the store
+    Format = "tabulator-journal"
+    Version = 1
+
+    def __init__(self, fileName, header=None):
+
+        self._fileName = fileName
+
+        # A journal with a header is started anew with its first edits;
+        # otherwise the edits are appended to the existing journal.
+        self._header = header
+
+        # Edits are kept until the journal is flushed
+        self._edits = []
+
+
+    @staticmethod
+    def journalName(canonicalName):
+
+        directory, fileName = os.path.split(canonicalName)
+
+        return os.path.join(directory, ".{0}.journal".format(fileName))
+
+
+    @staticmethod
+    def documentHeader(canonicalName, delimiter, quoteChar, encoding):
+
+        # Edits apply only as long as the document is unchanged
+        status = os.stat(canonicalName)
+
+        return {"format": DocumentJournal.Format, "version": DocumentJournal.Version, "document": canonicalName,
+                "size": status.st_size, "modified": status.st_mtime_ns, "delimiter": delimiter, "quoteChar": quoteChar, "encoding": encoding}
+
+
+    @staticmethod
+    def readHeader(fileName):
+
+        with open(fileName, "r", encoding="utf-8") as file:
+            header = json.loads(file.readline())
+
+        if not isinstance(header, dict) or header.get("format") != DocumentJournal.Format or header.get("version") != DocumentJournal.Version:
+            raise ValueError("Not a journal of this version")
+
+        return header
+
+
+    @staticmethod
+    def matchesDocument(header, canonicalName):
+
+        try:
+            status = os.stat(canonicalName)
+        except OSError:
+            return False
+
+        return header.get("size") == status.st_size and header.get("modified") == status.st_mtime_ns
+
+
+    @staticmethod
+    def readEdits(fileName):
+
+        # Edits are read up to the first incomplete line; it was being written
+        # when the application stopped.
+        with open(fileName, "r", encoding="utf-8") as file:
+            file.readline()
+
+            for line in file:
+                if not line.endswith("\n"):
+                    break
+
+                try:
+                    edit = json.loads(line)
+                except ValueError:
+                    break
+
+                yield DocumentJournal._decodeEdit(edit)
+
+
+    def fileName(self):
+
+        return self._fileName
+
+
+    def isStarted(self):
+
+        return self._header is None
+
+
+    def append(self, edit):
+
+        self._edits.append(edit)
+
+
+    def pendingCount(self):
+
+        return len(self._edits)
+
+
+    def flush(self):
+
+        # Only the edits since the last flush are written; a new journal
+        # replaces an outdated one.
+        if not self._edits:
+            return
+
+        lines = [json.dumps(self._header, ensure_ascii=False)] if self._header is not None else []
+        lines.extend(json.dumps(self._encodeEdit(edit), ensure_ascii=False, separators=(",", ":")) for edit in self._edits)
+
+        with open(self._fileName, "w" if self._header is not None else "a", encoding="utf-8", newline="\n") as file:
+            file.write("\n".join(lines) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        self._header = None
+        self._edits.clear()
+
+
+    def remove(self):
+
+        self._edits.clear()
+
+        try:
+            os.remove(self._fileName)
+        except FileNotFoundError:
+            pass
+
+
+    @staticmethod
+    def _encodeEdit(edit):
+
+        # Ranges are written by their bounds, other sequences as lists
+        values = []
+        for value in edit:
+            if isinstance(value, range):
+                value = {"start": value.start, "stop": value.stop}
+            elif not isinstance(value, (str, int, list, type(None))):
+                value = list(value)
+            values.append(value)
+
+        return values
+
+
+    @staticmethod
+    def _decodeEdit(edit):
+
+        if not isinstance(edit, list) or not edit or not isinstance(edit[0], str):
+            raise ValueError("Invalid edit in journal")
+
+        return tuple(range(value["start"], value["stop"]) if isinstance(value, dict) else value for value in edit)
@@ -0,0 +1,92 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import csv
+import time
+
+from PySide2.QtCore import QObject, QRunnable, Signal
+
+from performance_registry import PerformanceRegistry
+
+
+class DocumentLoaderSignals(QObject):
+
+    blockLoaded = Signal(object)
+    progressChanged = Signal("qint64", "qint64")
+    finished = Signal(bool, str)
+
+
+class DocumentLoader(QRunnable):
+
+    def __init__(self, reader):
+        super().__init__()
+
+        self.signals = DocumentLoaderSignals()
+
+        self._reader = reader
+        self._canceled = False
+
+
+    def reader(self):
+
+        return self._reader
+
+
+    def cancel(self):
+
+        self._canceled = True
+
+
+    def isCanceled(self):
+
+        return self._canceled
+
+
+    def run(self):
+
+        # Reading the blocks is measured only while the registry is enabled
+        registry = PerformanceRegistry.instance() if PerformanceRegistry.Enabled else None
+        if registry:
+            start = blockStart = time.perf_counter()
+
+        try:
+            for block in self._reader.readBlocks():
+                if self._canceled:
+                    break
+
+                if registry:
+                    registry.addTime("load.parse", time.perf_counter() - blockStart)
+                    registry.addCount("load.rows", len(block))
+
+                self.signals.blockLoaded.emit(block)
+                self.signals.progressChanged.emit(self._reader.bytesRead(), self._reader.bytesTotal())
+
+                if registry:
+                    blockStart = time.perf_counter()
+
+        except (OSError, UnicodeError, ValueError, csv.Error) as error:
+            self.signals.finished.emit(False, str(error))
+            return
+
+        if registry:
+            registry.addTime("load", time.perf_counter() - start)
+            registry.addCount("load.bytes", self._reader.bytesRead())
+
+        self.signals.finished.emit(not self._canceled, "")
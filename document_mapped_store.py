@@ -0,0 +1,202 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import csv
+import io
+import mmap
+import os
+from array import array
+from collections import OrderedDict
+from itertools import repeat
+from operator import eq
+
+
+class DocumentMappedStore:
+
+    def __init__(self, fileName, delimiter=",", quoteChar="\"", encoding="utf-8"):
+
+        self._fileName = fileName
+        self._delimiter = delimiter
+        self._quoteChar = quoteChar
+        self._encoding = encoding
+
+        # Empty files cannot be mapped
+        with open(fileName, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else b""
+
+        # Start offsets of the rows followed by the end offset of the last row
+        self._offsets = array("Q", [0])
+        self._columnCount = 0
+
+        # Recently parsed rows
+        self._rowCache = OrderedDict()
+        self._rowCacheSize = 1024
+
+
+    def fileName(self):
+
+        return self._fileName
+
+
+    def rowCount(self):
+
+        return len(self._offsets) - 1
+
+
+    def columnCount(self):
+
+        return self._columnCount
+
+
+    def byteSize(self):
+
+        return self._offsets.itemsize * len(self._offsets)
+
+
+    def isReadOnly(self):
+
+        return True
+
+
+    def close(self):
+
+        # The mapping and its file handle are released; rows read afterwards
+        # are empty
+        map, self._map = self._map, b""
+        if isinstance(map, mmap.mmap):
+            map.close()
+
+        self._rowCache.clear()
+
+
+    def value(self, row, column):
+
+        values = self.rowValues(row)
+
+        return values[column] if column < len(values) else ""
+
+
+    def rowValues(self, row):
+
+        values = self._rowCache.get(row)
+        if values is not None:
+            self._rowCache.move_to_end(row)
+            return values
+
+        # Fields are parsed only for rows requested by the view
+        text = self._map[self._offsets[row]:self._offsets[row + 1]].decode(self._encoding, errors="replace")
+        values = next(csv.reader(io.StringIO(text, newline=""), delimiter=self._delimiter, quotechar=self._quoteChar), [])
+
+        self._rowCache[row] = values
+        if len(self._rowCache) > self._rowCacheSize:
+            self._rowCache.popitem(last=False)
+
+        return values
+
+
+    def rows(self, first=0, last=None, columns=None):
+
+        last = self.rowCount() if last is None else last
+        if first >= last:
+            return []
+
+        # Consecutive rows are parsed in one go, bypassing the row cache
+        text = self._map[self._offsets[first]:self._offsets[last]].decode(self._encoding, errors="replace")
+        rows = list(csv.reader(io.StringIO(text, newline=""), delimiter=self._delimiter, quotechar=self._quoteChar))
+
+        for values in rows:
+            if len(values) < self._columnCount:
+                values.extend([""] * (self._columnCount - len(values)))
+
+        if columns is not None:
+            return [[values[column] for column in columns] for values in rows]
+
+        return rows
+
+
+    def columns(self, first=0, last=None):
+
+        # Rows are padded to the known columns; further fields are dropped
+        rows = self.rows(first, last)
+        if not rows:
+            return [[] for _ in range(self._columnCount)]
+
+        return list(map(list, zip(*rows)))[:self._columnCount]
+
+
+    def columnValues(self, column, first=0, last=None):
+
+        return [values[column] if column < len(values) else "" for values in self.rows(first, last)]
+
+
+    def matchText(self, column, text, first=0, last=None):
+
+        return bytes(map(eq, self.columnValues(column, first, last), repeat(text)))
+
+
+    def matchValues(self, column, function, first=0, last=None):
+
+        return function(self.columnValues(column, first, last))
+
+
+    def sortKey(self, column, text):
+
+        return self._sortKey(text)
+
+
+    def sortKeys(self, columns, first=0, last=None):
+
+        # Fields are not typed; numbers compare as numbers before all other texts
+        rows = self.rows(first, last)
+
+        return [list(map(self._sortKey, (values[column] if column < len(values) else "" for values in rows))) for column in columns]
+
+
+    @staticmethod
+    def _sortKey(text):
+
+        if not text:
+            return None
+
+        try:
+            number = float(text)
+        except ValueError:
+            return (1, text)
+
+        return (0, number) if number == number else (1, text)
+
+
+    def appendRowOffsets(self, offsets):
+
+        self._offsets += offsets
+
+
+    def sampleColumnCount(self, first, count=16):
+
+        # The number of columns is estimated from a few rows only
+        last = min(first + count, self.rowCount())
+
+        return max((len(self.rowValues(row)) for row in range(first, last)), default=0)
+
+
+    def setColumnCount(self, columnCount):
+
+        self._columnCount = columnCount
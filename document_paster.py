@@ -0,0 +1,72 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import csv
+
+from PySide2.QtCore import QObject, QRunnable, Signal
+
+
+class DocumentPasterSignals(QObject):
+
+    progressChanged = Signal("qint64", "qint64")
+    finished = Signal(bool, str)
+
+
+class DocumentPaster(QRunnable):
+
+    def __init__(self, reader):
+        super().__init__()
+
+        self.signals = DocumentPasterSignals()
+
+        self._reader = reader
+        self._canceled = False
+
+
+    def reader(self):
+
+        return self._reader
+
+
+    def cancel(self):
+
+        self._canceled = True
+
+
+    def isCanceled(self):
+
+        return self._canceled
+
+
+    def run(self):
+
+        try:
+            blocks = self._reader.readBlocks()
+            for rowsRead in blocks:
+                if self._canceled:
+                    break
+
+                self.signals.progressChanged.emit(rowsRead, self._reader.rowsToRead())
+
+        except csv.Error as error:
+            self.signals.finished.emit(False, str(error))
+            return
+
+        self.signals.finished.emit(not self._canceled, "")
@@ -0,0 +1,154 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import codecs
+import csv
+import io
+import itertools
+import os
+
+
+class DocumentReader:
+
+    def __init__(self, fileName, delimiter=",", quoteChar="\"", encoding="utf-8"):
+
+        self._fileName = fileName
+        self._delimiter = delimiter
+        self._quoteChar = quoteChar
+        self._encoding = encoding
+
+        # The first chunk is kept small to show the first rows early
+        self._firstChunkSize = 64 * 1024
+        self._chunkSize = 1024 * 1024
+
+        self._firstBlockSize = 256
+        self._blockSize = 8192
+
+        self._bytesRead = 0
+        self._bytesTotal = 0
+
+
+    def fileName(self):
+
+        return self._fileName
+
+
+    def setChunkSize(self, chunkSize, firstChunkSize=None):
+
+        self._chunkSize = chunkSize
+        self._firstChunkSize = firstChunkSize if firstChunkSize else chunkSize
+
+
+    def chunkSize(self):
+
+        return self._chunkSize
+
+
+    def setBlockSize(self, blockSize, firstBlockSize=None):
+
+        self._blockSize = blockSize
+        self._firstBlockSize = firstBlockSize if firstBlockSize else blockSize
+
+
+    def blockSize(self):
+
+        return self._blockSize
+
+
+    def bytesRead(self):
+
+        return self._bytesRead
+
+
+    def bytesTotal(self):
+
+        return self._bytesTotal
+
+
+    def readBlocks(self):
+
+        with open(self._fileName, "rb") as file:
+
+            self._bytesTotal = os.fstat(file.fileno()).st_size
+            self._bytesRead = 0
+
+            lines = itertools.chain.from_iterable(self._readChunks(file))
+            reader = csv.reader(lines, delimiter=self._delimiter, quotechar=self._quoteChar)
+
+            # Rows are handed out in blocks; the first one is kept small as well
+            blockSize = self._firstBlockSize
+
+            while True:
+                block = list(itertools.islice(reader, blockSize))
+                if not block:
+                    break
+
+                yield block
+                blockSize = self._blockSize
+
+
+    def _readChunks(self, file):
+
+        decoder = codecs.getincrementaldecoder(self._encoding)(errors="replace")
+        chunkSize = self._firstChunkSize
+        pending = ""
+
+        while True:
+            data = file.read(chunkSize)
+            chunkSize = self._chunkSize
+
+            self._bytesRead += len(data)
+
+            text = pending + decoder.decode(data, final=not data)
+            pending = ""
+
+            if data:
+                # Hold back the incomplete last line; a trailing carriage return
+                # is held back as well, it might be followed by a line feed.
+                end = text.rfind("\n") + 1
+                cr = text.rfind("\r", end, len(text) - 1)
+                if cr >= 0:
+                    end = cr + 1
+
+                pending = text[end:]
+                text = text[:end]
+
+            if text:
+                yield self._splitLines(text)
+
+            if not data:
+                break
+
+
+    @staticmethod
+    def _splitLines(text):
+
+        lines = text.splitlines(keepends=True)
+
+        # splitlines() also breaks on carriage returns, form feeds, separators
+        # and the like; fall back to a slower split if any of them is present.
+        lineCount = text.count("\n")
+        if not text.endswith("\n"):
+            lineCount += 1
+
+        if len(lines) != lineCount:
+            lines = io.StringIO(text, newline="")
+
+        return lines
@@ -0,0 +1,136 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from array import array
+from functools import reduce
+from itertools import compress
+from operator import and_, or_
+
+
+class DocumentRowFilter:
+
+    _bitTexts = bytes.maketrans(b"\x00\x01", b"01")
+    _bitValues = bytes.maketrans(b"01", b"\x00\x01")
+
+
+    def __init__(self, store, filters, bitmaps=None, matchAll=True, rowOrder=None):
+
+        self._store = store
+
+        # Filters by column, and the bitmaps of the columns evaluated before:
+        # integers with one bit per row, set for the rows which match.
+        self._filters = dict(filters)
+        self._bitmaps = {column: bitmap for column, bitmap in (bitmaps or {}).items() if column in self._filters}
+        self._matchAll = matchAll
+
+        # Rows of the store in sorted order, or None for the order of the store
+        self._sourceOrder = rowOrder
+
+        self._blockSize = 65536
+        self._rowsRead = 0
+
+        self._rowOrder = None
+        self._rowPositions = None
+
+
+    def setBlockSize(self, blockSize):
+
+        self._blockSize = blockSize
+
+
+    def blockSize(self):
+
+        return self._blockSize
+
+
+    def rowsRead(self):
+
+        return self._rowsRead
+
+
+    def rowsToRead(self):
+
+        return self._store.rowCount() * sum(1 for column in self._filters if column not in self._bitmaps)
+
+
+    def bitmaps(self):
+
+        return dict(self._bitmaps)
+
+
+    def rowOrder(self):
+
+        # Rows of the store which match, in the order shown
+        return self._rowOrder
+
+
+    def rowPositions(self):
+
+        # Shown positions of the rows of the store; -1 for rows filtered out
+        return self._rowPositions
+
+
+    def filterBlocks(self):
+
+        # Only the columns without a bitmap are evaluated
+        rowCount = self._store.rowCount()
+        self._rowsRead = 0
+
+        for column, filter in self._filters.items():
+            if column in self._bitmaps:
+                continue
+
+            flags = bytearray()
+            for first in range(0, rowCount, self._blockSize):
+                last = min(first + self._blockSize, rowCount)
+                flags += filter.matchBlock(self._store, first, last)
+
+                self._rowsRead += last - first
+                yield self._rowsRead
+
+            self._bitmaps[column] = self._flagsToBitmap(flags)
+
+        bitmap = reduce(and_ if self._matchAll else or_, self._bitmaps.values(), (1 << rowCount) - 1 if self._matchAll else 0)
+        flags = self._bitmapToFlags(bitmap, rowCount)
+
+        if self._sourceOrder is not None:
+            order = array("Q", compress(self._sourceOrder, map(flags.__getitem__, self._sourceOrder)))
+        else:
+            order = array("Q", compress(range(rowCount), flags))
+
+        positions = array("q", [-1]) * rowCount
+        for position, row in enumerate(order):
+            positions[row] = position
+
+        self._rowOrder = order
+        self._rowPositions = positions
+
+
+    @classmethod
+    def _flagsToBitmap(cls, flags):
+
+        # Bytes of the rows are turned into the digits of a binary number
+        return int(bytes(flags[::-1]).translate(cls._bitTexts), 2) if flags else 0
+
+
+    @classmethod
+    def _bitmapToFlags(cls, bitmap, rowCount):
+
+        return format(bitmap, "b").zfill(rowCount)[::-1].encode("ascii").translate(cls._bitValues) if rowCount else b""
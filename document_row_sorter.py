@@ -0,0 +1,276 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import pickle
+import tempfile
+from array import array
+from functools import cmp_to_key
+from itertools import compress, repeat
+from operator import add, is_, is_not, itemgetter, neg, not_, pos
+
+
+class DocumentRowSorter:
+
+    # Estimated memory per row and sort key while sorting in memory
+    BytesPerKey = 48
+
+
+    def __init__(self, store, keys, memoryBudget=512 * 1024 * 1024):
+
+        self._store = store
+
+        # Columns with their direction: (column, descending)
+        self._keys = list(keys)
+        self._memoryBudget = memoryBudget
+
+        self._blockSize = 65536
+        self._rowsRead = 0
+        self._runCount = 0
+
+        self._rowOrder = None
+        self._rowPositions = None
+
+
+    def setBlockSize(self, blockSize):
+
+        self._blockSize = blockSize
+
+
+    def blockSize(self):
+
+        return self._blockSize
+
+
+    def keys(self):
+
+        return list(self._keys)
+
+
+    def rowsRead(self):
+
+        return self._rowsRead
+
+
+    def rowsToRead(self):
+
+        return self._store.rowCount() * len(self._keys)
+
+
+    def runCount(self):
+
+        return self._runCount
+
+
+    def rowOrder(self):
+
+        # Rows of the store in sorted order
+        return self._rowOrder
+
+
+    def rowPositions(self):
+
+        # Sorted positions of the rows of the store
+        return self._rowPositions
+
+
+    def isExternal(self):
+
+        return self._store.rowCount() * self.BytesPerKey * (len(self._keys) + 1) > self._memoryBudget
+
+
+    def sortBlocks(self):
+
+        # Only keys and row numbers are sorted; the cells stay in place. Rows
+        # with equal keys keep their order, empty cells go last.
+        self._rowsRead = 0
+        self._runCount = 0
+
+        if not self.isExternal():
+            keys = yield from self._readKeys(0, self._store.rowCount())
+            order = array("Q", self._sortKeys(keys))
+        else:
+            order = yield from self._sortExternal()
+
+        positions = array("q", bytes(8 * len(order)))
+        for position, row in enumerate(order):
+            positions[row] = position
+
+        self._rowOrder = order
+        self._rowPositions = positions
+
+
+    def _readKeys(self, first, last):
+
+        columns = [column for column, _ in self._keys]
+        keys = [[] for _ in columns]
+
+        for start in range(first, last, self._blockSize):
+            end = min(start + self._blockSize, last)
+            for values, blockKeys in zip(keys, self._store.sortKeys(columns, start, end)):
+                values.extend(blockKeys)
+
+            self._rowsRead += (end - start) * len(columns)
+            yield self._rowsRead
+
+        return keys
+
+
+    def _sortKeys(self, keys):
+
+        # Stable sorts from the last key to the first one; returns the
+        # positions of the keys in sorted order
+        order = list(range(len(keys[0]) if keys else 0))
+        for values, (_, descending) in reversed(list(zip(keys, self._keys))):
+            order = self._sortOrder(order, values, descending)
+
+        return order
+
+
+    @staticmethod
+    def _sortOrder(order, keys, descending):
+
+        if None in keys:
+            blanks = list(map(is_, keys, repeat(None)))
+            blankRows = list(compress(order, map(blanks.__getitem__, order)))
+            order = list(compress(order, map(not_, map(blanks.__getitem__, order))))
+        else:
+            blankRows = []
+
+        order.sort(key=keys.__getitem__, reverse=descending)
+
+        return order + blankRows
+
+
+    def _sortExternal(self):
+
+        # Ranges of rows which fit into the memory budget are sorted one by
+        # one and written to temporary files; the runs are merged at the end.
+        rowCount = self._store.rowCount()
+        runSize = max(self._memoryBudget // (self.BytesPerKey * (len(self._keys) + 1)), self._blockSize)
+        runs = []
+
+        # Keys in one direction are merged as tuples of flags and keys; the
+        # flags put empty cells last. Mixed directions are compared key by key.
+        # The row, negated for a descending merge, makes all records distinct.
+        directions = {descending for _, descending in self._keys}
+        native = len(directions) == 1
+        descending = native and directions == {True}
+
+        try:
+            for first in range(0, rowCount, runSize):
+                keys = yield from self._readKeys(first, min(first + runSize, rowCount))
+                order = self._sortKeys(keys)
+
+                run = tempfile.TemporaryFile(prefix="tabulator-sort-")
+                for start in range(0, len(order), self._blockSize):
+                    positions = order[start:start + self._blockSize]
+                    rows = map(neg if descending else pos, map(add, positions, repeat(first)))
+
+                    fields = []
+                    for values in keys:
+                        values = list(map(values.__getitem__, positions))
+                        if native:
+                            fields.append(list(map(is_not if descending else is_, values, repeat(None))))
+                        fields.append(values)
+
+                    pickle.dump(list(zip(*fields, rows)), run, pickle.HIGHEST_PROTOCOL)
+                run.seek(0)
+
+                runs.append(run)
+                self._runCount += 1
+
+            order = array("Q")
+            for records in self._mergeRuns(runs, None if native else cmp_to_key(self._compareRecords), descending):
+                order.extend(map(abs, map(itemgetter(-1), records)))
+
+        finally:
+            for run in runs:
+                run.close()
+
+        return order
+
+
+    @staticmethod
+    def _mergeRuns(runs, key, descending):
+
+        # Records loaded from the runs are sorted together; all of them up to
+        # the smallest last record loaded of a run can be passed on, as the
+        # records not loaded yet follow the last ones of their runs.
+        blocks = [DocumentRowSorter._readRun(run) for run in runs]
+        records = []
+        lasts = {}
+
+        for number, block in enumerate(blocks):
+            first = next(block, None)
+            if first:
+                records.extend(first)
+                lasts[number] = first[-1]
+
+        while lasts:
+            records.sort(key=key, reverse=descending)
+
+            if key is None:
+                bound = (max if descending else min)(lasts.items(), key=itemgetter(1))
+            else:
+                bound = min(lasts.items(), key=lambda item: key(item[1]))
+
+            number, last = bound
+            position = records.index(last) + 1
+            yield records[:position]
+            del records[:position]
+
+            block = next(blocks[number], None)
+            if block:
+                records.extend(block)
+                lasts[number] = block[-1]
+            else:
+                del lasts[number]
+
+        records.sort(key=key, reverse=descending)
+        yield records
+
+
+    @staticmethod
+    def _readRun(run):
+
+        while True:
+            try:
+                yield pickle.load(run)
+            except EOFError:
+                return
+
+
+    def _compareRecords(self, first, second):
+
+        # Compares the keys of two rows like the sorts of the runs
+        for number, (_, descending) in enumerate(self._keys):
+            key, otherKey = first[number], second[number]
+            if key == otherKey:
+                continue
+            if key is None:
+                return 1
+            if otherKey is None:
+                return -1
+            if key < otherKey:
+                return 1 if descending else -1
+            return -1 if descending else 1
+
+        # Equal keys keep the order of the rows
+        return first[-1] - second[-1]
@@ -0,0 +1,87 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import csv
+import time
+
+from PySide2.QtCore import QObject, QRunnable, Signal
+
+from performance_registry import PerformanceRegistry
+
+
+class DocumentSaverSignals(QObject):
+
+    progressChanged = Signal("qint64", "qint64", float)
+    finished = Signal(bool, str)
+
+
+class DocumentSaver(QRunnable):
+
+    def __init__(self, writer):
+        super().__init__()
+
+        self.signals = DocumentSaverSignals()
+
+        self._writer = writer
+        self._canceled = False
+
+
+    def writer(self):
+
+        return self._writer
+
+
+    def cancel(self):
+
+        self._canceled = True
+
+
+    def isCanceled(self):
+
+        return self._canceled
+
+
+    def run(self):
+
+        start = time.perf_counter()
+
+        try:
+            blocks = self._writer.writeBlocks()
+            for rowsWritten in blocks:
+                if self._canceled:
+                    # Discards the temporary file
+                    blocks.close()
+                    break
+
+                elapsed = time.perf_counter() - start
+                bytesPerSecond = self._writer.bytesWritten() / elapsed if elapsed > 0 else 0.0
+                self.signals.progressChanged.emit(rowsWritten, self._writer.rowCount(), bytesPerSecond)
+
+        except (OSError, UnicodeError, ValueError, csv.Error) as error:
+            self.signals.finished.emit(False, str(error))
+            return
+
+        if PerformanceRegistry.Enabled:
+            registry = PerformanceRegistry.instance()
+            registry.addTime("save", time.perf_counter() - start)
+            registry.addCount("save.rows", self._writer.rowsWritten())
+            registry.addCount("save.bytes", self._writer.bytesWritten())
+
+        self.signals.finished.emit(not self._canceled, "")
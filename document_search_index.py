@@ -0,0 +1,102 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import sys
+from array import array
+from itertools import chain
+
+
+class DocumentSearchIndex:
+
+    # Indexes estimated to take more memory are dropped
+    MaximumBytes = 64 * 1024 * 1024
+
+    # Estimated memory of a distinct text besides the text itself: its entry
+    # in the dictionary and its row array
+    TextBytes = 168
+
+
+    def __init__(self):
+
+        # Rows of each distinct cell text of a column, as compact arrays
+        self._rows = {}
+        self._rowCount = 0
+        self._byteSize = 0
+        self._complete = False
+
+
+    def rowCount(self):
+
+        return self._rowCount
+
+
+    def textCount(self):
+
+        return len(self._rows)
+
+
+    def byteSize(self):
+
+        return self._byteSize
+
+
+    def isComplete(self):
+
+        return self._complete
+
+
+    def addValues(self, first, values):
+
+        # Returns False once the index would take too much memory
+        rows = self._rows
+        byteSize = self._byteSize + 8 * len(values)
+        for row, text in zip(range(first, first + len(values)), values):
+            textRows = rows.get(text)
+            if textRows is None:
+                textRows = rows[text] = array("q")
+                byteSize += self.TextBytes + sys.getsizeof(text)
+            textRows.append(row)
+
+        self._rowCount += len(values)
+        self._byteSize = byteSize
+
+        if byteSize > self.MaximumBytes:
+            self._rows = {}
+            return False
+
+        return True
+
+
+    def complete(self):
+
+        self._complete = True
+
+
+    def rows(self, text):
+
+        return self._rows.get(text, ())
+
+
+    def matchingRows(self, match):
+
+        # Only the distinct texts are matched; their rows are merged in order
+        rows = [self._rows[text] for text in self._rows if match(text)]
+
+        return sorted(chain.from_iterable(rows)) if len(rows) > 1 else list(rows[0]) if rows else []
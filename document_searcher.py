@@ -0,0 +1,166 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import re
+from bisect import bisect_left
+from enum import Enum
+from itertools import compress, repeat
+from operator import contains, eq
+
+from document_search_index import DocumentSearchIndex
+
+
+class DocumentSearcher:
+
+    class Mode(Enum):
+        Substring = 0
+        WholeCell = 1
+        RegularExpression = 2
+
+
+    def __init__(self, store, text, mode=Mode.Substring, caseSensitive=False, indexes=None, column=None):
+
+        self._store = store
+        self._text = text
+        self._mode = mode
+        self._caseSensitive = caseSensitive
+
+        # Column searched; None searches all columns
+        self._column = column
+
+        # Raises re.error if the regular expression is not valid
+        self._pattern = re.compile(text, 0 if caseSensitive else re.IGNORECASE) if mode == self.Mode.RegularExpression else None
+
+        # Search indexes by column; None disables indexing. Only the column of
+        # a search restricted to one column is indexed.
+        self._indexes = indexes if column is not None else None
+
+        self._blockSize = 8192
+        self._rowsSearched = 0
+
+
+    def setBlockSize(self, blockSize):
+
+        self._blockSize = blockSize
+
+
+    def blockSize(self):
+
+        return self._blockSize
+
+
+    def rowsSearched(self):
+
+        return self._rowsSearched
+
+
+    def rowCount(self):
+
+        return self._store.rowCount()
+
+
+    def indexes(self):
+
+        return self._indexes
+
+
+    def column(self):
+
+        return self._column
+
+
+    def searchBlocks(self):
+
+        # Yields the matching cells as (row, column) pairs in row-major order,
+        # one list per block of rows searched
+        rowCount = self._store.rowCount()
+        columns = range(self._store.columnCount()) if self._column is None else [self._column]
+        self._rowsSearched = 0
+
+        # A column indexed by an earlier search is answered from its index;
+        # otherwise it is scanned and indexed on the way.
+        indexedRows = {}
+        building = {}
+        if self._indexes is not None:
+            for column in columns:
+                index = self._indexes.get(column, False)
+                if index and self._mode == self.Mode.WholeCell and self._caseSensitive:
+                    indexedRows[column] = list(index.rows(self._text))
+                elif index:
+                    indexedRows[column] = index.matchingRows(self._matchText)
+                elif index is False:
+                    building[column] = DocumentSearchIndex()
+
+        scannedColumns = [column for column in columns if column not in indexedRows]
+
+        for first in range(0, rowCount, self._blockSize):
+            last = min(first + self._blockSize, rowCount)
+            matches = []
+
+            for column, rows in indexedRows.items():
+                rows = rows[bisect_left(rows, first):bisect_left(rows, last)]
+                matches.extend(zip(rows, repeat(column)))
+
+            if scannedColumns:
+                if self._column is None:
+                    columnValues = self._store.columns(first, last)
+                else:
+                    columnValues = {self._column: self._store.columnValues(self._column, first, last)}
+
+                for column in scannedColumns:
+                    values = columnValues[column]
+
+                    if column in building and not building[column].addValues(first, values):
+                        # Columns whose index grows too large are not indexed
+                        del building[column]
+                        self._indexes[column] = None
+
+                    rows = compress(range(first, last), self._matchValues(values))
+                    matches.extend(zip(rows, repeat(column)))
+
+            self._rowsSearched = last
+            matches.sort()
+            yield matches
+
+        for column, index in building.items():
+            index.complete()
+            self._indexes[column] = index
+
+
+    def _matchValues(self, values):
+
+        if self._mode == self.Mode.RegularExpression:
+            return map(self._pattern.search, values)
+
+        if self._caseSensitive:
+            text = self._text
+        else:
+            text = self._text.casefold()
+            values = map(str.casefold, values)
+
+        if self._mode == self.Mode.WholeCell:
+            return map(eq, values, repeat(text))
+        else:
+            return map(contains, values, repeat(text))
+
+
+    def _matchText(self, text):
+
+        return next(iter(self._matchValues([text])))
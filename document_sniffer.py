@@ -0,0 +1,199 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import codecs
+import csv
+import io
+from collections import Counter
+
+
+class DocumentSniffer:
+
+    Delimiters = [",", ";", "\t", ":", "|"]
+    QuoteChars = ["\"", "'"]
+
+    def __init__(self, fileName):
+
+        self._fileName = fileName
+
+        # Only the head of the document is examined, whatever its size
+        self._sampleSize = 64 * 1024
+        self._sampleRows = 100
+
+        self._delimiter = ","
+        self._quoteChar = "\""
+        self._encoding = "utf-8"
+        self._hasHeader = False
+
+
+    def fileName(self):
+
+        return self._fileName
+
+
+    def setSampleSize(self, sampleSize):
+
+        self._sampleSize = sampleSize
+
+
+    def sampleSize(self):
+
+        return self._sampleSize
+
+
+    def delimiter(self):
+
+        return self._delimiter
+
+
+    def quoteChar(self):
+
+        return self._quoteChar
+
+
+    def encoding(self):
+
+        return self._encoding
+
+
+    def hasHeader(self):
+
+        return self._hasHeader
+
+
+    def sniff(self):
+
+        try:
+            with open(self._fileName, "rb") as file:
+                data = file.read(self._sampleSize)
+        except OSError:
+            return False
+
+        self._encoding = self._sniffEncoding(data)
+
+        # The sample ends with the last complete line, unless it has only one
+        text = codecs.getincrementaldecoder(self._encoding)(errors="replace").decode(data)
+        if len(data) == self._sampleSize:
+            last = max(text.rfind("\n"), text.rfind("\r"))
+            if last > 0:
+                text = text[:last + 1]
+
+        self._quoteChar = self._sniffQuoteChar(text)
+        self._delimiter = self._sniffDelimiter(text, self._quoteChar)
+        self._hasHeader = self._sniffHeader(text, self._delimiter, self._quoteChar)
+
+        return True
+
+
+    @staticmethod
+    def _sniffEncoding(data):
+
+        if data.startswith(codecs.BOM_UTF8):
+            return "utf-8-sig"
+        elif data.startswith(codecs.BOM_UTF16_LE) or data.startswith(codecs.BOM_UTF16_BE):
+            return "utf-16"
+
+        # A character cut at the end of the sample is not an error
+        try:
+            codecs.getincrementaldecoder("utf-8")().decode(data)
+        except UnicodeDecodeError:
+            return "cp1252"
+
+        return "utf-8"
+
+
+    def _sniffQuoteChar(self, text):
+
+        # Quotes enclose fields: they follow line starts and precede line ends
+        best, bestCount = self.QuoteChars[0], 0
+        for quoteChar in self.QuoteChars:
+            count = sum(1 for line in text.splitlines()[:self._sampleRows] if line.startswith(quoteChar) or line.endswith(quoteChar))
+            if count > bestCount:
+                best, bestCount = quoteChar, count
+
+        return best
+
+
+    def _sampleRowsOf(self, text, delimiter, quoteChar):
+
+        reader = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter, quotechar=quoteChar)
+
+        try:
+            return [row for _, row in zip(range(self._sampleRows), reader) if row]
+        except csv.Error:
+            return []
+
+
+    def _sniffDelimiter(self, text, quoteChar):
+
+        # The delimiter splits most rows into the same number of fields
+        best, bestScore = self.Delimiters[0], (0, 0)
+        for delimiter in self.Delimiters:
+            if delimiter not in text:
+                continue
+
+            rows = self._sampleRowsOf(text, delimiter, quoteChar)
+            if not rows:
+                continue
+
+            fieldCount, rowCount = Counter(len(row) for row in rows).most_common(1)[0]
+            if fieldCount < 2:
+                continue
+
+            score = (rowCount / len(rows), fieldCount)
+            if score > bestScore:
+                best, bestScore = delimiter, score
+
+        return best
+
+
+    def _sniffHeader(self, text, delimiter, quoteChar):
+
+        rows = self._sampleRowsOf(text, delimiter, quoteChar)
+        if len(rows) < 2:
+            return False
+
+        # A header differs in kind from the columns below it: it is text above
+        # numbers, or it has a constant length above varying lengths.
+        header, rows = rows[0], rows[1:]
+        votes = 0
+
+        for column, label in enumerate(header):
+            values = [row[column] for row in rows if column < len(row)]
+            if not values:
+                continue
+
+            if all(self._isNumber(value) for value in values):
+                votes += -1 if self._isNumber(label) else 1
+            elif len(set(map(len, values))) == 1:
+                votes += -1 if len(label) == len(values[0]) else 1
+
+        return votes > 0
+
+
+    @staticmethod
+    def _isNumber(text):
+
+        try:
+            float(text)
+        except ValueError:
+            return False
+
+        return True
@@ -0,0 +1,199 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from itertools import zip_longest
+
+from document_column import DocumentColumn
+from document_typed_column import DocumentTypedColumn
+
+
+class DocumentStore:
+
+    def __init__(self, rowCount=0, columnCount=0):
+
+        self._rowCount = rowCount
+        self._columns = [DocumentTypedColumn(rowCount) for _ in range(columnCount)]
+
+
+    def rowCount(self):
+
+        return self._rowCount
+
+
+    def columnCount(self):
+
+        return len(self._columns)
+
+
+    def columnType(self, column):
+
+        return self._columns[column].type()
+
+
+    def byteSize(self):
+
+        return sum(column.byteSize() for column in self._columns)
+
+
+    def isReadOnly(self):
+
+        return False
+
+
+    def close(self):
+
+        # Cells are kept in memory only
+        pass
+
+
+    def value(self, row, column):
+
+        return self._columns[column].value(row)
+
+
+    def setValue(self, row, column, text):
+
+        if not self._columns[column].setValue(row, text):
+            self._toStringColumn(column).setValue(row, text)
+
+
+    def setColumnValues(self, column, row, texts):
+
+        # Sets the cells of a column from the row on
+        if not self._columns[column].setValues(row, texts):
+            self._toStringColumn(column).setValues(row, texts)
+
+
+    def rowValues(self, row):
+
+        return [column.value(row) for column in self._columns]
+
+
+    def rows(self, first=0, last=None, columns=None):
+
+        # Rows hold all columns, or only the given ones in their order
+        columns = self._columns if columns is None else [self._columns[column] for column in columns]
+        columnValues = [column.values(first, last) for column in columns]
+
+        return [list(values) for values in zip(*columnValues)]
+
+
+    def columns(self, first=0, last=None):
+
+        return [column.values(first, last) for column in self._columns]
+
+
+    def columnValues(self, column, first=0, last=None):
+
+        return self._columns[column].values(first, last)
+
+
+    def matchText(self, column, text, first=0, last=None):
+
+        return self._columns[column].matchText(text, first, last)
+
+
+    def matchValues(self, column, function, first=0, last=None):
+
+        return self._columns[column].matchValues(function, first, last)
+
+
+    def sortKey(self, column, text):
+
+        return self._columns[column].sortKey(text)
+
+
+    def sortKeys(self, columns, first=0, last=None):
+
+        return [self._columns[column].sortKeys(first, last) for column in columns]
+
+
+    def appendRows(self, rows):
+
+        if not rows:
+            return
+
+        columnCount = max(len(values) for values in rows)
+        if columnCount > len(self._columns):
+            self.insertColumns(len(self._columns), columnCount - len(self._columns))
+
+        # Transpose the rows into columns; short rows are padded with empty cells
+        for column, values in enumerate(zip_longest(*rows, fillvalue="")):
+            if not self._columns[column].appendValues(values):
+                self._toStringColumn(column).appendValues(values)
+
+        for column in range(columnCount, len(self._columns)):
+            if not self._columns[column].insertValues(self._rowCount, len(rows)):
+                self._toStringColumn(column).insertValues(self._rowCount, len(rows))
+
+        self._rowCount += len(rows)
+
+
+    def insertRows(self, row, count):
+
+        for column in range(len(self._columns)):
+            if not self._columns[column].insertValues(row, count):
+                self._toStringColumn(column).insertValues(row, count)
+
+        self._rowCount += count
+
+
+    def removeRows(self, row, count):
+
+        for column in self._columns:
+            column.removeValues(row, count)
+
+        self._rowCount -= count
+
+
+    def insertColumns(self, column, count, values=None):
+
+        # Columns are inserted empty, or with the texts of all their cells
+        if not values:
+            self._columns[column:column] = [DocumentTypedColumn(self._rowCount) for _ in range(count)]
+            return
+
+        columns = []
+        for texts in values:
+            typedColumn = DocumentTypedColumn()
+            if typedColumn.appendValues(texts):
+                columns.append(typedColumn)
+            else:
+                stringColumn = DocumentColumn()
+                stringColumn.appendValues(texts)
+                columns.append(stringColumn)
+
+        self._columns[column:column] = columns
+
+
+    def removeColumns(self, column, count):
+
+        del self._columns[column:column + count]
+
+
+    def _toStringColumn(self, column):
+
+        # Texts which do not fit the type of a column turn it into a string column
+        stringColumn = DocumentColumn()
+        stringColumn.appendValues(self._columns[column].values())
+
+        self._columns[column] = stringColumn
+
+        return stringColumn
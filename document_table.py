@@ -18,19 +18,26 @@
 # along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-from PySide2.QtCore import QFileInfo, Qt
+import time
+
+from PySide2.QtCore import QFileInfo, Qt, Signal
 from PySide2.QtGui import QIcon
-from PySide2.QtWidgets import QAction, QDialog, QMenu, QTableWidget, QTableWidgetItem
+from PySide2.QtWidgets import QAction, QDialog, QMenu, QTableView
 
-from document_table_header_dialog import DocumentTableHeaderDialog
+from document_table_header_labels import DocumentTableHeaderLabels
+from document_table_model import DocumentTableModel
+from performance_registry import PerformanceRegistry
 from preferences import Preferences
 
 
-class DocumentTable(QTableWidget):
+class DocumentTable(QTableView):
 
     _preferences = Preferences()
     sequenceNumber = 0
 
+    sortRequested = Signal(int, bool, bool)
+    sortCleared = Signal()
+
 
     def __init__(self, parent=None):
         super(DocumentTable, self).__init__(parent)
@@ -40,9 +47,19 @@ class DocumentTable(QTableWidget):
         self.m_url = ""
         self.isUntitled = True
 
+        # Column widths and the scroll position of an earlier session are
+        # applied as soon as the columns and rows have been read
+        self._pendingColumnWidths = {}
+        self._pendingScrollPosition = None
+
+        # Cell data is kept by the model; the view only requests visible cells
+        self._model = DocumentTableModel(self)
+        self.setModel(self._model)
+        self._model.columnsInserted.connect(lambda: self._applyColumnWidths())
+        self._model.modelReset.connect(lambda: self._applyColumnWidths())
+
         # Creates a default document
-        self.setColumnCount(self._preferences.defaultCellCountColumn())
-        self.setRowCount(self._preferences.defaultCellCountRow())
+        self._model.resize(self._preferences.defaultCellCountRow(), self._preferences.defaultCellCountColumn())
 
         # Enable context menus
         hHeaderView = self.horizontalHeader()
@@ -60,6 +77,8 @@ class DocumentTable(QTableWidget):
         """
         self._preferences = preferences
 
+        self._model.undoStack().setByteLimit(preferences.undoMemoryLimit() * 1024 * 1024)
+
 
     def newDocument(self):
         """
@@ -72,8 +91,7 @@ class DocumentTable(QTableWidget):
             self.m_url += f' ({DocumentTable.sequenceNumber})'
         self.isUntitled = True
 
-        self.setColumnCount(self._preferences.defaultCellCountColumn())
-        self.setRowCount(self._preferences.defaultCellCountRow())
+        self._model.resize(self._preferences.defaultCellCountRow(), self._preferences.defaultCellCountColumn())
 
         # Set header items
         self.setHorizontalHeaderItems(self._preferences.defaultHeaderLabelHorizontal())
@@ -89,6 +107,9 @@ class DocumentTable(QTableWidget):
         self.m_url = url
         self.isUntitled = False
 
+        # Cells are appended while the document is read
+        self._model.resize(0, 0)
+
         # Set header items
         self.setHorizontalHeaderItems(self._preferences.defaultHeaderLabelHorizontal())
         self.setVerticalHeaderItems(self._preferences.defaultHeaderLabelVertical())
@@ -112,149 +133,260 @@ class DocumentTable(QTableWidget):
         return QFileInfo(self.m_url).fileName()
 
 
-    def setHorizontalHeaderItems(self, type):
+    def rowCount(self):
         """
-        Sets the horizontal header items.
+        Returns the number of rows of the document.
         """
-        parameter = self.headerItemDefaultParameter(type)
+        return self._model.rowCount()
 
-        for column in range(0, self.columnCount()):
 
-            number = column
+    def columnCount(self):
+        """
+        Returns the number of columns of the document.
+        """
+        return self._model.columnCount()
 
-            item = QTableWidgetItem()
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setText(self.headerItemText(number, type, parameter))
 
-            self.setHorizontalHeaderItem(column, item)
+    def setStore(self, store):
+        """
+        Sets the storage of the cells of the document.
+        """
+        self._model.setStore(store)
+
+        self.setHorizontalHeaderItems(self._preferences.defaultHeaderLabelHorizontal())
+        self.setVerticalHeaderItems(self._preferences.defaultHeaderLabelVertical())
 
 
-    def setVerticalHeaderItems(self, type):
+    def isReadOnly(self):
         """
-        Sets the vertical header items.
+        Returns whether the cells of the document cannot be edited.
         """
-        parameter = self.headerItemDefaultParameter(type)
+        return self._model.store().isReadOnly()
 
-        for row in range(0, self.rowCount()):
 
-            number = row
+    def store(self):
+        """
+        Returns the storage of the cells of the document.
+        """
+        return self._model.store()
 
-            item = QTableWidgetItem()
-            item.setTextAlignment(Qt.AlignCenter)
-            item.setText(self.headerItemText(number, type, parameter))
 
-            self.setVerticalHeaderItem(row, item)
+    def setModified(self, modified):
+        """
+        Sets whether the cells of the document have been modified.
+        """
+        self._model.setModified(modified)
 
 
-    def headerItemText(self, number, type, parameter):
+    def isModified(self):
         """
-        Returns the header item text.
+        Returns whether the cells of the document have been modified.
         """
-        if type == Preferences.HeaderLabel.Custom:
-            return self.numberToCustom(number, parameter)
-        elif type == Preferences.HeaderLabel.Binary:
-            return self.numberToBinary(number, parameter)
-        elif type == Preferences.HeaderLabel.Octal:
-            return self.numberToOctal(number, parameter)
-        elif type == Preferences.HeaderLabel.Decimal:
-            return self.numberToDecimal(number, parameter)
-        elif type == Preferences.HeaderLabel.Hexadecimal:
-            return self.numberToHexadecimal(number, parameter)
-        elif type == Preferences.HeaderLabel.Letter:
-            return self.numberToLetter(number, parameter)
-        else:
-            return ''
+        return self._model.isModified()
 
 
-    def headerItemDefaultParameter(self, type):
+    def undoStack(self):
         """
-        Returns a default parameter that matches the type of the header label.
+        Returns the history of the edits of the document.
+        """
+        return self._model.undoStack()
+
+
+    def setLocked(self, locked):
+        """
+        Disables editing of the cells until the lock is released again.
+        """
+        self._model.setLocked(locked)
+
+
+    def setRowOrder(self, rowOrder, rowPositions):
+        """
+        Shows the rows of the document in the given order.
+        """
+        # Columns keep their widths when the model is reset
+        columnWidths = self.columnWidths()
+
+        self._model.setRowOrder(rowOrder, rowPositions)
+
+        header = self.horizontalHeader()
+        for column, width in columnWidths:
+            header.resizeSection(column, width)
+
+
+    def setSortIndicator(self, column, descending):
+        """
+        Shows the sort indicator at the given column, or hides it for a negative column.
+        """
+        header = self.horizontalHeader()
+        header.setSortIndicatorShown(column >= 0)
+        header.setSortIndicator(column, Qt.DescendingOrder if descending else Qt.AscendingOrder)
+
+
+    def columnWidths(self):
+        """
+        Returns the widths of the columns which have been resized, as pairs of column and width.
+        """
+        header = self.horizontalHeader()
+        defaultSize = header.defaultSectionSize()
+
+        return [(column, header.sectionSize(column)) for column in range(header.count()) if header.sectionSize(column) != defaultSize]
+
+
+    def setColumnWidths(self, columnWidths):
+        """
+        Sets the widths of columns; columns not read yet are resized once they are.
+        """
+        self._pendingColumnWidths = dict(columnWidths)
+        self._applyColumnWidths()
+
+
+    def scrollPosition(self):
+        """
+        Returns the row and the column shown first.
         """
-        if type == Preferences.HeaderLabel.Binary:
-            return '0b'
-        elif type == Preferences.HeaderLabel.Octal:
-            return '0o'
-        elif type == Preferences.HeaderLabel.Decimal:
-            return '1'
-        elif type == Preferences.HeaderLabel.Hexadecimal:
-            return '0x'
-        elif type == Preferences.HeaderLabel.Letter:
-            return 'upper'
-        else:
-            return ''
+        return (self.verticalScrollBar().value(), self.horizontalScrollBar().value())
 
 
-    def numberToCustom(self, number, parameter):
+    def setScrollPosition(self, row, column):
         """
-        Returns a string equivalent of the user-defined text.
+        Scrolls to the row and column shown first, once the document has that many rows and columns.
         """
-        return parameter.replace('#', str(number + 1))
+        self._pendingScrollPosition = (row, column)
+        self.updateGeometries()
 
 
-    def numberToBinary(self, number, parameter):
+    def paintEvent(self, event):
         """
-        Returns a string equivalent of the number according to the base 2.
+        Paints the visible cells, measuring the time per frame while the performance registry is enabled.
         """
-        return f'{parameter}{number:b}'
+        if not PerformanceRegistry.Enabled:
+            super().paintEvent(event)
+            return
 
+        start = time.perf_counter()
+        super().paintEvent(event)
+        PerformanceRegistry.instance().addTime("paint", time.perf_counter() - start)
 
-    def numberToOctal(self, number, parameter):
+
+    def updateGeometries(self):
+        """
+        Updates the scroll bars, and scrolls to the position pending once their range allows it.
+        """
+        super().updateGeometries()
+
+        if self._pendingScrollPosition is None:
+            return
+
+        row, column = self._pendingScrollPosition
+        verticalScrollBar = self.verticalScrollBar()
+        horizontalScrollBar = self.horizontalScrollBar()
+        if verticalScrollBar.maximum() >= row and horizontalScrollBar.maximum() >= column:
+            self._pendingScrollPosition = None
+            verticalScrollBar.setValue(row)
+            horizontalScrollBar.setValue(column)
+
+
+    def applyPendingViewState(self):
         """
-        Returns a string equivalent of the number according to the base 8.
+        Applies the column widths and the scroll position pending as far as the document allows; the rest is dropped.
         """
-        return f'{parameter}{number:o}'
+        self._applyColumnWidths()
+        self.updateGeometries()
+
+        # Rows and columns near the end are scrolled to as far as possible
+        if self._pendingScrollPosition is not None:
+            row, column = self._pendingScrollPosition
+            self.verticalScrollBar().setValue(row)
+            self.horizontalScrollBar().setValue(column)
+
+        self._pendingColumnWidths = {}
+        self._pendingScrollPosition = None
+
+
+    def appendRows(self, rows):
+        """
+        Appends rows of cell texts to the document.
+        """
+        start = time.perf_counter() if PerformanceRegistry.Enabled else None
+
+        self._model.appendRows(rows)
 
+        if start is not None:
+            PerformanceRegistry.instance().addTime("load.fill", time.perf_counter() - start)
 
-    def numberToDecimal(self, number, parameter):
+
+    def appendRowOffsets(self, offsets):
         """
-        Returns a string equivalent of the number according to the base 10.
+        Appends rows of a memory-mapped document by their offsets.
         """
-        return f'{number + int(parameter)}'
+        start = time.perf_counter() if PerformanceRegistry.Enabled else None
+
+        self._model.appendRowOffsets(offsets)
 
+        if start is not None:
+            PerformanceRegistry.instance().addTime("load.fill", time.perf_counter() - start)
 
-    def numberToHexadecimal(self, number, parameter):
+
+    def setHorizontalHeaderItems(self, type):
         """
-        Returns a string equivalent of the number according to the base 16.
+        Sets the horizontal header items.
         """
-        return f'{parameter}{number:X}'
+        parameter = self.headerItemDefaultParameter(type)
+
+        self._model.setHeaderLabel(Qt.Horizontal, type, parameter)
 
 
-    def numberToLetter(self, number, parameter):
+    def setVerticalHeaderItems(self, type):
         """
-        Returns a string equivalent of the number according to the base 26.
+        Sets the vertical header items.
         """
-        chars = ''
-        number += 1
+        parameter = self.headerItemDefaultParameter(type)
 
-        while number > 0:
-            number -= 1
-            chars = chr(number % 26 + 65) + chars
-            number //= 26
+        self._model.setHeaderLabel(Qt.Vertical, type, parameter)
 
-        return chars.upper() if parameter == 'upper' else chars.lower()
+
+    def headerItemText(self, number, type, parameter):
+        """
+        Returns the header item text.
+        """
+        return DocumentTableHeaderLabels.itemText(number, type, parameter)
+
+
+    def headerItemDefaultParameter(self, type):
+        """
+        Returns a default parameter that matches the type of the header label.
+        """
+        return DocumentTableHeaderLabels.defaultParameter(type)
 
 
     def contextMenuHorizontalHeader(self, pos):
         """
-        Creates a context menu for the horizontal header.
+        Shows the context menu of the horizontal header section at the position.
+        """
+        contextMenu = self.horizontalHeaderMenu(self.horizontalHeader().logicalIndexAt(pos))
+        contextMenu.exec_(self.horizontalHeader().mapToGlobal(pos))
+
+
+    def horizontalHeaderMenu(self, column):
+        """
+        Creates a context menu for the horizontal header section of the column, or for no section if the column is -1.
         """
-        index = self.indexAt(pos)
 
         # Label
         actionLabelLetter = QAction('Letter', self)
         actionLabelLetter.setStatusTip('Change label to a capital letter')
         actionLabelLetter.setToolTip('Change label to a capital letter')
-        actionLabelLetter.triggered.connect( lambda: self.onActionLabelHorizontalTriggered(index.column(), Preferences.HeaderLabel.Letter) )
+        actionLabelLetter.triggered.connect( lambda: self.onActionLabelHorizontalTriggered(column, Preferences.HeaderLabel.Letter) )
 
         actionLabelNumber = QAction('Number', self)
         actionLabelNumber.setStatusTip('Change label to a decimal number')
         actionLabelNumber.setToolTip('Change label to a decimal number')
-        actionLabelNumber.triggered.connect( lambda: self.onActionLabelHorizontalTriggered(index.column(), Preferences.HeaderLabel.Decimal) )
+        actionLabelNumber.triggered.connect( lambda: self.onActionLabelHorizontalTriggered(column, Preferences.HeaderLabel.Decimal) )
 
         actionLabelCustom = QAction('Custom…', self)
         actionLabelCustom.setStatusTip('Change label to a user-defined text')
         actionLabelCustom.setToolTip('Change label to a user-defined text')
-        actionLabelCustom.triggered.connect( lambda: self.onActionLabelHorizontalTriggered(index.column(), Preferences.HeaderLabel.Custom) )
+        actionLabelCustom.triggered.connect( lambda: self.onActionLabelHorizontalTriggered(column, Preferences.HeaderLabel.Custom) )
 
         actionLabelLetters = QAction('Letters', self)
         actionLabelLetters.setStatusTip('Change all labels to capital letters')
@@ -284,9 +416,77 @@ class DocumentTable(QTableWidget):
         menuLabel.addAction(actionLabelNumbers)
         menuLabel.addAction(actionLabelCustoms)
 
+        # Sort
+        actionSortAscending = QAction('Ascending', self)
+        actionSortAscending.setStatusTip('Sort rows by this column in ascending order')
+        actionSortAscending.setToolTip('Sort rows by this column in ascending order')
+        actionSortAscending.setEnabled(column >= 0)
+        actionSortAscending.triggered.connect( lambda: self.sortRequested.emit(column, False, False) )
+
+        actionSortDescending = QAction('Descending', self)
+        actionSortDescending.setStatusTip('Sort rows by this column in descending order')
+        actionSortDescending.setToolTip('Sort rows by this column in descending order')
+        actionSortDescending.setEnabled(column >= 0)
+        actionSortDescending.triggered.connect( lambda: self.sortRequested.emit(column, True, False) )
+
+        actionSortThenAscending = QAction('Then Ascending', self)
+        actionSortThenAscending.setStatusTip('Sort rows with equal keys by this column in ascending order')
+        actionSortThenAscending.setToolTip('Sort rows with equal keys by this column in ascending order')
+        actionSortThenAscending.setEnabled(column >= 0)
+        actionSortThenAscending.triggered.connect( lambda: self.sortRequested.emit(column, False, True) )
+
+        actionSortThenDescending = QAction('Then Descending', self)
+        actionSortThenDescending.setStatusTip('Sort rows with equal keys by this column in descending order')
+        actionSortThenDescending.setToolTip('Sort rows with equal keys by this column in descending order')
+        actionSortThenDescending.setEnabled(column >= 0)
+        actionSortThenDescending.triggered.connect( lambda: self.sortRequested.emit(column, True, True) )
+
+        actionSortClear = QAction('Original Order', self)
+        actionSortClear.setStatusTip('Show rows in their original order')
+        actionSortClear.setToolTip('Show rows in their original order')
+        actionSortClear.triggered.connect(self.sortCleared)
+
+        menuSort = QMenu('Sort', self)
+        menuSort.setStatusTip('Sort rows')
+        menuSort.setToolTip('Sort rows')
+        menuSort.addAction(actionSortAscending)
+        menuSort.addAction(actionSortDescending)
+        menuSort.addSeparator()
+        menuSort.addAction(actionSortThenAscending)
+        menuSort.addAction(actionSortThenDescending)
+        menuSort.addSeparator()
+        menuSort.addAction(actionSortClear)
+
+        # Insert & Remove
+        editable = self._model.isStructureEditable()
+
+        actionInsertColumnBefore = QAction('Insert Column Before', self)
+        actionInsertColumnBefore.setStatusTip('Insert an empty column before this column')
+        actionInsertColumnBefore.setToolTip('Insert an empty column before this column')
+        actionInsertColumnBefore.setEnabled(editable)
+        actionInsertColumnBefore.triggered.connect( lambda: self._model.insertColumns(max(column, 0), 1) )
+
+        actionInsertColumnAfter = QAction('Insert Column After', self)
+        actionInsertColumnAfter.setStatusTip('Insert an empty column after this column')
+        actionInsertColumnAfter.setToolTip('Insert an empty column after this column')
+        actionInsertColumnAfter.setEnabled(editable)
+        actionInsertColumnAfter.triggered.connect( lambda: self._model.insertColumns(column + 1, 1) )
+
+        actionRemoveColumn = QAction('Remove Column', self)
+        actionRemoveColumn.setStatusTip('Remove this column')
+        actionRemoveColumn.setToolTip('Remove this column')
+        actionRemoveColumn.setEnabled(editable and column >= 0)
+        actionRemoveColumn.triggered.connect( lambda: self._model.removeColumns(column, 1) )
+
         contextMenu = QMenu(self)
         contextMenu.addMenu(menuLabel)
-        contextMenu.exec_(self.mapToGlobal(pos))
+        contextMenu.addMenu(menuSort)
+        contextMenu.addSeparator()
+        contextMenu.addAction(actionInsertColumnBefore)
+        contextMenu.addAction(actionInsertColumnAfter)
+        contextMenu.addAction(actionRemoveColumn)
+
+        return contextMenu
 
 
     def onActionLabelHorizontalTriggered(self, column, type):
@@ -297,6 +497,7 @@ class DocumentTable(QTableWidget):
 
         if type == Preferences.HeaderLabel.Custom:
 
+            from document_table_header_dialog import DocumentTableHeaderDialog
             documentTableHeaderDialog = DocumentTableHeaderDialog('horizontal', column, self)
             documentTableHeaderDialog.setWindowTitle(f'Horizontal Header Item')
 
@@ -317,6 +518,7 @@ class DocumentTable(QTableWidget):
 
         if type == Preferences.HeaderLabel.Custom:
 
+            from document_table_header_dialog import DocumentTableHeaderDialog
             documentTableHeaderDialog = DocumentTableHeaderDialog('horizontal', -1, self)
             documentTableHeaderDialog.setWindowTitle(f'Horizontal Header Items')
 
@@ -326,41 +528,44 @@ class DocumentTable(QTableWidget):
             else:
                 return
 
-        for column in range(0, self.columnCount()):
-            self.updateHorizontalHeaderItem(column, type, parameter)
+        self._model.relabelHeader(Qt.Horizontal, type, parameter)
 
 
     def updateHorizontalHeaderItem(self, column, type, parameter):
         """
         Updates a horizontal header item.
         """
-        number = column
-
-        item = self.horizontalHeaderItem(column)
-        item.setText(self.headerItemText(number, type, parameter))
+        self._model.relabelHeaderSection(Qt.Horizontal, column, type, parameter)
 
 
     def contextMenuVerticalHeader(self, pos):
         """
-        Creates a context menu for the vertical header.
+        Shows the context menu of the vertical header section at the position.
+        """
+        contextMenu = self.verticalHeaderMenu(self.verticalHeader().logicalIndexAt(pos))
+        contextMenu.exec_(self.verticalHeader().mapToGlobal(pos))
+
+
+    def verticalHeaderMenu(self, row):
+        """
+        Creates a context menu for the vertical header section of the row, or for no section if the row is -1.
         """
-        index = self.indexAt(pos)
 
         # Label
         actionLabelLetter = QAction('Letter', self)
         actionLabelLetter.setStatusTip('Change label to a capital letter')
         actionLabelLetter.setToolTip('Change label to a capital letter')
-        actionLabelLetter.triggered.connect( lambda: self.onActionLabelVerticalTriggered(index.row(), Preferences.HeaderLabel.Letter) )
+        actionLabelLetter.triggered.connect( lambda: self.onActionLabelVerticalTriggered(row, Preferences.HeaderLabel.Letter) )
 
         actionLabelNumber = QAction('Number', self)
         actionLabelNumber.setStatusTip('Change label to a decimal number')
         actionLabelNumber.setToolTip('Change label to a decimal number')
-        actionLabelNumber.triggered.connect( lambda: self.onActionLabelVerticalTriggered(index.row(), Preferences.HeaderLabel.Decimal) )
+        actionLabelNumber.triggered.connect( lambda: self.onActionLabelVerticalTriggered(row, Preferences.HeaderLabel.Decimal) )
 
         actionLabelCustom = QAction('Custom…', self)
         actionLabelCustom.setStatusTip('Change label to a user-defined text')
         actionLabelCustom.setToolTip('Change label to a user-defined text')
-        actionLabelCustom.triggered.connect( lambda: self.onActionLabelVerticalTriggered(index.row(), Preferences.HeaderLabel.Custom) )
+        actionLabelCustom.triggered.connect( lambda: self.onActionLabelVerticalTriggered(row, Preferences.HeaderLabel.Custom) )
 
         actionLabelLetters = QAction('Letters', self)
         actionLabelLetters.setStatusTip('Change all labels to capital letters')
@@ -390,9 +595,35 @@ class DocumentTable(QTableWidget):
         menuLabel.addAction(actionLabelNumbers)
         menuLabel.addAction(actionLabelCustoms)
 
+        # Insert & Remove
+        editable = self._model.isStructureEditable()
+
+        actionInsertRowBefore = QAction('Insert Row Before', self)
+        actionInsertRowBefore.setStatusTip('Insert an empty row before this row')
+        actionInsertRowBefore.setToolTip('Insert an empty row before this row')
+        actionInsertRowBefore.setEnabled(editable)
+        actionInsertRowBefore.triggered.connect( lambda: self._model.insertRows(max(row, 0), 1) )
+
+        actionInsertRowAfter = QAction('Insert Row After', self)
+        actionInsertRowAfter.setStatusTip('Insert an empty row after this row')
+        actionInsertRowAfter.setToolTip('Insert an empty row after this row')
+        actionInsertRowAfter.setEnabled(editable)
+        actionInsertRowAfter.triggered.connect( lambda: self._model.insertRows(row + 1, 1) )
+
+        actionRemoveRow = QAction('Remove Row', self)
+        actionRemoveRow.setStatusTip('Remove this row')
+        actionRemoveRow.setToolTip('Remove this row')
+        actionRemoveRow.setEnabled(editable and row >= 0)
+        actionRemoveRow.triggered.connect( lambda: self._model.removeRows(row, 1) )
+
         contextMenu = QMenu(self)
         contextMenu.addMenu(menuLabel)
-        contextMenu.exec_(self.mapToGlobal(pos))
+        contextMenu.addSeparator()
+        contextMenu.addAction(actionInsertRowBefore)
+        contextMenu.addAction(actionInsertRowAfter)
+        contextMenu.addAction(actionRemoveRow)
+
+        return contextMenu
 
 
     def onActionLabelVerticalTriggered(self, row, type):
@@ -403,6 +634,7 @@ class DocumentTable(QTableWidget):
 
         if type == Preferences.HeaderLabel.Custom:
 
+            from document_table_header_dialog import DocumentTableHeaderDialog
             documentTableHeaderDialog = DocumentTableHeaderDialog('vertical', row, self)
             documentTableHeaderDialog.setWindowTitle(f'Vertical Header Item')
 
@@ -423,6 +655,7 @@ class DocumentTable(QTableWidget):
 
         if type == Preferences.HeaderLabel.Custom:
 
+            from document_table_header_dialog import DocumentTableHeaderDialog
             documentTableHeaderDialog = DocumentTableHeaderDialog('vertical', -1, self)
             documentTableHeaderDialog.setWindowTitle(f'Vertical Header Items')
 
@@ -432,15 +665,23 @@ class DocumentTable(QTableWidget):
             else:
                 return
 
-        for row in range(0, self.rowCount()):
-            self.updateVerticalHeaderItem(row, type, parameter)
+        self._model.relabelHeader(Qt.Vertical, type, parameter)
 
 
     def updateVerticalHeaderItem(self, row, type, parameter):
         """
         Updates a vertical header item.
         """
-        number = row
+        self._model.relabelHeaderSection(Qt.Vertical, row, type, parameter)
+
+
+    def _applyColumnWidths(self):
+        """
+        Resizes the columns pending which have been read.
+        """
+        if not self._pendingColumnWidths:
+            return
 
-        item = self.verticalHeaderItem(row)
-        item.setText(self.headerItemText(number, type, parameter))
+        header = self.horizontalHeader()
+        for column in [column for column in self._pendingColumnWidths if column < header.count()]:
+            header.resizeSection(column, self._pendingColumnWidths.pop(column))
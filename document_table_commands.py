@@ -0,0 +1,286 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import sys
+from array import array
+from itertools import accumulate, chain
+
+
+def _packTexts(texts):
+
+    # Texts are kept joined in one string with the length of each text
+    texts = list(texts)
+    return "".join(texts), array("Q", map(len, texts))
+
+
+def _unpackTexts(packed):
+
+    joined, lengths = packed
+    ends = list(accumulate(lengths))
+
+    return list(map(joined.__getitem__, map(slice, chain((0,), ends), ends)))
+
+
+def _packedSize(packed):
+
+    return sys.getsizeof(packed[0]) + packed[1].itemsize * len(packed[1])
+
+
+def _sequenceSize(sequence):
+
+    return sequence.itemsize * len(sequence) if isinstance(sequence, array) else sys.getsizeof(sequence)
+
+
+class DocumentTableMacroCommand:
+
+    def __init__(self, text=""):
+
+        # Commands done and undone together, in the order they were pushed
+        self._commands = []
+        self._text = text
+
+
+    def append(self, command):
+
+        self._commands.append(command)
+
+
+    def commandCount(self):
+
+        return len(self._commands)
+
+
+    def text(self):
+
+        return self._text
+
+
+    def byteSize(self):
+
+        return sum(command.byteSize() for command in self._commands)
+
+
+    def redo(self):
+
+        for command in self._commands:
+            command.redo()
+
+
+    def undo(self):
+
+        for command in reversed(self._commands):
+            command.undo()
+
+
+class DocumentTableCellsCommand:
+
+    def __init__(self, model, rows, columns, texts, text=""):
+
+        # All cells of the rows and columns are set at once; the texts of the
+        # cells are given row by row. Rows are rows of the store; ranges are
+        # kept as they are.
+        self._model = model
+        self._rows = rows if isinstance(rows, range) else array("Q", rows)
+        self._columns = columns if isinstance(columns, range) else array("Q", columns)
+        self._texts = _packTexts(texts)
+        self._previousTexts = None
+        self._text = text
+
+
+    def text(self):
+
+        return self._text
+
+
+    def byteSize(self):
+
+        size = _sequenceSize(self._rows) + _sequenceSize(self._columns) + _packedSize(self._texts)
+
+        return size + (_packedSize(self._previousTexts) if self._previousTexts else 0)
+
+
+    def redo(self):
+
+        if self._previousTexts is None:
+            self._previousTexts = _packTexts(self._model.storeTexts(self._rows, self._columns))
+
+        self._model.setStoreTexts(self._rows, self._columns, _unpackTexts(self._texts))
+
+
+    def undo(self):
+
+        self._model.setStoreTexts(self._rows, self._columns, _unpackTexts(self._previousTexts))
+
+
+class DocumentTableRowsCommand:
+
+    def __init__(self, model, row, count, insert, text=""):
+
+        self._model = model
+        self._row = row
+        self._count = count
+        self._insert = insert
+        self._text = text
+
+        # Texts and header labels of removed rows
+        self._texts = None
+        self._labels = None
+
+
+    def text(self):
+
+        return self._text
+
+
+    def byteSize(self):
+
+        return (_packedSize(self._texts) if self._texts else 0) + 64 * len(self._labels or ())
+
+
+    def redo(self):
+
+        if self._insert:
+            self._model.insertStoreRows(self._row, self._count, self._labels)
+        else:
+            self._remove()
+
+
+    def undo(self):
+
+        if self._insert:
+            self._labels = self._model.removeStoreRows(self._row, self._count)
+        else:
+            rows = range(self._row, self._row + self._count)
+            self._model.insertStoreRows(self._row, self._count, self._labels)
+            self._model.setStoreTexts(rows, range(self._model.columnCount()), _unpackTexts(self._texts))
+
+
+    def _remove(self):
+
+        if self._texts is None:
+            rows = range(self._row, self._row + self._count)
+            self._texts = _packTexts(self._model.storeTexts(rows, range(self._model.columnCount())))
+
+        self._labels = self._model.removeStoreRows(self._row, self._count)
+
+
+class DocumentTableColumnsCommand:
+
+    def __init__(self, model, column, count, insert, text=""):
+
+        self._model = model
+        self._column = column
+        self._count = count
+        self._insert = insert
+        self._text = text
+
+        # Texts of removed columns, column by column, and their header labels
+        self._texts = None
+        self._labels = None
+
+
+    def text(self):
+
+        return self._text
+
+
+    def byteSize(self):
+
+        return (_packedSize(self._texts) if self._texts else 0) + 64 * len(self._labels or ())
+
+
+    def redo(self):
+
+        if self._insert:
+            self._model.insertStoreColumns(self._column, self._count, self._labels)
+        else:
+            self._remove()
+
+
+    def undo(self):
+
+        if self._insert:
+            self._labels = self._model.removeStoreColumns(self._column, self._count)
+        else:
+            texts = _unpackTexts(self._texts)
+            rowCount = len(texts) // self._count if self._count else 0
+            values = [texts[offset * rowCount:(offset + 1) * rowCount] for offset in range(self._count)]
+
+            self._model.insertStoreColumns(self._column, self._count, self._labels, values)
+
+
+    def _remove(self):
+
+        if self._texts is None:
+            columns = range(self._column, self._column + self._count)
+            self._texts = _packTexts(chain.from_iterable(self._model.storeColumnTexts(column) for column in columns))
+
+        self._labels = self._model.removeStoreColumns(self._column, self._count)
+
+
+class DocumentTableHeaderCommand:
+
+    def __init__(self, model, orientation, section, label, text=""):
+
+        # Section None relabels the whole header with the label (type,
+        # parameter); otherwise the label of one section of the store is set,
+        # with the type None for a plain text.
+        self._model = model
+        self._orientation = orientation
+        self._section = section
+        self._label = label
+        self._previousLabel = None
+        self._previousSections = None
+        self._text = text
+
+
+    def text(self):
+
+        return self._text
+
+
+    def byteSize(self):
+
+        return 256 + 64 * len(self._previousSections or ())
+
+
+    def redo(self):
+
+        labels = self._model.headerLabels(self._orientation)
+
+        if self._section is None:
+            if self._previousSections is None:
+                self._previousLabel = (labels.type(), labels.parameter())
+                self._previousSections = labels.sectionLabels()
+
+            self._model.setHeaderLabel(self._orientation, *self._label)
+        else:
+            if self._previousSections is None:
+                self._previousSections = {self._section: labels.sectionLabel(self._section)}
+
+            self._model.setHeaderStoreSectionLabel(self._orientation, self._section, self._label)
+
+
+    def undo(self):
+
+        if self._section is None:
+            self._model.setHeaderLabel(self._orientation, *self._previousLabel, self._previousSections)
+        else:
+            self._model.setHeaderStoreSectionLabel(self._orientation, self._section, self._previousSections[self._section])
@@ -0,0 +1,271 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import time
+from functools import lru_cache
+from itertools import product, repeat
+
+from performance_registry import PerformanceRegistry
+from preferences import Preferences
+
+
+class DocumentTableHeaderLabels:
+
+    # Labels are generated and cached in blocks of consecutive sections
+    BlockSize = 256
+
+    def __init__(self, type=Preferences.HeaderLabel.Decimal, parameter=None):
+
+        # One label scheme for all sections of a header; sections labeled
+        # individually are kept in a sparse dictionary.
+        self._type = type
+        self._parameter = parameter if parameter is not None else self.defaultParameter(type)
+        self._sections = {}
+
+        # Labels of the block of sections last requested
+        self._block = None
+        self._blockLabels = ()
+
+
+    def type(self):
+
+        return self._type
+
+
+    def parameter(self):
+
+        return self._parameter
+
+
+    def setLabel(self, type, parameter):
+
+        self._type = type
+        self._parameter = parameter
+        self._sections.clear()
+        self._block = None
+
+
+    def setSectionLabel(self, section, type, parameter):
+
+        self._sections[section] = (type, parameter)
+
+
+    def setSectionText(self, section, text):
+
+        self._sections[section] = (None, text)
+
+
+    def sectionLabel(self, section):
+
+        return self._sections.get(section)
+
+
+    def restoreSectionLabel(self, section, label):
+
+        # Label None removes the individual label of the section
+        if label is not None:
+            self._sections[section] = label
+        else:
+            self._sections.pop(section, None)
+
+
+    def insertSections(self, section, count, labels=None):
+
+        # Labels of later sections move with them; labels of the inserted
+        # sections are given by their offset.
+        self._sections = {number + count if number >= section else number: label for number, label in self._sections.items()}
+        if labels:
+            self._sections.update((section + offset, label) for offset, label in labels.items())
+
+
+    def removeSections(self, section, count):
+
+        # Returns the labels of the removed sections by their offset
+        removed = {number - section: label for number, label in self._sections.items() if section <= number < section + count}
+        self._sections = {number - count if number >= section + count else number: label for number, label in self._sections.items() if not section <= number < section + count}
+
+        return removed
+
+
+    def sectionLabels(self):
+
+        return dict(self._sections)
+
+
+    def setSectionLabels(self, sections):
+
+        self._sections = dict(sections)
+
+
+    def text(self, section):
+
+        if section in self._sections:
+            type, parameter = self._sections[section]
+            return parameter if type is None else self.itemText(section, type, parameter)
+
+        block, index = divmod(section, self.BlockSize)
+        if block != self._block:
+            start = time.perf_counter() if PerformanceRegistry.Enabled else None
+
+            first = block * self.BlockSize
+            self._blockLabels = self.itemTexts(self._type, self._parameter, first, first + self.BlockSize)
+            self._block = block
+
+            if start is not None:
+                PerformanceRegistry.instance().addTime("header.labels", time.perf_counter() - start)
+
+        return self._blockLabels[index]
+
+
+    @staticmethod
+    def itemText(number, type, parameter):
+
+        return DocumentTableHeaderLabels.itemTexts(type, parameter, number, number + 1)[0]
+
+
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def itemTexts(type, parameter, first, last):
+
+        # Returns the labels of the numbers first to last - 1 in one go
+        if type == Preferences.HeaderLabel.Custom:
+            return DocumentTableHeaderLabels.numbersToCustom(first, last, parameter)
+        elif type == Preferences.HeaderLabel.Binary:
+            return DocumentTableHeaderLabels.numbersToFormat(first, last, parameter, "b")
+        elif type == Preferences.HeaderLabel.Octal:
+            return DocumentTableHeaderLabels.numbersToFormat(first, last, parameter, "o")
+        elif type == Preferences.HeaderLabel.Decimal:
+            return tuple(map(str, range(first + int(parameter), last + int(parameter))))
+        elif type == Preferences.HeaderLabel.Hexadecimal:
+            return DocumentTableHeaderLabels.numbersToFormat(first, last, parameter, "X")
+        elif type == Preferences.HeaderLabel.Letter:
+            return DocumentTableHeaderLabels.numbersToLetters(first, last, parameter)
+        else:
+            return ("",) * (last - first)
+
+
+    @staticmethod
+    def numbersToFormat(first, last, prefix, spec):
+
+        format = prefix.replace("{", "{{").replace("}", "}}") + "{:" + spec + "}"
+
+        return tuple(map(format.format, range(first, last)))
+
+
+    @staticmethod
+    def numbersToCustom(first, last, parameter):
+
+        return tuple(map(parameter.replace, repeat("#"), map(str, range(first + 1, last + 1))))
+
+
+    @staticmethod
+    def numbersToLetters(first, last, parameter):
+
+        alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ" if parameter == "upper" else "abcdefghijklmnopqrstuvwxyz"
+        pairs = tuple(map("".join, product(alphabet, repeat=2)))
+        labels = []
+
+        # Labels of the same length enumerate all combinations of letters in
+        # order; they are built from a prefix and the table of letter pairs.
+        length = 1
+        start = 0
+        while start < last:
+            count = 26 ** length
+            if first < start + count:
+                lower = max(first - start, 0)
+                upper = min(last - start, count)
+
+                if length == 1:
+                    labels.extend(alphabet[lower:upper])
+                else:
+                    for high in range(lower // 676, (upper - 1) // 676 + 1):
+                        prefix = ""
+                        number = high
+                        for _ in range(length - 2):
+                            number, letter = divmod(number, 26)
+                            prefix = alphabet[letter] + prefix
+
+                        labels.extend(map(prefix.__add__, pairs[max(lower - high * 676, 0):upper - high * 676]))
+
+            start += count
+            length += 1
+
+        return tuple(labels)
+
+
+    @staticmethod
+    def defaultParameter(type):
+
+        if type == Preferences.HeaderLabel.Binary:
+            return "0b"
+        elif type == Preferences.HeaderLabel.Octal:
+            return "0o"
+        elif type == Preferences.HeaderLabel.Decimal:
+            return "1"
+        elif type == Preferences.HeaderLabel.Hexadecimal:
+            return "0x"
+        elif type == Preferences.HeaderLabel.Letter:
+            return "upper"
+        else:
+            return ""
+
+
+    @staticmethod
+    def numberToCustom(number, parameter):
+
+        return parameter.replace("#", str(number + 1))
+
+
+    @staticmethod
+    def numberToBinary(number, parameter):
+
+        return f"{parameter}{number:b}"
+
+
+    @staticmethod
+    def numberToOctal(number, parameter):
+
+        return f"{parameter}{number:o}"
+
+
+    @staticmethod
+    def numberToDecimal(number, parameter):
+
+        return f"{number + int(parameter)}"
+
+
+    @staticmethod
+    def numberToHexadecimal(number, parameter):
+
+        return f"{parameter}{number:X}"
+
+
+    @staticmethod
+    def numberToLetter(number, parameter):
+
+        chars = ""
+        number += 1
+
+        while number > 0:
+            number -= 1
+            chars = chr(number % 26 + 65) + chars
+            number //= 26
+
+        return chars.upper() if parameter == "upper" else chars.lower()
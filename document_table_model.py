@@ -0,0 +1,495 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import time
+from itertools import chain, product
+
+from PySide2.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
+
+from document_store import DocumentStore
+from document_table_commands import DocumentTableCellsCommand, DocumentTableColumnsCommand, DocumentTableHeaderCommand, DocumentTableRowsCommand
+from document_table_header_labels import DocumentTableHeaderLabels
+from document_table_undo_stack import DocumentTableUndoStack
+from performance_registry import PerformanceRegistry
+from preferences import Preferences
+
+
+class DocumentTableModel(QAbstractTableModel):
+
+    modifiedChanged = Signal(bool)
+    storeEdited = Signal(object)
+
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self._store = DocumentStore()
+        self._modified = False
+        self._locked = 0
+
+        # Views ask for the flags of every selected cell; all cells have the
+        # same flags, without and with editing
+        self._cellFlags = None
+
+        # Rows of the store in the order shown, and the shown row of each
+        # row of the store; None shows the rows as stored
+        self._rowOrder = None
+        self._rowPositions = None
+
+        # Header labels are computed on demand from one scheme per header
+        self._horizontalHeaderLabels = DocumentTableHeaderLabels(Preferences.HeaderLabel.Letter)
+        self._verticalHeaderLabels = DocumentTableHeaderLabels(Preferences.HeaderLabel.Decimal)
+
+        # Edits are done through commands which can be undone; the document is
+        # modified unless the commands done lead back to the clean state.
+        self._undoStack = DocumentTableUndoStack(self)
+        self._undoStack.cleanChanged.connect(lambda clean: self.setModified(not clean))
+
+
+    def store(self):
+
+        return self._store
+
+
+    def setStore(self, store):
+
+        self.beginResetModel()
+        self._store = store
+        self._rowOrder = None
+        self._rowPositions = None
+        self._horizontalHeaderLabels.setSectionLabels({})
+        self._verticalHeaderLabels.setSectionLabels({})
+        self.endResetModel()
+
+        self._undoStack.clear()
+        self.setModified(False)
+
+
+    def undoStack(self):
+
+        return self._undoStack
+
+
+    def setModified(self, modified):
+
+        if not modified:
+            self._undoStack.setClean()
+
+        if modified != self._modified:
+            self._modified = modified
+            self.modifiedChanged.emit(modified)
+
+
+    def isModified(self):
+
+        return self._modified
+
+
+    def setLocked(self, locked):
+
+        # Cells cannot be edited while the store is read by worker threads;
+        # every lock has to be released.
+        self._locked += 1 if locked else -1
+
+
+    def isLocked(self):
+
+        return self._locked > 0
+
+
+    def setRowOrder(self, rowOrder, rowPositions):
+
+        self.beginResetModel()
+        self._rowOrder = rowOrder
+        self._rowPositions = rowPositions
+        self.endResetModel()
+
+
+    def rowOrder(self):
+
+        return self._rowOrder
+
+
+    def storeRow(self, row):
+
+        return self._rowOrder[row] if self._rowOrder is not None else row
+
+
+    def viewRow(self, storeRow):
+
+        return self._rowPositions[storeRow] if self._rowPositions is not None else storeRow
+
+
+    def rowCount(self, parent=QModelIndex()):
+
+        if parent.isValid():
+            return 0
+
+        return len(self._rowOrder) if self._rowOrder is not None else self._store.rowCount()
+
+
+    def columnCount(self, parent=QModelIndex()):
+
+        return self._store.columnCount() if not parent.isValid() else 0
+
+
+    def flags(self, index):
+
+        if not index.isValid():
+            return super().flags(index)
+
+        if self._cellFlags is None:
+            flags = super().flags(index)
+            self._cellFlags = (flags, flags | Qt.ItemIsEditable)
+
+        return self._cellFlags[self._locked <= 0 and not self._store.isReadOnly()]
+
+
+    def data(self, index, role=Qt.DisplayRole):
+
+        # Display strings are materialised only for the cells requested by the view
+        if role == Qt.DisplayRole or role == Qt.EditRole:
+            return self._store.value(self.storeRow(index.row()), index.column())
+
+        return None
+
+
+    def setData(self, index, value, role=Qt.EditRole):
+
+        if role != Qt.EditRole or not index.isValid() or self._store.isReadOnly() or self.isLocked():
+            return False
+
+        row = self.storeRow(index.row())
+
+        text = str(value)
+        if text == self._store.value(row, index.column()):
+            return False
+
+        self._undoStack.push(DocumentTableCellsCommand(self, [row], [index.column()], [text], self.tr("Edit Cell")))
+        return True
+
+
+    def storeTexts(self, rows, columns):
+
+        # Returns the texts of the cells row by row; rows are rows of the store
+        if isinstance(rows, range) and rows.step == 1:
+            columnValues = [self._store.columnValues(column, rows.start, rows.stop) for column in columns]
+            return list(chain.from_iterable(zip(*columnValues)))
+
+        return [self._store.value(row, column) for row in rows for column in columns]
+
+
+    def storeColumnTexts(self, column):
+
+        return self._store.columnValues(column)
+
+
+    def setStoreTexts(self, rows, columns, texts):
+
+        if isinstance(rows, range) and rows.step == 1:
+            # Consecutive rows are set column by column
+            for offset, column in enumerate(columns):
+                self._store.setColumnValues(column, rows.start, texts[offset::len(columns)])
+        else:
+            for (row, column), text in zip(product(rows, columns), texts):
+                self._store.setValue(row, column, text)
+
+        # One change is reported for the range of cells shown
+        viewRows = [row for row in map(self.viewRow, rows) if row >= 0] if self._rowPositions is not None else rows
+        if len(viewRows) and len(columns):
+            topLeft = self.index(min(viewRows), min(columns))
+            bottomRight = self.index(max(viewRows), max(columns))
+            self.dataChanged.emit(topLeft, bottomRight, [Qt.DisplayRole, Qt.EditRole])
+
+        self.storeEdited.emit(("setTexts", rows, columns, texts))
+
+
+    def pasteRows(self, row, column, rows):
+
+        # Cells are pasted from the row and column on as one edit; rows and
+        # columns are appended as needed unless the rows are shown in another
+        # order. Returns the number of cells pasted.
+        if not rows or self._store.isReadOnly() or self.isLocked():
+            return 0
+
+        rowCount = len(rows)
+        columnCount = max(map(len, rows))
+
+        if self.isStructureEditable():
+            appendRows = row + rowCount - self._store.rowCount()
+            appendColumns = column + columnCount - self._store.columnCount()
+        else:
+            appendRows = appendColumns = 0
+            rowCount = min(rowCount, self.rowCount() - row)
+            columnCount = min(columnCount, self.columnCount() - column)
+            if rowCount <= 0 or columnCount <= 0:
+                return 0
+
+        texts = []
+        for values in rows[:rowCount]:
+            values = values[:columnCount]
+            texts.extend(values)
+            if len(values) < columnCount:
+                texts.extend([""] * (columnCount - len(values)))
+
+        storeRows = range(row, row + rowCount) if self._rowOrder is None else list(map(self.storeRow, range(row, row + rowCount)))
+        text = self.tr("Paste")
+
+        self._undoStack.beginMacro(text)
+        if appendRows > 0:
+            self._undoStack.push(DocumentTableRowsCommand(self, self._store.rowCount(), appendRows, True, text))
+        if appendColumns > 0:
+            self._undoStack.push(DocumentTableColumnsCommand(self, self._store.columnCount(), appendColumns, True, text))
+        self._undoStack.push(DocumentTableCellsCommand(self, storeRows, range(column, column + columnCount), texts, text))
+        self._undoStack.endMacro()
+
+        return rowCount * columnCount
+
+
+    def isStructureEditable(self):
+
+        # Rows and columns cannot be inserted or removed while rows are shown
+        # in another order
+        return not self._store.isReadOnly() and not self.isLocked() and self._rowOrder is None
+
+
+    def insertRows(self, row, count, parent=QModelIndex()):
+
+        if parent.isValid() or count < 1 or not 0 <= row <= self._store.rowCount() or not self.isStructureEditable():
+            return False
+
+        text = self.tr("Insert Row") if count == 1 else self.tr("Insert {0} Rows").format(count)
+        self._undoStack.push(DocumentTableRowsCommand(self, row, count, True, text))
+        return True
+
+
+    def removeRows(self, row, count, parent=QModelIndex()):
+
+        if parent.isValid() or count < 1 or row < 0 or row + count > self._store.rowCount() or not self.isStructureEditable():
+            return False
+
+        text = self.tr("Remove Row") if count == 1 else self.tr("Remove {0} Rows").format(count)
+        self._undoStack.push(DocumentTableRowsCommand(self, row, count, False, text))
+        return True
+
+
+    def insertColumns(self, column, count, parent=QModelIndex()):
+
+        if parent.isValid() or count < 1 or not 0 <= column <= self._store.columnCount() or not self.isStructureEditable():
+            return False
+
+        text = self.tr("Insert Column") if count == 1 else self.tr("Insert {0} Columns").format(count)
+        self._undoStack.push(DocumentTableColumnsCommand(self, column, count, True, text))
+        return True
+
+
+    def removeColumns(self, column, count, parent=QModelIndex()):
+
+        if parent.isValid() or count < 1 or column < 0 or column + count > self._store.columnCount() or not self.isStructureEditable():
+            return False
+
+        text = self.tr("Remove Column") if count == 1 else self.tr("Remove {0} Columns").format(count)
+        self._undoStack.push(DocumentTableColumnsCommand(self, column, count, False, text))
+        return True
+
+
+    def insertStoreRows(self, row, count, labels=None):
+
+        if self._rowOrder is not None:
+            self.setRowOrder(None, None)
+
+        self.beginInsertRows(QModelIndex(), row, row + count - 1)
+        self._store.insertRows(row, count)
+        self._verticalHeaderLabels.insertSections(row, count, labels)
+        self.endInsertRows()
+
+        self.storeEdited.emit(("insertRows", row, count))
+
+
+    def removeStoreRows(self, row, count):
+
+        if self._rowOrder is not None:
+            self.setRowOrder(None, None)
+
+        self.beginRemoveRows(QModelIndex(), row, row + count - 1)
+        self._store.removeRows(row, count)
+        labels = self._verticalHeaderLabels.removeSections(row, count)
+        self.endRemoveRows()
+
+        self.storeEdited.emit(("removeRows", row, count))
+
+        return labels
+
+
+    def insertStoreColumns(self, column, count, labels=None, values=None):
+
+        self.beginInsertColumns(QModelIndex(), column, column + count - 1)
+        self._store.insertColumns(column, count, values)
+        self._horizontalHeaderLabels.insertSections(column, count, labels)
+        self.endInsertColumns()
+
+        self.storeEdited.emit(("insertColumns", column, count, values))
+
+
+    def removeStoreColumns(self, column, count):
+
+        self.beginRemoveColumns(QModelIndex(), column, column + count - 1)
+        self._store.removeColumns(column, count)
+        labels = self._horizontalHeaderLabels.removeSections(column, count)
+        self.endRemoveColumns()
+
+        self.storeEdited.emit(("removeColumns", column, count))
+
+        return labels
+
+
+    def applyStoreEdit(self, edit):
+
+        # Edits reported by storeEdited() are applied again, outside of the
+        # history of commands; invalid edits raise ValueError.
+        name, *arguments = edit
+
+        if name == "setTexts":
+            rows, columns, texts = arguments
+            if len(texts) != len(rows) * len(columns):
+                raise ValueError("Texts do not fit the cells")
+            if rows and not 0 <= min(rows) <= max(rows) < self._store.rowCount() or columns and not 0 <= min(columns) <= max(columns) < self._store.columnCount():
+                raise ValueError("Cells out of range")
+            self.setStoreTexts(rows, columns, texts)
+        elif name == "insertRows" and 0 <= arguments[0] <= self._store.rowCount() and arguments[1] > 0:
+            self.insertStoreRows(*arguments)
+        elif name == "removeRows" and arguments[0] >= 0 and arguments[1] > 0 and sum(arguments) <= self._store.rowCount():
+            self.removeStoreRows(*arguments)
+        elif name == "insertColumns" and 0 <= arguments[0] <= self._store.columnCount() and arguments[1] > 0:
+            self.insertStoreColumns(arguments[0], arguments[1], None, arguments[2])
+        elif name == "removeColumns" and arguments[0] >= 0 and arguments[1] > 0 and sum(arguments) <= self._store.columnCount():
+            self.removeStoreColumns(*arguments)
+        else:
+            raise ValueError("Invalid edit: {0}".format(name))
+
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+
+        if role == Qt.DisplayRole:
+            # Rows keep their labels when they are shown in another order
+            return self.headerLabels(orientation).text(section if orientation == Qt.Horizontal else self.storeRow(section))
+        elif role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+
+        return None
+
+
+    def setHeaderData(self, section, orientation, value, role=Qt.EditRole):
+
+        if role != Qt.EditRole and role != Qt.DisplayRole:
+            return False
+
+        section = section if orientation == Qt.Horizontal else self.storeRow(section)
+        self._undoStack.push(DocumentTableHeaderCommand(self, orientation, section, (None, str(value)), self.tr("Relabel Header Item")))
+        return True
+
+
+    def headerLabels(self, orientation):
+
+        return self._horizontalHeaderLabels if orientation == Qt.Horizontal else self._verticalHeaderLabels
+
+
+    def setHeaderLabel(self, orientation, type, parameter, sections=None):
+
+        start = time.perf_counter() if PerformanceRegistry.Enabled else None
+
+        labels = self.headerLabels(orientation)
+        labels.setLabel(type, parameter)
+        if sections:
+            labels.setSectionLabels(sections)
+
+        count = self.columnCount() if orientation == Qt.Horizontal else self.rowCount()
+        if count > 0:
+            self.headerDataChanged.emit(orientation, 0, count - 1)
+
+        if start is not None:
+            PerformanceRegistry.instance().addTime("header.relabel", time.perf_counter() - start)
+
+
+    def setHeaderStoreSectionLabel(self, orientation, section, label):
+
+        self.headerLabels(orientation).restoreSectionLabel(section, label)
+
+        section = section if orientation == Qt.Horizontal else self.viewRow(section)
+        if section >= 0:
+            self.headerDataChanged.emit(orientation, section, section)
+
+
+    def relabelHeader(self, orientation, type, parameter):
+
+        # Relabeling all items is one command, whatever the number of sections
+        text = self.tr("Relabel Horizontal Header") if orientation == Qt.Horizontal else self.tr("Relabel Vertical Header")
+        self._undoStack.push(DocumentTableHeaderCommand(self, orientation, None, (type, parameter), text))
+
+
+    def relabelHeaderSection(self, orientation, section, type, parameter):
+
+        section = section if orientation == Qt.Horizontal else self.storeRow(section)
+        self._undoStack.push(DocumentTableHeaderCommand(self, orientation, section, (type, parameter), self.tr("Relabel Header Item")))
+
+
+    def resize(self, rowCount, columnCount):
+
+        self.setStore(DocumentStore(rowCount, columnCount))
+
+
+    def appendRows(self, rows):
+
+        if not rows:
+            return
+
+        if self._rowOrder is not None:
+            self.setRowOrder(None, None)
+
+        columnCount = max(len(values) for values in rows)
+        if columnCount > self._store.columnCount():
+            self.beginInsertColumns(QModelIndex(), self._store.columnCount(), columnCount - 1)
+            self._store.insertColumns(self._store.columnCount(), columnCount - self._store.columnCount())
+            self.endInsertColumns()
+
+        row = self._store.rowCount()
+        self.beginInsertRows(QModelIndex(), row, row + len(rows) - 1)
+        self._store.appendRows(rows)
+        self.endInsertRows()
+
+
+    def appendRowOffsets(self, offsets):
+
+        if not offsets:
+            return
+
+        if self._rowOrder is not None:
+            self.setRowOrder(None, None)
+
+        row = self._store.rowCount()
+        self.beginInsertRows(QModelIndex(), row, row + len(offsets) - 1)
+        self._store.appendRowOffsets(offsets)
+        self.endInsertRows()
+
+        columnCount = self._store.sampleColumnCount(row)
+        if columnCount > self._store.columnCount():
+            self.beginInsertColumns(QModelIndex(), self._store.columnCount(), columnCount - 1)
+            self._store.setColumnCount(columnCount)
+            self.endInsertColumns()
@@ -0,0 +1,243 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from PySide2.QtCore import QObject, Signal
+
+from document_table_commands import DocumentTableMacroCommand
+
+
+class DocumentTableUndoStack(QObject):
+
+    canUndoChanged = Signal(bool)
+    canRedoChanged = Signal(bool)
+    undoTextChanged = Signal(str)
+    redoTextChanged = Signal(str)
+    cleanChanged = Signal(bool)
+    indexChanged = Signal(int)
+
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Commands done are before the index, commands undone after it; the
+        # clean index is -1 once the clean state can no longer be reached.
+        self._commands = []
+        self._index = 0
+        self._cleanIndex = 0
+
+        # The oldest commands are dropped while the commands take more memory
+        # than the limit; the newest command is always kept.
+        self._byteLimit = 64 * 1024 * 1024
+        self._byteSize = 0
+
+        # Commands pushed between beginMacro() and endMacro() are done at once
+        # and pushed as one command at the end
+        self._macro = None
+
+
+    def push(self, command):
+
+        if self._macro is not None:
+            command.redo()
+            self._macro.append(command)
+            return
+
+        command.redo()
+        self._append(command)
+
+
+    def beginMacro(self, text):
+
+        self._macro = DocumentTableMacroCommand(text)
+
+
+    def endMacro(self):
+
+        macro = self._macro
+        self._macro = None
+
+        if macro.commandCount():
+            self._append(macro)
+
+
+    def undo(self):
+
+        if not self.canUndo():
+            return
+
+        state = self._state()
+
+        self._index -= 1
+        self._commands[self._index].undo()
+
+        self._emitChanges(state)
+
+
+    def redo(self):
+
+        if not self.canRedo():
+            return
+
+        state = self._state()
+
+        self._commands[self._index].redo()
+        self._index += 1
+
+        self._emitChanges(state)
+
+
+    def clear(self):
+
+        state = self._state()
+
+        self._commands = []
+        self._index = 0
+        self._cleanIndex = 0
+        self._byteSize = 0
+
+        self._emitChanges(state)
+
+
+    def canUndo(self):
+
+        return self._index > 0
+
+
+    def canRedo(self):
+
+        return self._index < len(self._commands)
+
+
+    def undoText(self):
+
+        return self._commands[self._index - 1].text() if self.canUndo() else ""
+
+
+    def redoText(self):
+
+        return self._commands[self._index].text() if self.canRedo() else ""
+
+
+    def count(self):
+
+        return len(self._commands)
+
+
+    def index(self):
+
+        return self._index
+
+
+    def setClean(self):
+
+        state = self._state()
+
+        self._cleanIndex = self._index
+
+        self._emitChanges(state)
+
+
+    def resetClean(self):
+
+        # No state reached by undoing or redoing is clean any longer
+        state = self._state()
+
+        self._cleanIndex = -1
+
+        self._emitChanges(state)
+
+
+    def isClean(self):
+
+        return self._cleanIndex == self._index
+
+
+    def setByteLimit(self, byteLimit):
+
+        state = self._state()
+
+        self._byteLimit = byteLimit
+        self._evict()
+
+        self._emitChanges(state)
+
+
+    def byteLimit(self):
+
+        return self._byteLimit
+
+
+    def byteSize(self):
+
+        return self._byteSize
+
+
+    def _append(self, command):
+
+        state = self._state()
+
+        for undone in self._commands[self._index:]:
+            self._byteSize -= undone.byteSize()
+        del self._commands[self._index:]
+        if self._cleanIndex > self._index:
+            self._cleanIndex = -1
+
+        self._commands.append(command)
+        self._index += 1
+        self._byteSize += command.byteSize()
+        self._evict()
+
+        self._emitChanges(state)
+
+
+    def _evict(self):
+
+        count = 0
+        while self._byteSize > self._byteLimit and len(self._commands) - count > 1 and count < self._index:
+            self._byteSize -= self._commands[count].byteSize()
+            count += 1
+
+        if count:
+            del self._commands[:count]
+            self._index -= count
+            self._cleanIndex = self._cleanIndex - count if self._cleanIndex >= count else -1
+
+
+    def _state(self):
+
+        return (self.canUndo(), self.canRedo(), self.undoText(), self.redoText(), self.isClean(), self._index)
+
+
+    def _emitChanges(self, state):
+
+        canUndo, canRedo, undoText, redoText, clean, index = state
+
+        if self.canUndo() != canUndo:
+            self.canUndoChanged.emit(self.canUndo())
+        if self.canRedo() != canRedo:
+            self.canRedoChanged.emit(self.canRedo())
+        if self.undoText() != undoText:
+            self.undoTextChanged.emit(self.undoText())
+        if self.redoText() != redoText:
+            self.redoTextChanged.emit(self.redoText())
+        if self.isClean() != clean:
+            self.cleanChanged.emit(self.isClean())
+        if self._index != index:
+            self.indexChanged.emit(self._index)
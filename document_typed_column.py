@@ -0,0 +1,380 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import math
+import re
+from array import array
+from bisect import bisect_left
+from datetime import date
+from itertools import repeat
+from operator import eq, ne
+
+from document_column_type import DocumentColumnType
+
+
+class DocumentTypedColumn:
+
+    # Empty cells of numeric and date columns are stored as sentinel values
+    IntegerBlank = -2 ** 63
+    FloatBlank = math.nan
+    DateBlank = 0
+
+    MaximumCategories = 65535
+
+    BooleanTexts = [("true", "false"), ("True", "False"), ("TRUE", "FALSE"), ("yes", "no"), ("Yes", "No"), ("YES", "NO")]
+
+    _fixedPointPattern = re.compile(r"-?\d+\.(\d+)")
+
+
+    def __init__(self, count=0):
+
+        # Cells are stored as typed values and formatted back to text on
+        # demand; a text is only accepted if it is formatted back exactly.
+        # The type is inferred from the first values which are not empty.
+        self._type = DocumentColumnType.Blank
+        self._count = count
+        self._values = None
+
+        # Float: format specification of the values, or None for the shortest representation
+        self._format = None
+
+        # Boolean and Categorical: texts of the values and their codes
+        self._categories = []
+        self._codes = {}
+
+
+    def __len__(self):
+
+        return self._count if self._values is None else len(self._values)
+
+
+    def type(self):
+
+        return self._type
+
+
+    def byteSize(self):
+
+        if self._values is None:
+            return 0
+
+        return self._values.itemsize * len(self._values) + sum(map(len, self._categories))
+
+
+    def value(self, index):
+
+        if self._values is None:
+            return ""
+
+        return self._formatValues(self._values[index:index + 1])[0]
+
+
+    def values(self, first=0, last=None):
+
+        if self._values is None:
+            last = self._count if last is None else min(last, self._count)
+            return [""] * max(last - first, 0)
+
+        return self._formatValues(self._values[first:last])
+
+
+    def sortKeys(self, first=0, last=None):
+
+        # Keys compare like the typed values; empty cells have the key None
+        if self._values is None:
+            last = self._count if last is None else min(last, self._count)
+            return [None] * max(last - first, 0)
+
+        values = self._values[first:last]
+
+        if self._type == DocumentColumnType.Integer:
+            keys = values.tolist()
+            if self.IntegerBlank in values:
+                keys = [key if key != self.IntegerBlank else None for key in keys]
+
+        elif self._type == DocumentColumnType.Float:
+            keys = values.tolist()
+            if any(map(math.isnan, keys)):
+                keys = [key if key == key else None for key in keys]
+
+        elif self._type == DocumentColumnType.Date:
+            keys = values.tolist()
+            if self.DateBlank in values:
+                keys = [key if key != self.DateBlank else None for key in keys]
+
+        else:
+            # Codes are ranked by the texts of their categories
+            ranks = [0] * len(self._categories)
+            for rank, code in enumerate(sorted(range(len(self._categories)), key=self._categories.__getitem__)):
+                ranks[code] = rank
+            if "" in self._codes:
+                ranks[self._codes[""]] = None
+
+            keys = list(map(ranks.__getitem__, values))
+
+        return keys
+
+
+    def matchText(self, text, first=0, last=None):
+
+        # Cells equal to the text have the typed value of the text
+        if self._values is None:
+            last = self._count if last is None else min(last, self._count)
+            return bytes([not text]) * max(last - first, 0)
+
+        values = self._values[first:last]
+
+        if self._type in (DocumentColumnType.Boolean, DocumentColumnType.Categorical):
+            code = self._codes.get(text)
+            return bytes(map(eq, values, repeat(code))) if code is not None else bytes(len(values))
+        elif self._type == DocumentColumnType.Float and not text:
+            return bytes(map(ne, values, values))
+
+        encoded = self._encodeValues([text])
+        return bytes(map(eq, values, repeat(encoded[0]))) if encoded is not None else bytes(len(values))
+
+
+    def matchValues(self, function, first=0, last=None):
+
+        # Categories are matched once instead of once per cell
+        if self._values is not None and self._type in (DocumentColumnType.Boolean, DocumentColumnType.Categorical):
+            flags = function(self._categories)
+            return bytes(map(flags.__getitem__, self._values[first:last]))
+
+        return function(self.values(first, last))
+
+
+    def sortKey(self, text):
+
+        # Returns the key of a text among the keys of the column; raises
+        # ValueError if the text cannot be compared with them
+        if self._type in (DocumentColumnType.Integer, DocumentColumnType.Float):
+            return float(text)
+        elif self._type == DocumentColumnType.Date:
+            return date.fromisoformat(text).toordinal()
+        elif self._type in (DocumentColumnType.Boolean, DocumentColumnType.Categorical):
+            # Texts which are no category fall between the ranks of their neighbors
+            categories = sorted(self._categories)
+            rank = bisect_left(categories, text)
+            return rank if rank < len(categories) and categories[rank] == text else rank - 0.5
+
+        return text
+
+
+    def setValue(self, index, text):
+
+        if self._values is None:
+            if not text:
+                return True
+            if not self._infer([text]):
+                return False
+            self._values = array(self._values.typecode, repeat(self._blankValue(), self._count))
+
+        values = self._encodeValues([text])
+        if values is None:
+            return False
+
+        self._values[index] = values[0]
+        return True
+
+
+    def setValues(self, index, texts):
+
+        # Sets consecutive cells at once; the type is inferred from the
+        # first text which is not empty if the column is still blank.
+        texts = list(texts)
+
+        if self._values is None:
+            first = next((offset for offset, text in enumerate(texts) if text), None)
+            if first is None:
+                return True
+            if not self.setValue(index + first, texts[first]):
+                return False
+
+        values = self._encodeValues(texts)
+        if values is None:
+            return False
+
+        self._values[index:index + len(values)] = values
+        return True
+
+
+    def appendValues(self, values):
+
+        values = list(values)
+
+        if self._values is None:
+            if not any(values):
+                self._count += len(values)
+                return True
+
+            # The column gets the type of the values appended first
+            count = self._count
+            if not self._infer(values):
+                return False
+            if count:
+                self._values = array(self._values.typecode, repeat(self._blankValue(), count)) + self._values
+            return True
+
+        encoded = self._encodeValues(values)
+        if encoded is None:
+            return False
+
+        self._values += encoded
+        return True
+
+
+    def insertValues(self, index, count):
+
+        if self._values is None:
+            self._count += count
+            return True
+
+        blank = self._blankValue()
+        if blank is None:
+            return False
+
+        self._values[index:index] = array(self._values.typecode, repeat(blank, count))
+        return True
+
+
+    def removeValues(self, index, count):
+
+        if self._values is None:
+            self._count -= len(range(self._count)[index:index + count])
+        else:
+            del self._values[index:index + count]
+
+
+    def _infer(self, values):
+
+        texts = [text for text in dict.fromkeys(values) if text]
+
+        for type in (DocumentColumnType.Boolean, DocumentColumnType.Integer, DocumentColumnType.Float, DocumentColumnType.Date, DocumentColumnType.Categorical):
+
+            if type == DocumentColumnType.Boolean and not self._isBoolean(texts):
+                continue
+            if type == DocumentColumnType.Categorical and len(texts) * 4 > len(values):
+                continue
+
+            self._type = type
+            self._categories = []
+            self._codes = {}
+
+            # Floats are formatted with a fixed number of decimals, if the
+            # first one has trailing zeros, or in their shortest representation
+            formats = [None]
+            if type == DocumentColumnType.Float:
+                match = self._fixedPointPattern.fullmatch(texts[0])
+                if match:
+                    formats.insert(0, f".{len(match.group(1))}f")
+
+            for self._format in formats:
+                encoded = self._encodeValues(values)
+                if encoded is not None:
+                    self._values = encoded
+                    return True
+
+        self._type = DocumentColumnType.Blank
+        return False
+
+
+    def _isBoolean(self, texts):
+
+        texts = set(texts) - {""}
+
+        return any(texts <= set(pair) for pair in self.BooleanTexts)
+
+
+    def _blankValue(self):
+
+        if self._type == DocumentColumnType.Integer:
+            return self.IntegerBlank
+        elif self._type == DocumentColumnType.Float:
+            return self.FloatBlank
+        elif self._type == DocumentColumnType.Date:
+            return self.DateBlank
+
+        codes = self._encodeCategories([""])
+        return codes[0] if codes is not None else None
+
+
+    def _encodeValues(self, texts):
+
+        # Returns the typed values of the texts, or None if a text does not fit
+        try:
+            if self._type == DocumentColumnType.Integer:
+                values = array("q", map(int, texts) if "" not in texts else (int(text) if text else self.IntegerBlank for text in texts))
+            elif self._type == DocumentColumnType.Float:
+                values = array("d", map(float, texts) if "" not in texts else (float(text) if text else self.FloatBlank for text in texts))
+            elif self._type == DocumentColumnType.Date:
+                values = array("i", (date.fromisoformat(text).toordinal() if text else self.DateBlank for text in texts))
+            else:
+                values = self._encodeCategories(texts)
+                if values is None and self._type == DocumentColumnType.Boolean:
+                    # Other texts turn a boolean column into a categorical one
+                    self._type = DocumentColumnType.Categorical
+                    values = self._encodeCategories(texts)
+                return values
+
+        except (ValueError, OverflowError):
+            return None
+
+        return values if self._formatValues(values) == texts else None
+
+
+    def _encodeCategories(self, texts):
+
+        for text in dict.fromkeys(texts):
+            if text not in self._codes:
+                if len(self._categories) >= self.MaximumCategories:
+                    return None
+                if self._type == DocumentColumnType.Boolean and not self._isBoolean(self._categories + [text]):
+                    return None
+
+                self._codes[text] = len(self._categories)
+                self._categories.append(text)
+
+        return array("H", map(self._codes.__getitem__, texts))
+
+
+    def _formatValues(self, values):
+
+        if self._type == DocumentColumnType.Integer:
+            texts = list(map(str, values))
+            if self.IntegerBlank in values:
+                blank = str(self.IntegerBlank)
+                texts = [text if text != blank else "" for text in texts]
+
+        elif self._type == DocumentColumnType.Float:
+            texts = list(map(format, values, repeat(self._format))) if self._format else list(map(repr, values))
+            if "nan" in texts:
+                texts = [text if text != "nan" else "" for text in texts]
+
+        elif self._type == DocumentColumnType.Date:
+            if self.DateBlank not in values:
+                texts = list(map(date.isoformat, map(date.fromordinal, values)))
+            else:
+                texts = [date.fromordinal(value).isoformat() if value else "" for value in values]
+
+        else:
+            texts = list(map(self._categories.__getitem__, values))
+
+        return texts
@@ -0,0 +1,109 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import json
+import os
+from collections import OrderedDict
+
+from settings_cache import SettingsCache
+
+
+class DocumentViewStates:
+
+    # States of the documents used least recently are dropped beyond this
+    MaximumCount = 200
+
+    def __init__(self):
+
+        # States by canonical name, least recently used first; a state applies
+        # as long as the size and modification time of the document match.
+        self._states = OrderedDict()
+
+
+    def state(self, canonicalName):
+
+        entry = self._states.get(canonicalName)
+        if entry is None:
+            return None
+
+        if (entry.get("size"), entry.get("modified")) != self._fileStatus(canonicalName):
+            del self._states[canonicalName]
+            return None
+
+        self._states.move_to_end(canonicalName)
+
+        return entry["state"]
+
+
+    def setState(self, canonicalName, state):
+
+        status = self._fileStatus(canonicalName)
+        if status is None:
+            return
+
+        self._states[canonicalName] = {"size": status[0], "modified": status[1], "state": state}
+        self._states.move_to_end(canonicalName)
+
+        while len(self._states) > self.MaximumCount:
+            self._states.popitem(last=False)
+
+
+    def removeState(self, canonicalName):
+
+        self._states.pop(canonicalName, None)
+
+
+    def count(self):
+
+        return len(self._states)
+
+
+    def loadSettings(self):
+
+        settings = SettingsCache.instance()
+
+        try:
+            states = json.loads(settings.value("DocumentViewStates", "[]"))
+        except (TypeError, ValueError):
+            states = []
+
+        self._states.clear()
+        for entry in states if isinstance(states, list) else []:
+            if isinstance(entry, dict) and isinstance(entry.get("document"), str):
+                self._states[entry.pop("document")] = entry
+
+
+    def saveSettings(self):
+
+        settings = SettingsCache.instance()
+
+        # All states are kept in one compact value, least recently used first
+        states = [dict(entry, document=canonicalName) for canonicalName, entry in self._states.items()]
+        settings.setValue("DocumentViewStates", json.dumps(states, ensure_ascii=False, separators=(",", ":")))
+
+
+    def _fileStatus(self, canonicalName):
+
+        try:
+            status = os.stat(canonicalName)
+        except OSError:
+            return None
+
+        return status.st_size, status.st_mtime_ns
@@ -0,0 +1,164 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import codecs
+import csv
+import io
+import os
+import secrets
+
+
+class DocumentWriter:
+
+    def __init__(self, fileName, store, delimiter=",", quoteChar="\"", encoding="utf-8"):
+
+        self._fileName = fileName
+        self._store = store
+        self._delimiter = delimiter
+        self._quoteChar = quoteChar
+        self._encoding = encoding
+
+        # Rows are serialised and written in blocks
+        self._blockSize = 8192
+
+        self._rowsWritten = 0
+        self._bytesWritten = 0
+
+
+    def fileName(self):
+
+        return self._fileName
+
+
+    def setBlockSize(self, blockSize):
+
+        self._blockSize = blockSize
+
+
+    def blockSize(self):
+
+        return self._blockSize
+
+
+    def rowsWritten(self):
+
+        return self._rowsWritten
+
+
+    def rowCount(self):
+
+        return self._store.rowCount()
+
+
+    def bytesWritten(self):
+
+        return self._bytesWritten
+
+
+    def writeBlocks(self):
+
+        rowCount = self._store.rowCount()
+        blocks = (self._store.rows(first, min(first + self._blockSize, rowCount)) for first in range(0, rowCount, self._blockSize))
+
+        return self.writeRowBlocks(blocks)
+
+
+    def writeRowBlocks(self, blocks):
+
+        # Yields after each block of rows written. The document is written to
+        # a temporary file next to the target, which replaces the target only
+        # once all rows have been written and synced to disk; if writing fails
+        # or stops early, the target is left untouched.
+        directory = os.path.dirname(os.path.abspath(self._fileName))
+        descriptor, temporaryName = self._createTemporaryFile(directory)
+
+        committed = False
+        try:
+            with open(descriptor, "wb") as file:
+                # Byte order marks are written once, at the start of the file
+                encoder = codecs.getincrementalencoder(self._encoding)()
+
+                self._rowsWritten = 0
+                self._bytesWritten = 0
+
+                for block in blocks:
+                    buffer = io.StringIO()
+                    writer = csv.writer(buffer, delimiter=self._delimiter, quotechar=self._quoteChar, lineterminator="\n")
+                    writer.writerows(block)
+
+                    self._bytesWritten += file.write(encoder.encode(buffer.getvalue()))
+                    self._rowsWritten += len(block)
+                    yield self._rowsWritten
+
+                file.flush()
+                os.fsync(file.fileno())
+
+            self._keepPermissions(temporaryName)
+            os.replace(temporaryName, self._fileName)
+            committed = True
+
+            self._syncDirectory(directory)
+
+        finally:
+            if not committed:
+                os.remove(temporaryName)
+
+
+    def _createTemporaryFile(self, directory):
+
+        # Files are created with the default permissions, the umask being
+        # applied by the system; os.umask() is not called, as it affects all
+        # threads of the process.
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+        while True:
+            temporaryName = os.path.join(directory, f".{os.path.basename(self._fileName)}.{secrets.token_hex(4)}.tmp")
+            try:
+                return os.open(temporaryName, flags, 0o666), temporaryName
+            except FileExistsError:
+                continue
+
+
+    def _keepPermissions(self, temporaryName):
+
+        # The saved document keeps the permissions of the file it replaces
+        try:
+            mode = os.stat(self._fileName).st_mode & 0o7777
+        except FileNotFoundError:
+            return
+
+        os.chmod(temporaryName, mode)
+
+
+    @staticmethod
+    def _syncDirectory(directory):
+
+        # Makes the rename durable; not supported on every platform
+        try:
+            descriptor = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+
+        try:
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
@@ -18,38 +18,66 @@
 # along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
 #
 
+import csv
+import json
 import sys
+import time
 
-from PySide2.QtCore import QCommandLineOption, QCommandLineParser, QCoreApplication, QDir, QFileInfo, QLibraryInfo, QLocale, QTranslator
-from PySide2.QtWidgets import QApplication
+from PySide2.QtCore import QCommandLineOption, QCommandLineParser, QCoreApplication, QFile, QIODevice, QLibraryInfo, QLocale, QTimer, QTranslator
 
-from main_window import MainWindow
 
-import translations_rc
+# Phases of the startup: description, time and number of modules imported
+startupPhases = []
+
+
+def markStartupPhase(description):
+
+    startupPhases.append((description, time.perf_counter(), len(sys.modules)))
+
+
+def showStartupProfile():
+
+    print(QCoreApplication.translate("main", "Startup profile:"), file=sys.stderr)
+    print("  {0:<32} {1:>10} {2:>10} {3:>8}".format(QCoreApplication.translate("main", "Phase"), QCoreApplication.translate("main", "ms"),
+        QCoreApplication.translate("main", "Total ms"), QCoreApplication.translate("main", "Modules")), file=sys.stderr)
+
+    _, startTime, startModules = startupPhases[0]
+    for (_, previousTime, previousModules), (description, phaseTime, modules) in zip(startupPhases, startupPhases[1:]):
+        print("  {0:<32} {1:>10.1f} {2:>10.1f} {3:>8}".format(description, (phaseTime - previousTime) * 1000, (phaseTime - startTime) * 1000, modules - previousModules), file=sys.stderr)
+
+
+def registerTranslations():
+
+    # The resources of the translations are registered on first use
+    import translations_rc
 
 
 def findTranslations():
 
-    dir = QDir(":/translations")
+    # Translations are listed by the manifest built with the resources; no
+    # translation is loaded for that.
+    registerTranslations()
+
+    file = QFile(":/translations/languages.json")
+    if not file.open(QIODevice.ReadOnly):
+        return []
 
-    fileNames = dir.entryList(QDir.Files, QDir.Name)
-    fileNames = [dir.filePath(fileName) for fileName in fileNames]
+    try:
+        translations = json.loads(file.readAll().data().decode("utf-8"))
+    except ValueError:
+        return []
 
-    return fileNames
+    return sorted(translations, key=lambda translation: translation["code"])
 
 
 def languageCode(translation):
 
-    return QFileInfo(translation).fileName()
+    return translation["code"]
 
 
 def languageDescription(translation):
 
-    translator = QTranslator()
-    translator.load(translation)
-
-    locale = QLocale(translator.language())
-    return QCoreApplication.translate("main", "{0} ({1})").format(locale.languageToString(locale.language()), locale.nativeLanguageName())
+    return QCoreApplication.translate("main", "{0} ({1})").format(translation["name"], translation["nativeName"])
 
 
 def showLanguageList():
@@ -66,15 +94,98 @@ def showLanguageList():
     return 0
 
 
+def isBatchMode(arguments):
+
+    # Documents are converted without any window or display
+    return any(argument == "--convert" or argument.startswith("--convert=") for argument in arguments[1:])
+
+
+def convertDocument(parser):
+
+    from document_converter import DocumentConverter
+    from preferences import Preferences
+
+    def error(message):
+        print(QCoreApplication.translate("main", "Error: {0}").format(message), file=sys.stderr)
+        return 1
+
+    inputName = parser.value("convert")
+    outputName = parser.value("out")
+    if not outputName:
+        return error(QCoreApplication.translate("main", "No output document given; use --out."))
+
+    converter = DocumentConverter(inputName, outputName)
+
+    # Dialects
+    delimiters = {}
+    for name in ["input-delimiter", "delimiter"]:
+        delimiters[name] = DocumentConverter.delimiterOf(parser.value(name)) if parser.isSet(name) else None
+        if parser.isSet(name) and delimiters[name] is None:
+            return error(QCoreApplication.translate("main", "Invalid delimiter: {0}").format(parser.value(name)))
+
+    if len(parser.value("quote-char")) > 1:
+        return error(QCoreApplication.translate("main", "Invalid quote character: {0}").format(parser.value("quote-char")))
+
+    converter.setInputDialect(delimiters["input-delimiter"], None, parser.value("input-encoding") or None)
+    converter.setDialect(delimiters["delimiter"], parser.value("quote-char") or None, parser.value("encoding") or None)
+
+    # Rows and columns
+    try:
+        if parser.isSet("rows"):
+            ranges = DocumentConverter.rangesOf(parser.value("rows"))
+            if len(ranges) != 1:
+                raise ValueError(parser.value("rows"))
+            converter.setRows(*ranges[0])
+
+        if parser.isSet("columns"):
+            converter.setColumns(DocumentConverter.rangesOf(parser.value("columns")))
+
+    except ValueError as exception:
+        return error(QCoreApplication.translate("main", "Invalid range: {0}").format(exception))
+
+    # Header labels
+    if parser.isSet("header-label"):
+        types = {type.name.lower(): type for type in Preferences.HeaderLabel}
+        type = types.get(parser.value("header-label").lower())
+        if type is None:
+            return error(QCoreApplication.translate("main", "Invalid header label: {0}").format(parser.value("header-label")))
+
+        converter.setHeaderLabel(type, parser.value("header-parameter") if parser.isSet("header-parameter") else None)
+
+    if parser.isSet("input-header") or parser.isSet("no-input-header"):
+        converter.setInputHeader(parser.isSet("input-header"))
+
+    try:
+        for _ in converter.convertBlocks():
+            pass
+
+    except (OSError, UnicodeError, LookupError, ValueError, csv.Error) as exception:
+        return error(str(exception))
+
+    print(QCoreApplication.translate("main", "{0} rows written to {1}").format(converter.rowsWritten(), outputName), file=sys.stderr)
+
+    return 0
+
+
 if __name__ == "__main__":
 
-    app = QApplication(sys.argv)
+    markStartupPhase(QCoreApplication.translate("main", "Start"))
+
+    # The widgets are not loaded in batch mode
+    if isBatchMode(sys.argv):
+        app = QCoreApplication(sys.argv)
+    else:
+        from PySide2.QtWidgets import QApplication
+        app = QApplication(sys.argv)
+
     app.setOrganizationName("NotNypical")
     app.setOrganizationDomain("https://notnypical.github.io")
     app.setApplicationName("Tabulator-QtPy")
-    app.setApplicationDisplayName("Tabulator-QtPy")
     app.setApplicationVersion("0.1.0")
+    if not isBatchMode(sys.argv):
+        app.setApplicationDisplayName("Tabulator-QtPy")
 
+    markStartupPhase(QCoreApplication.translate("main", "Application"))
 
     #
     # Command line
@@ -86,12 +197,84 @@ if __name__ == "__main__":
         QCoreApplication.translate("main", "Adjusts application language."),
         QCoreApplication.translate("main", "language code"))
 
+    startupProfileOption = QCommandLineOption(["startup-profile"],
+        QCoreApplication.translate("main", "Prints the time taken by the phases of the startup."))
+
+    performanceReportOption = QCommandLineOption(["performance-report"],
+        QCoreApplication.translate("main", "Writes the time taken by loading, painting and saving documents to a JSON file on quit."),
+        QCoreApplication.translate("main", "file"))
+
+    convertOption = QCommandLineOption(["convert"],
+        QCoreApplication.translate("main", "Converts a document without opening any window."),
+        QCoreApplication.translate("main", "file"))
+
+    outOption = QCommandLineOption(["out"],
+        QCoreApplication.translate("main", "Document written by the conversion."),
+        QCoreApplication.translate("main", "file"))
+
+    inputDelimiterOption = QCommandLineOption(["input-delimiter"],
+        QCoreApplication.translate("main", "Delimiter of the converted document; detected if not given."),
+        QCoreApplication.translate("main", "delimiter"))
+
+    inputEncodingOption = QCommandLineOption(["input-encoding"],
+        QCoreApplication.translate("main", "Encoding of the converted document; detected if not given."),
+        QCoreApplication.translate("main", "encoding"))
+
+    delimiterOption = QCommandLineOption(["delimiter"],
+        QCoreApplication.translate("main", "Delimiter written: comma, semicolon, tab, colon, pipe, space or a character."),
+        QCoreApplication.translate("main", "delimiter"))
+
+    quoteCharOption = QCommandLineOption(["quote-char"],
+        QCoreApplication.translate("main", "Quote character written."),
+        QCoreApplication.translate("main", "character"))
+
+    encodingOption = QCommandLineOption(["encoding"],
+        QCoreApplication.translate("main", "Encoding written."),
+        QCoreApplication.translate("main", "encoding"))
+
+    rowsOption = QCommandLineOption(["rows"],
+        QCoreApplication.translate("main", "Rows written, counted from 1, such as 2-100 or 2-."),
+        QCoreApplication.translate("main", "range"))
+
+    columnsOption = QCommandLineOption(["columns"],
+        QCoreApplication.translate("main", "Columns written in the given order, counted from 1, such as 3,1,5-8 or 2-."),
+        QCoreApplication.translate("main", "ranges"))
+
+    headerLabelOption = QCommandLineOption(["header-label"],
+        QCoreApplication.translate("main", "Writes a header row labeled as binary, octal, decimal, hexadecimal, letter or custom, replacing the header row of the converted document."),
+        QCoreApplication.translate("main", "label"))
+
+    inputHeaderOption = QCommandLineOption(["input-header"],
+        QCoreApplication.translate("main", "The first row of the converted document is a header row; detected if not given."))
+
+    noInputHeaderOption = QCommandLineOption(["no-input-header"],
+        QCoreApplication.translate("main", "The first row of the converted document is not a header row."))
+
+    headerParameterOption = QCommandLineOption(["header-parameter"],
+        QCoreApplication.translate("main", "Prefix, start number, letter case or custom text (# is the number) of the header labels."),
+        QCoreApplication.translate("main", "parameter"))
+
     parser = QCommandLineParser()
     parser.setApplicationDescription(QCoreApplication.translate("main", "{0} - An editor tool for documents with character-separated values").format(app.applicationName()))
     parser.addHelpOption()
     parser.addVersionOption()
     parser.addOption(languageListOption)
     parser.addOption(languageOption)
+    parser.addOption(startupProfileOption)
+    parser.addOption(performanceReportOption)
+    parser.addOption(convertOption)
+    parser.addOption(outOption)
+    parser.addOption(inputDelimiterOption)
+    parser.addOption(inputEncodingOption)
+    parser.addOption(delimiterOption)
+    parser.addOption(quoteCharOption)
+    parser.addOption(encodingOption)
+    parser.addOption(rowsOption)
+    parser.addOption(columnsOption)
+    parser.addOption(headerLabelOption)
+    parser.addOption(headerParameterOption)
+    parser.addOption(inputHeaderOption)
+    parser.addOption(noInputHeaderOption)
     parser.addPositionalArgument("files", "Documents to open.", "[files...]")
     parser.process(app)
 
@@ -102,12 +285,17 @@ if __name__ == "__main__":
     # Command line: Language
     language = parser.value(languageOption)
 
+    markStartupPhase(QCoreApplication.translate("main", "Command line"))
 
     #
     # Translations
 
     locale = QLocale(language) if language else QLocale.system()
 
+    # Translations are registered before the main window on purpose: the
+    # translator has to be installed before any text is shown.
+    registerTranslations()
+
     translator = QTranslator()
     if translator.load(locale, None, None, ":/translations"):
         app.installTranslator(translator)
@@ -116,11 +304,43 @@ if __name__ == "__main__":
     if translatorQtBase.load(locale, "qtbase", "_", QLibraryInfo.location(QLibraryInfo.TranslationsPath)):
         app.installTranslator(translatorQtBase)
 
+    markStartupPhase(QCoreApplication.translate("main", "Translations"))
+
+    # Command line: Performance report
+    if parser.isSet(performanceReportOption):
+        from performance_registry import PerformanceRegistry
+
+        PerformanceRegistry.instance().setEnabled(True, performanceReportOption)
+        app.aboutToQuit.connect(lambda: PerformanceRegistry.instance().exportJson(parser.value(performanceReportOption)))
+
+    # Command line: Convert
+    if parser.isSet(convertOption):
+        sys.exit(convertDocument(parser))
+
+
+    #
+    # Main window; its modules are imported once they are needed
+
+    from main_window import MainWindow
+
+    markStartupPhase(QCoreApplication.translate("main", "Main window modules"))
 
     window = MainWindow()
-    fileNames = parser.positionalArguments()
-    for fileName in fileNames:
-        window.openDocument(fileName)
+
+    markStartupPhase(QCoreApplication.translate("main", "Main window"))
+
     window.show()
+    window.recoverDocuments()
+    window.openDocuments(parser.positionalArguments())
+
+    markStartupPhase(QCoreApplication.translate("main", "Documents opened"))
+
+    # Command line: Startup profile
+    if parser.isSet(startupProfileOption):
+        def onEventLoopStarted():
+            markStartupPhase(QCoreApplication.translate("main", "First events processed"))
+            showStartupProfile()
+
+        QTimer.singleShot(0, onEventLoopStarted)
 
     sys.exit(app.exec_())
@@ -18,17 +18,21 @@
 # along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
 #
 
-from PySide2.QtCore import QByteArray, QFileInfo, QSettings, QStandardPaths, Qt
+from PySide2.QtCore import QByteArray, QFile, QFileInfo, QStandardPaths, Qt, QThreadPool
 from PySide2.QtGui import QIcon, QKeySequence
-from PySide2.QtWidgets import QAction, QActionGroup, QApplication, QFileDialog, QMainWindow, QMdiArea, QMenu
+from PySide2.QtWidgets import QAction, QActionGroup, QApplication, QFileDialog, QMainWindow, QMdiArea, QMenu, QMessageBox, QProgressBar
 
-from about_dialog import AboutDialog
-from colophon_dialog import ColophonDialog
 from document import Document
-from keyboard_shortcuts_dialog import KeyboardShortcutsDialog
+from document_journal import DocumentJournal
+from document_view_states import DocumentViewStates
+from performance_dock import PerformanceDock
+from performance_registry import PerformanceRegistry
 from preferences import Preferences
-from preferences_dialog import PreferencesDialog
+from settings_cache import SettingsCache
 
+# Icons are registered with the main window on purpose: its actions show
+# them on the first paint, so registering them later would not shorten the
+# startup.
 import icons_rc
 
 
@@ -41,6 +45,7 @@ class MainWindow(QMainWindow):
 
         self._recentDocuments = []
         self._actionRecentDocuments = []
+        self._documentViewStates = DocumentViewStates()
         self._keyboardShortcutsDialog = None
 
         self._preferences = Preferences()
@@ -49,6 +54,7 @@ class MainWindow(QMainWindow):
         self._createActions()
         self._createMenus()
         self._createToolBars()
+        self._createDockWidgets()
 
         self._loadSettings()
 
@@ -64,13 +70,48 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(self._documentArea)
         self._documentArea.subWindowActivated.connect(self._onDocumentWindowActivated)
 
+        self._updateActionUndoRedo()
+
+        # Documents are loaded and saved in parallel, up to a limit
+        self._loadPool = QThreadPool(self)
+        self._loadPool.setMaxThreadCount(self._preferences.maximumConcurrentLoads())
+
+        self._savePool = QThreadPool(self)
+        self._savePool.setMaxThreadCount(self._preferences.maximumConcurrentSaves())
+
+        # Open documents by canonical name, and canonical indexes in use by file name
+        self._documentWindows = {}
+        self._documentIndexes = {}
+        self._registeredDocuments = {}
+
+        # Documents whose loading starts once all of them have been opened
+        self._pendingLoads = None
+
+        # Progress of the documents being saved
+        self._saveProgress = {}
+        self._saveProgressBar = QProgressBar()
+        self._saveProgressBar.setRange(0, 1000)
+        self._saveProgressBar.setMaximumWidth(200)
+        self._saveProgressBar.setVisible(False)
+        self.statusBar().addPermanentWidget(self._saveProgressBar)
+
 
     def closeEvent(self, event):
 
         if True:
+            # Documents being loaded are dropped; documents being saved are written
+            # completely. Unsaved edits are kept in the journals for recovery.
+            for subWindow in self._documentArea.subWindowList():
+                self._storeDocumentViewState(subWindow.widget())
+                subWindow.widget().cancelLoading()
+                subWindow.widget().flushJournal()
+            self._loadPool.waitForDone()
+            self._savePool.waitForDone()
+
             # Store application properties and preferences
             self._saveSettings()
             self._preferences.saveSettings()
+            SettingsCache.instance().sync()
 
             event.accept()
         else:
@@ -79,7 +120,7 @@ class MainWindow(QMainWindow):
 
     def _loadSettings(self):
 
-        settings = QSettings()
+        settings = SettingsCache.instance()
 
         # Recent documents
         size = settings.beginReadArray("RecentDocuments")
@@ -89,6 +130,9 @@ class MainWindow(QMainWindow):
             self._updateRecentDocuments(canonicalName)
         settings.endArray()
 
+        # Views of recent documents
+        self._documentViewStates.loadSettings()
+
         # Application properties: Geometry
         geometry = settings.value("Application/Geometry", QByteArray()) if self._preferences.restoreApplicationGeometry() else QByteArray()
         if not geometry.isEmpty():
@@ -113,7 +157,7 @@ class MainWindow(QMainWindow):
 
     def _saveSettings(self):
 
-        settings = QSettings()
+        settings = SettingsCache.instance()
 
         # Recent documents
         if not self._preferences.restoreRecentDocuments():
@@ -125,6 +169,9 @@ class MainWindow(QMainWindow):
             settings.setValue("Document", self._recentDocuments[idx])
         settings.endArray()
 
+        # Views of recent documents
+        self._documentViewStates.saveSettings()
+
         # Application properties: Geometry
         geometry = self.saveGeometry() if self._preferences.restoreApplicationGeometry() else QByteArray()
         settings.setValue("Application/Geometry", geometry)
@@ -181,6 +228,12 @@ class MainWindow(QMainWindow):
         self._actionOpen.setToolTip(self.tr("Open an existing document"))
         self._actionOpen.triggered.connect(self._onActionOpenTriggered)
 
+        self._actionOpenReadOnly = QAction(self.tr("Open Read-Only…"), self)
+        self._actionOpenReadOnly.setObjectName("actionOpenReadOnly")
+        self._actionOpenReadOnly.setIcon(QIcon.fromTheme("document-open", QIcon(":/icons/actions/16/document-open.svg")))
+        self._actionOpenReadOnly.setToolTip(self.tr("Open an existing document for viewing without loading it completely"))
+        self._actionOpenReadOnly.triggered.connect(self._onActionOpenReadOnlyTriggered)
+
         self._actionOpenRecentClear = QAction(self.tr("Clear List"), self)
         self._actionOpenRecentClear.setObjectName("actionOpenRecentClear")
         self._actionOpenRecentClear.setToolTip(self.tr("Clear document list"))
@@ -266,6 +319,62 @@ class MainWindow(QMainWindow):
         self._actionCloseAll.setToolTip(self.tr("Close all documents"))
         self._actionCloseAll.triggered.connect(self._onActionCloseAllTriggered)
 
+        #
+        # Actions: Edit
+
+        self._actionUndo = QAction(self.tr("Undo"), self)
+        self._actionUndo.setObjectName("actionUndo")
+        self._actionUndo.setIcon(QIcon.fromTheme("edit-undo"))
+        self._actionUndo.setShortcut(QKeySequence.Undo)
+        self._actionUndo.setToolTip(self.tr("Undo the last edit"))
+        self._actionUndo.triggered.connect(self._onActionUndoTriggered)
+
+        self._actionRedo = QAction(self.tr("Redo"), self)
+        self._actionRedo.setObjectName("actionRedo")
+        self._actionRedo.setIcon(QIcon.fromTheme("edit-redo"))
+        self._actionRedo.setShortcut(QKeySequence.Redo)
+        self._actionRedo.setToolTip(self.tr("Redo the last undone edit"))
+        self._actionRedo.triggered.connect(self._onActionRedoTriggered)
+
+        self._actionCopy = QAction(self.tr("Copy"), self)
+        self._actionCopy.setObjectName("actionCopy")
+        self._actionCopy.setIcon(QIcon.fromTheme("edit-copy"))
+        self._actionCopy.setShortcut(QKeySequence.Copy)
+        self._actionCopy.setToolTip(self.tr("Copy the selected cells to the clipboard"))
+        self._actionCopy.triggered.connect(self._onActionCopyTriggered)
+
+        self._actionPaste = QAction(self.tr("Paste"), self)
+        self._actionPaste.setObjectName("actionPaste")
+        self._actionPaste.setIcon(QIcon.fromTheme("edit-paste"))
+        self._actionPaste.setShortcut(QKeySequence.Paste)
+        self._actionPaste.setToolTip(self.tr("Paste cells from the clipboard at the selected cell"))
+        self._actionPaste.triggered.connect(self._onActionPasteTriggered)
+
+        self._actionFind = QAction(self.tr("Find…"), self)
+        self._actionFind.setObjectName("actionFind")
+        self._actionFind.setIcon(QIcon.fromTheme("edit-find"))
+        self._actionFind.setShortcut(QKeySequence.Find)
+        self._actionFind.setToolTip(self.tr("Search the cells of the document"))
+        self._actionFind.triggered.connect(self._onActionFindTriggered)
+
+        self._actionFindNext = QAction(self.tr("Find Next"), self)
+        self._actionFindNext.setObjectName("actionFindNext")
+        self._actionFindNext.setShortcut(QKeySequence.FindNext)
+        self._actionFindNext.setToolTip(self.tr("Go to the next cell matching the search"))
+        self._actionFindNext.triggered.connect(self._onActionFindNextTriggered)
+
+        self._actionFindAll = QAction(self.tr("Find All"), self)
+        self._actionFindAll.setObjectName("actionFindAll")
+        self._actionFindAll.setToolTip(self.tr("Select all cells matching the search"))
+        self._actionFindAll.triggered.connect(self._onActionFindAllTriggered)
+
+        self._actionFilter = QAction(self.tr("Filter Rows…"), self)
+        self._actionFilter.setObjectName("actionFilter")
+        self._actionFilter.setIcon(QIcon.fromTheme("view-filter"))
+        self._actionFilter.setShortcut(QKeySequence(Qt.CTRL + Qt.SHIFT + Qt.Key_F))
+        self._actionFilter.setToolTip(self.tr("Show only the rows whose cells match filters by column"))
+        self._actionFilter.triggered.connect(self._onActionFilterTriggered)
+
         #
         # Actions: View
 
@@ -283,6 +392,12 @@ class MainWindow(QMainWindow):
         self._actionTitlebarFullPath.setToolTip(self.tr("Display the full path of the document in the titlebar"))
         self._actionTitlebarFullPath.triggered.connect(self._onActionTitlebarFullPathTriggered)
 
+        self._actionDockPerformance = QAction(self.tr("Performance"), self)
+        self._actionDockPerformance.setObjectName("actionDockPerformance")
+        self._actionDockPerformance.setCheckable(True)
+        self._actionDockPerformance.setToolTip(self.tr("Display the time taken by loading, painting and saving documents"))
+        self._actionDockPerformance.toggled.connect(self._onActionDockPerformanceToggled)
+
         self._actionToolbarApplication = QAction(self.tr("Show Application Toolbar"), self)
         self._actionToolbarApplication.setObjectName("actionToolbarApplication")
         self._actionToolbarApplication.setCheckable(True)
@@ -361,6 +476,7 @@ class MainWindow(QMainWindow):
         menuDocument.addAction(self._actionNew)
         menuDocument.addSeparator()
         menuDocument.addAction(self._actionOpen)
+        menuDocument.addAction(self._actionOpenReadOnly)
         menuDocument.addMenu(self._menuOpenRecent)
         menuDocument.addSeparator()
         menuDocument.addAction(self._actionSave)
@@ -376,6 +492,17 @@ class MainWindow(QMainWindow):
         # Menu: Edit
         menuEdit = self.menuBar().addMenu(self.tr("Edit"))
         menuEdit.setObjectName("menuEdit")
+        menuEdit.addAction(self._actionUndo)
+        menuEdit.addAction(self._actionRedo)
+        menuEdit.addSeparator()
+        menuEdit.addAction(self._actionCopy)
+        menuEdit.addAction(self._actionPaste)
+        menuEdit.addSeparator()
+        menuEdit.addAction(self._actionFind)
+        menuEdit.addAction(self._actionFindNext)
+        menuEdit.addAction(self._actionFindAll)
+        menuEdit.addSeparator()
+        menuEdit.addAction(self._actionFilter)
 
         # Menu: Tools
         menuTools = self.menuBar().addMenu(self.tr("Tools"))
@@ -394,6 +521,8 @@ class MainWindow(QMainWindow):
         menuView.addAction(self._actionToolbarTools)
         menuView.addAction(self._actionToolbarView)
         menuView.addAction(self._actionToolbarHelp)
+        menuView.addSeparator()
+        menuView.addAction(self._actionDockPerformance)
 
         # Menu: Help
         menuHelp = self.menuBar().addMenu(self.tr("Help"))
@@ -427,6 +556,12 @@ class MainWindow(QMainWindow):
         # Toolbar: Edit
         self._toolbarEdit = self.addToolBar(self.tr("Edit Toolbar"))
         self._toolbarEdit.setObjectName("toolbarEdit")
+        self._toolbarEdit.addAction(self._actionUndo)
+        self._toolbarEdit.addAction(self._actionRedo)
+        self._toolbarEdit.addAction(self._actionCopy)
+        self._toolbarEdit.addAction(self._actionPaste)
+        self._toolbarEdit.addAction(self._actionFind)
+        self._toolbarEdit.addAction(self._actionFilter)
         self._toolbarEdit.visibilityChanged.connect(lambda visible: self._actionToolbarEdit.setChecked(visible))
 
         # Toolbar: Tools
@@ -447,6 +582,16 @@ class MainWindow(QMainWindow):
         self._toolbarHelp.visibilityChanged.connect(lambda visible: self._actionToolbarHelp.setChecked(visible))
 
 
+    def _createDockWidgets(self):
+
+        # Dock: Performance; hidden unless shown by the application state
+        self._dockPerformance = PerformanceDock(self)
+        self._dockPerformance.setVisible(False)
+        self._dockPerformance.refreshRequested.connect(self._onDockPerformanceRefreshRequested)
+        self._dockPerformance.visibilityChanged.connect(lambda visible: self._actionDockPerformance.setChecked(visible))
+        self.addDockWidget(Qt.BottomDockWidgetArea, self._dockPerformance)
+
+
     def _updateActions(self, subWindowCount=0):
 
         hasDocument = subWindowCount >= 1
@@ -462,6 +607,26 @@ class MainWindow(QMainWindow):
         self._actionCloseOther.setEnabled(hasDocuments)
         self._actionCloseAll.setEnabled(hasDocument)
 
+        # Actions: Edit
+        self._actionCopy.setEnabled(hasDocument)
+        self._actionPaste.setEnabled(hasDocument)
+        self._actionFind.setEnabled(hasDocument)
+        self._actionFindNext.setEnabled(hasDocument)
+        self._actionFindAll.setEnabled(hasDocument)
+        self._actionFilter.setEnabled(hasDocument)
+
+
+    def _updateActionUndoRedo(self):
+
+        document = self._activeDocument()
+        undoText = document.undoText() if document else ""
+        redoText = document.redoText() if document else ""
+
+        self._actionUndo.setText(self.tr("Undo {0}").format(undoText) if undoText else self.tr("Undo"))
+        self._actionUndo.setEnabled(document is not None and document.canUndo())
+        self._actionRedo.setText(self.tr("Redo {0}").format(redoText) if redoText else self.tr("Redo"))
+        self._actionRedo.setEnabled(document is not None and document.canRedo())
+
 
     def _updateActionFullScreen(self):
 
@@ -477,6 +642,17 @@ class MainWindow(QMainWindow):
             self._actionFullScreen.setToolTip(self.tr("Exit the full screen mode"))
 
 
+    def _updateActionSaveAsDelimiter(self):
+
+        document = self._activeDocument()
+        delimiters = {":": "colon", ",": "comma", ";": "semicolon", "\t": "tab"}
+
+        # Check the delimiter of the active document
+        delimiter = delimiters.get(document.delimiter()) if document else None
+        for action in self._actionSaveAsDelimiter.actions():
+            action.setChecked(action.data() == delimiter)
+
+
     def _updateActionRecentDocuments(self):
 
         # Add items to the list, if necessary
@@ -484,7 +660,7 @@ class MainWindow(QMainWindow):
 
             actionRecentDocument = QAction(self)
             actionRecentDocument.setObjectName(f"actionRecentDocument_{idx}")
-            actionRecentDocument.triggered.connect(lambda data=actionRecentDocument.data(): self._onActionOpenRecentDocumentTriggered(data))
+            actionRecentDocument.triggered.connect(lambda checked=False, action=actionRecentDocument: self._onActionOpenRecentDocumentTriggered(action.data()))
 
             self._actionRecentDocuments.append(actionRecentDocument)
 
@@ -542,26 +718,76 @@ class MainWindow(QMainWindow):
         self.setWindowTitle(title)
 
 
+    def openDocuments(self, fileNames, readOnly=False):
+
+        # Subwindows are created at once; the documents are loaded concurrently
+        # on the load pool and filled in as their rows are read.
+        self._pendingLoads = []
+
+        for fileName in fileNames:
+            self._openDocument(fileName, readOnly)
+
+        pendingLoads, self._pendingLoads = self._pendingLoads, None
+        for document in pendingLoads:
+            document.startLoading(self._loadPool)
+
+
+    def recoverDocuments(self):
+
+        # Documents with journals left by an earlier session are opened; their
+        # edits are recovered when confirmed.
+        canonicalNames = []
+        for journalName in self._recoveryJournals():
+            try:
+                canonicalName = DocumentJournal.readHeader(journalName).get("document")
+            except (OSError, ValueError):
+                continue
+
+            if isinstance(canonicalName, str) and QFileInfo(canonicalName).exists():
+                if canonicalName not in canonicalNames:
+                    canonicalNames.append(canonicalName)
+            else:
+                # The document is gone
+                QFile.remove(journalName)
+
+        self.openDocuments(canonicalNames)
+
+        self._setRecoveryJournals([journalName for journalName in self._recoveryJournals() if QFileInfo(journalName).exists()])
+
+
     def _onActionAboutTriggered(self):
 
+        # Dialogs are imported once they are first shown
+        from about_dialog import AboutDialog
+
         dialog = AboutDialog(self)
         dialog.exec_()
 
 
     def _onActionColophonTriggered(self):
 
+        from colophon_dialog import ColophonDialog
+
         dialog = ColophonDialog(self)
         dialog.exec_()
 
 
     def _onActionPreferencesTriggered(self):
 
+        from preferences_dialog import PreferencesDialog
+
         dialog = PreferencesDialog(self)
         dialog.setPreferences(self._preferences)
         dialog.exec_()
 
         self._preferences = dialog.preferences()
 
+        self._loadPool.setMaxThreadCount(self._preferences.maximumConcurrentLoads())
+        self._savePool.setMaxThreadCount(self._preferences.maximumConcurrentSaves())
+
+        for subWindow in self._documentArea.subWindowList():
+            subWindow.widget().setPreferences(self._preferences)
+
         self._updateRecentDocuments(None)
         self._updateMenuOpenRecent()
 
@@ -577,14 +803,21 @@ class MainWindow(QMainWindow):
                         QStandardPaths.writableLocation(QStandardPaths.HomeLocation),
                         self.tr("CSV Files (*.csv);;All Files (*.*)"))[0]
 
-        for fileName in fileNames:
-            self._openDocument(fileName)
+        self.openDocuments(fileNames)
+
+
+    def _onActionOpenReadOnlyTriggered(self):
+
+        fileNames = QFileDialog.getOpenFileNames(self, self.tr("Open Document Read-Only"),
+                        QStandardPaths.writableLocation(QStandardPaths.HomeLocation),
+                        self.tr("CSV Files (*.csv);;All Files (*.*)"))[0]
+
+        self.openDocuments(fileNames, True)
 
 
     def _onActionOpenRecentDocumentTriggered(self, canonicalName):
-        pass
 
-#        self.openDocument(canonicalName)
+        self.openDocuments([canonicalName])
 
 
     def _onActionOpenRecentClearTriggered(self):
@@ -596,23 +829,66 @@ class MainWindow(QMainWindow):
 
 
     def _onActionSaveTriggered(self):
-        pass
+
+        document = self._activeDocument()
+        if not document:
+            return
+
+        if document.canonicalName():
+            self._saveDocument(document, document.canonicalName())
+        else:
+            self._onActionSaveAsTriggered()
 
 
     def _onActionSaveAsTriggered(self):
-        pass
+
+        document = self._activeDocument()
+        if not document:
+            return
+
+        fileName = self._getSaveFileName(document, self.tr("Save Document As"))
+        if fileName:
+            self._saveDocument(document, fileName)
 
 
     def _onActionSaveAsDelimiterTriggered(self, delimiter):
-        pass
+
+        document = self._activeDocument()
+        if not document:
+            return
+
+        delimiters = {"colon": ":", "comma": ",", "semicolon": ";", "tab": "\t"}
+
+        fileName = self._getSaveFileName(document, self.tr("Save Document As"))
+        if fileName:
+            self._saveDocument(document, fileName, delimiters[delimiter])
 
 
     def _onActionSaveCopyAsTriggered(self):
-        pass
+
+        document = self._activeDocument()
+        if not document:
+            return
+
+        fileName = self._getSaveFileName(document, self.tr("Save Copy of Document As"))
+        if fileName:
+            self._saveDocument(document, fileName, copy=True)
 
 
     def _onActionSaveAllTriggered(self):
-        pass
+
+        # Untitled documents are named first, then all modified documents are
+        # handed to the save pool at once.
+        for subWindow in self._documentArea.subWindowList():
+            document = subWindow.widget()
+            if document.isModified() and not document.canonicalName():
+                self._documentArea.setActiveSubWindow(subWindow)
+                self._onActionSaveAsTriggered()
+
+        for subWindow in self._documentArea.subWindowList():
+            document = subWindow.widget()
+            if document.isModified() and document.canonicalName() and not document.isSaving():
+                self._saveDocument(document, document.canonicalName())
 
 
     def _onActionCloseTriggered(self):
@@ -632,6 +908,78 @@ class MainWindow(QMainWindow):
         self._documentArea.closeAllSubWindows()
 
 
+    def _onActionUndoTriggered(self):
+
+        document = self._activeDocument()
+        if document:
+            document.undo()
+
+
+    def _onActionRedoTriggered(self):
+
+        document = self._activeDocument()
+        if document:
+            document.redo()
+
+
+    def _onActionCopyTriggered(self):
+
+        document = self._activeDocument()
+        if document and not document.copy() and document.isLoading():
+            self.statusBar().showMessage(self.tr("Document {0} is still loading and cannot be copied from now").format(document.documentTitle()), 5000)
+
+
+    def _onActionPasteTriggered(self):
+
+        document = self._activeDocument()
+        if document:
+            document.paste()
+
+
+    def _onActionFindTriggered(self):
+
+        document = self._activeDocument()
+        if document:
+            document.showFindBar()
+
+
+    def _onActionFindNextTriggered(self):
+
+        document = self._activeDocument()
+        if document:
+            document.findNext()
+
+
+    def _onActionFindAllTriggered(self):
+
+        document = self._activeDocument()
+        if document:
+            document.findAll()
+
+
+    def _onActionFilterTriggered(self):
+
+        document = self._activeDocument()
+        if document:
+            document.showFilterBar()
+
+
+    def _onActionDockPerformanceToggled(self, checked):
+
+        # Measures are taken only while they are shown
+        PerformanceRegistry.instance().setEnabled(checked, self._dockPerformance)
+        self._dockPerformance.setVisible(checked)
+
+
+    def _onDockPerformanceRefreshRequested(self):
+
+        registry = PerformanceRegistry.instance()
+
+        registry.clearValues("memory")
+        for subWindow in self._documentArea.subWindowList():
+            registry.setValue("memory", subWindow.widget().documentTitle(), subWindow.widget().byteSize())
+
+
     def _onActionFullScreenTriggered(self):
 
         if not self.isFullScreen():
@@ -650,6 +998,7 @@ class MainWindow(QMainWindow):
     def _onActionKeyboardShortcutsTriggered(self):
 
         if not self._keyboardShortcutsDialog:
+            from keyboard_shortcuts_dialog import KeyboardShortcutsDialog
             self._keyboardShortcutsDialog = KeyboardShortcutsDialog(self)
 
         self._keyboardShortcutsDialog.show()
@@ -661,6 +1010,8 @@ class MainWindow(QMainWindow):
 
         # Update the application window
         self._updateActions(len(self._documentArea.subWindowList()))
+        self._updateActionUndoRedo()
+        self._updateActionSaveAsDelimiter()
         self._updateTitleBar()
 
         if not subWindow:
@@ -677,12 +1028,161 @@ class MainWindow(QMainWindow):
         # Update menu items without the emitter
         self._updateActions(len(self._documentArea.subWindowList()) - 1)
 
+        self._storeDocumentViewState(self.sender())
+        self._unregisterDocument(self.sender())
+
+        # A canceled save does not report back
+        if self.sender() in self._saveProgress:
+            del self._saveProgress[self.sender()]
+            self._updateSaveProgress()
+
+
+    def _onDocumentLoadProgressChanged(self, bytesRead, bytesTotal):
+
+        document = self.sender()
+        percent = bytesRead * 100 // bytesTotal if bytesTotal > 0 else 100
+
+        self.statusBar().showMessage(self.tr("Loading {0} … {1} %").format(document.documentTitle(), percent), 2000)
+
+
+    def _onDocumentLoadFinished(self, succeeded, errorMessage):
+
+        document = self.sender()
+
+        if succeeded:
+            self.statusBar().showMessage(self.tr("Document {0} loaded").format(document.documentTitle()), 2000)
+
+            self._updateActionSaveAsDelimiter()
+        elif errorMessage:
+            self.statusBar().showMessage(self.tr("Document {0} could not be loaded: {1}").format(document.documentTitle(), errorMessage), 5000)
+
+
+    def _onDocumentSaveProgressChanged(self, rowsWritten, rowCount, bytesPerSecond):
+
+        document = self.sender()
+        percent = rowsWritten * 100 // rowCount if rowCount > 0 else 100
+
+        self._saveProgress[document] = (rowsWritten, rowCount)
+        self._updateSaveProgress()
+
+        self.statusBar().showMessage(self.tr("Saving {0} … {1} % ({2:.1f} MB/s)").format(document.documentTitle(), percent, bytesPerSecond / 1e6), 2000)
+
+
+    def _onDocumentSaveFinished(self, succeeded, errorMessage):
+
+        document = self.sender()
+
+        self._saveProgress.pop(document, None)
+        self._updateSaveProgress()
+
+        if succeeded:
+            if not document.canonicalIndex():
+                # The document has been saved under a new name
+                self._unregisterDocument(document)
+                document.setCanonicalIndex(self._createDocumentIndex(document.canonicalName()))
+                self._registerDocument(document)
+            document.updateDocumentTitle()
+
+            # Update list of recent documents
+            self._updateRecentDocuments(document.canonicalName())
+            self._updateMenuOpenRecent()
+
+            # Update the application window
+            self._updateActionSaveAsDelimiter()
+            self._updateTitleBar()
+
+            self.statusBar().showMessage(self.tr("Document {0} saved").format(document.documentTitle()), 2000)
+        elif errorMessage:
+            self.statusBar().showMessage(self.tr("Document {0} could not be saved: {1}").format(document.documentTitle(), errorMessage), 5000)
+
+
+    def _onDocumentSortProgressChanged(self, rowsRead, rowsToRead):
+
+        document = self.sender()
+        percent = rowsRead * 100 // rowsToRead if rowsToRead > 0 else 100
+
+        self.statusBar().showMessage(self.tr("Sorting {0} … {1} %").format(document.documentTitle(), percent), 2000)
+
+
+    def _onDocumentSortFinished(self, succeeded, errorMessage):
+
+        document = self.sender()
+
+        if succeeded:
+            self.statusBar().showMessage(self.tr("Document {0} sorted").format(document.documentTitle()), 2000)
+        elif errorMessage:
+            self.statusBar().showMessage(self.tr("Document {0} could not be sorted: {1}").format(document.documentTitle(), errorMessage), 5000)
+
+
+    def _onDocumentCopyFinished(self, succeeded, errorMessage):
+
+        document = self.sender()
+
+        if succeeded:
+            self.statusBar().showMessage(self.tr("Cells of {0} copied").format(document.documentTitle()), 2000)
+        elif errorMessage:
+            self.statusBar().showMessage(self.tr("Cells of {0} could not be copied: {1}").format(document.documentTitle(), errorMessage), 5000)
+
+
+    def _onDocumentPasteFinished(self, succeeded, errorMessage):
+
+        document = self.sender()
+
+        if succeeded:
+            self.statusBar().showMessage(self.tr("Cells pasted into {0}").format(document.documentTitle()), 2000)
+        elif errorMessage:
+            self.statusBar().showMessage(self.tr("Cells could not be pasted into {0}: {1}").format(document.documentTitle(), errorMessage), 5000)
+
+
+    def _onDocumentJournalStarted(self, journalName):
+
+        # Journals are remembered at once, to be found after a crash
+        journalNames = self._recoveryJournals()
+        if journalName not in journalNames:
+            journalNames.append(journalName)
+            self._setRecoveryJournals(journalNames)
+
+
+    def _onDocumentJournalFailed(self, errorMessage):
+
+        document = self.sender()
+
+        self.statusBar().showMessage(self.tr("Unsaved edits of {0} can no longer be recorded: {1}").format(document.documentTitle(), errorMessage), 5000)
+
+
+    def _onDocumentRecoveryFinished(self, succeeded, errorMessage):
+
+        document = self.sender()
+
+        if succeeded:
+            self.statusBar().showMessage(self.tr("Unsaved edits of {0} recovered").format(document.documentTitle()), 5000)
+        else:
+            self.statusBar().showMessage(self.tr("Unsaved edits of {0} could not be recovered completely: {1}").format(document.documentTitle(), errorMessage), 5000)
+
+
+    def _onDocumentHistoryChanged(self):
+
+        if self.sender() is self._activeDocument():
+            self._updateActionUndoRedo()
+
 
     def _createDocument(self):
 
         document = Document()
         document.setPreferences(self._preferences)
         document.aboutToClose.connect(self._onDocumentAboutToClose)
+        document.loadProgressChanged.connect(self._onDocumentLoadProgressChanged)
+        document.loadFinished.connect(self._onDocumentLoadFinished)
+        document.saveProgressChanged.connect(self._onDocumentSaveProgressChanged)
+        document.saveFinished.connect(self._onDocumentSaveFinished)
+        document.sortProgressChanged.connect(self._onDocumentSortProgressChanged)
+        document.sortFinished.connect(self._onDocumentSortFinished)
+        document.copyFinished.connect(self._onDocumentCopyFinished)
+        document.pasteFinished.connect(self._onDocumentPasteFinished)
+        document.historyChanged.connect(self._onDocumentHistoryChanged)
+        document.journalStarted.connect(self._onDocumentJournalStarted)
+        document.journalFailed.connect(self._onDocumentJournalFailed)
+        document.recoveryFinished.connect(self._onDocumentRecoveryFinished)
 
         subWindow = self._documentArea.addSubWindow(document)
         subWindow.setWindowIcon(QIcon())
@@ -693,24 +1193,46 @@ class MainWindow(QMainWindow):
 
     def _createDocumentIndex(self, canonicalName):
 
+        canonicalIndexes = self._documentIndexes.get(QFileInfo(canonicalName).fileName(), ())
+
+        return max(canonicalIndexes, default=0) + 1
+
+
+    def _findDocumentWindow(self, canonicalName):
+
+        return self._documentWindows.get(canonicalName)
+
+
+    def _registerDocument(self, document):
+
+        canonicalName = document.canonicalName()
+        canonicalIndex = document.canonicalIndex()
         fileName = QFileInfo(canonicalName).fileName()
-        canonicalIndex = 0
 
-        for subWindow in self._documentArea.subWindowList():
-            if QFileInfo(subWindow.widget().canonicalName()).fileName() == fileName:
-                if subWindow.widget().canonicalIndex() > canonicalIndex:
-                    canonicalIndex = subWindow.widget().canonicalIndex()
+        # A name is registered for one window only
+        if canonicalName:
+            self._documentWindows.setdefault(canonicalName, document.parentWidget())
+        self._documentIndexes.setdefault(fileName, set()).add(canonicalIndex)
 
-        return canonicalIndex + 1
+        # Names and indexes can change; they are removed as registered
+        self._registeredDocuments[document] = (canonicalName, canonicalIndex, fileName)
 
 
-    def _findDocumentWindow(self, canonicalName):
+    def _unregisterDocument(self, document):
 
-        for subWindow in self._documentArea.subWindowList():
-            if subWindow.widget().canonicalName() == canonicalName:
-                return subWindow
+        if document not in self._registeredDocuments:
+            return
 
-        return None
+        canonicalName, canonicalIndex, fileName = self._registeredDocuments.pop(document)
+
+        if canonicalName and self._documentWindows.get(canonicalName) is document.parentWidget():
+            del self._documentWindows[canonicalName]
+
+        canonicalIndexes = self._documentIndexes.get(fileName)
+        if canonicalIndexes is not None:
+            canonicalIndexes.discard(canonicalIndex)
+            if not canonicalIndexes:
+                del self._documentIndexes[fileName]
 
 
     def _activeDocument(self):
@@ -720,7 +1242,7 @@ class MainWindow(QMainWindow):
         return subWindow.widget() if subWindow else None
 
 
-    def _openDocument(self, fileName):
+    def _openDocument(self, fileName, readOnly=False):
 
         canonicalName = QFileInfo(fileName).canonicalFilePath()
 
@@ -734,16 +1256,24 @@ class MainWindow(QMainWindow):
             self._updateMenuOpenRecent()
             return True
 
-        return self._loadDocument(canonicalName);
+        return self._loadDocument(canonicalName, readOnly);
 
 
-    def _loadDocument(self, canonicalName):
+    def _loadDocument(self, canonicalName, readOnly=False):
+
+        journalName = self._confirmRecoveryJournal(canonicalName) if canonicalName and not readOnly else None
 
         document = self._createDocument()
 
-        succeeded = document.load(canonicalName)
+        # The view of an earlier session is restored while loading
+        state = self._documentViewStates.state(canonicalName) if canonicalName else None
+        if state:
+            document.setViewState(state)
+
+        succeeded = document.load(canonicalName, readOnly, journalName)
         if succeeded:
             document.setCanonicalIndex(self._createDocumentIndex(canonicalName))
+            self._registerDocument(document)
             document.updateDocumentTitle()
             document.show()
 
@@ -754,12 +1284,120 @@ class MainWindow(QMainWindow):
             # Update the application window
             self._updateActions(len(self._documentArea.subWindowList()))
             self._updateTitleBar()
+
+            if self._pendingLoads is not None:
+                self._pendingLoads.append(document)
+            else:
+                document.startLoading(self._loadPool)
         else:
             document.close()
 
         return succeeded
 
 
+    def _confirmRecoveryJournal(self, canonicalName):
+
+        # Unsaved edits of an earlier session apply only to the document they
+        # were made in; a journal not recovered is discarded.
+        journalName = DocumentJournal.journalName(canonicalName)
+        if not QFileInfo(journalName).exists():
+            return None
+
+        fileName = QFileInfo(canonicalName).fileName()
+
+        try:
+            matches = DocumentJournal.matchesDocument(DocumentJournal.readHeader(journalName), canonicalName)
+        except (OSError, ValueError):
+            matches = False
+
+        if not matches:
+            QMessageBox.warning(self, self.tr("Recover Unsaved Edits"),
+                self.tr("Unsaved edits of {0} were found, but the document has been changed since. The edits are discarded.").format(fileName))
+            QFile.remove(journalName)
+            return None
+
+        answer = QMessageBox.question(self, self.tr("Recover Unsaved Edits"),
+            self.tr("{0} has unsaved edits from an earlier session. Do you want to recover them?").format(fileName))
+        if answer != QMessageBox.Yes:
+            QFile.remove(journalName)
+            return None
+
+        return journalName
+
+
+    def _recoveryJournals(self):
+
+        settings = SettingsCache.instance()
+
+        journalNames = []
+        size = settings.beginReadArray("RecoveryJournals")
+        for idx in range(size):
+            settings.setArrayIndex(idx)
+            journalNames.append(settings.value("Journal"))
+        settings.endArray()
+
+        return journalNames
+
+
+    def _setRecoveryJournals(self, journalNames):
+
+        settings = SettingsCache.instance()
+
+        settings.remove("RecoveryJournals")
+        settings.beginWriteArray("RecoveryJournals")
+        for idx in range(len(journalNames)):
+            settings.setArrayIndex(idx)
+            settings.setValue("Journal", journalNames[idx])
+        settings.endArray()
+
+        # Written at once, to be found after a crash
+        settings.flush()
+
+
+    def _storeDocumentViewState(self, document):
+
+        # Documents not read completely have no view to restore
+        if document.canonicalName() and not document.isLoading():
+            self._documentViewStates.setState(document.canonicalName(), document.viewState())
+            self._documentViewStates.saveSettings()
+
+
+    def _getSaveFileName(self, document, caption):
+
+        directory = document.canonicalName() if document.canonicalName() else QStandardPaths.writableLocation(QStandardPaths.HomeLocation)
+
+        return QFileDialog.getSaveFileName(self, caption, directory, self.tr("CSV Files (*.csv);;All Files (*.*)"))[0]
+
+
+    def _saveDocument(self, document, fileName, delimiter=None, copy=False):
+
+        # The file of another open document is not written over
+        subWindow = self._findDocumentWindow(QFileInfo(fileName).canonicalFilePath())
+        if subWindow and subWindow.widget() is not document:
+            self.statusBar().showMessage(self.tr("Document {0} is open and cannot be written over; close it first").format(subWindow.widget().documentTitle()), 5000)
+            return False
+
+        if not document.save(fileName, delimiter, copy, self._savePool):
+            self.statusBar().showMessage(self.tr("Document {0} is busy and cannot be saved now").format(document.documentTitle()), 5000)
+            return False
+
+        self._saveProgress[document] = (0, 0)
+        self._updateSaveProgress()
+
+        return True
+
+
+    def _updateSaveProgress(self):
+
+        # Overall progress of all documents being saved
+        rowsWritten = sum(progress[0] for progress in self._saveProgress.values())
+        rowCount = sum(progress[1] for progress in self._saveProgress.values())
+
+        self._saveProgressBar.setValue(rowsWritten * 1000 // rowCount if rowCount > 0 else 0)
+        self._saveProgressBar.setFormat(self.tr("Saving %p %") if len(self._saveProgress) <= 1 else self.tr("Saving {0} documents … %p %").format(len(self._saveProgress)))
+        self._saveProgressBar.setVisible(bool(self._saveProgress))
+
+
     def _updateRecentDocuments(self, canonicalName):
 
         if canonicalName:
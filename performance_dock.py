@@ -0,0 +1,160 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from PySide2.QtCore import QLocale, Qt, QTimer, Signal
+from PySide2.QtWidgets import (QAbstractItemView, QDockWidget, QFileDialog, QHBoxLayout, QMessageBox, QPushButton,
+                               QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget)
+
+from performance_registry import PerformanceRegistry
+
+
+class PerformanceDock(QDockWidget):
+
+    # Emitted before the measures are shown, to update values such as the
+    # memory of the documents
+    refreshRequested = Signal()
+
+    # Measures are shown anew this often while the dock is visible
+    RefreshInterval = 1000
+
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        self.setObjectName("dockPerformance")
+        self.setWindowTitle(self.tr("Performance"))
+
+        headerLabels = [self.tr("Measure"), self.tr("Value")]
+
+        self._tableBox = QTableWidget(0, len(headerLabels))
+        self._tableBox.setHorizontalHeaderLabels(headerLabels)
+        self._tableBox.horizontalHeader().setDefaultAlignment(Qt.AlignLeft)
+        self._tableBox.horizontalHeader().setStretchLastSection(True)
+        self._tableBox.verticalHeader().setVisible(False)
+        self._tableBox.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._tableBox.setSelectionMode(QAbstractItemView.NoSelection)
+        self._tableBox.setFocusPolicy(Qt.NoFocus)
+
+        reset = QPushButton(self.tr("Reset"))
+        reset.setToolTip(self.tr("Discard all measures taken so far"))
+        reset.clicked.connect(self._onResetClicked)
+
+        export = QPushButton(self.tr("Export…"))
+        export.setToolTip(self.tr("Write all measures to a JSON file"))
+        export.clicked.connect(self._onExportClicked)
+
+        buttonBox = QHBoxLayout()
+        buttonBox.addStretch(1)
+        buttonBox.addWidget(reset)
+        buttonBox.addWidget(export)
+
+        widget = QWidget()
+        layout = QVBoxLayout(widget)
+        layout.addWidget(self._tableBox)
+        layout.addLayout(buttonBox)
+        self.setWidget(widget)
+
+        self._refreshTimer = QTimer(self)
+        self._refreshTimer.setInterval(self.RefreshInterval)
+        self._refreshTimer.timeout.connect(self.refresh)
+
+
+    def showEvent(self, event):
+
+        super().showEvent(event)
+
+        self.refresh()
+        self._refreshTimer.start()
+
+
+    def hideEvent(self, event):
+
+        self._refreshTimer.stop()
+
+        super().hideEvent(event)
+
+
+    def refresh(self):
+
+        self.refreshRequested.emit()
+
+        registry = PerformanceRegistry.instance()
+        locale = QLocale()
+
+        loadCount, loadTime, _ = registry.timer("load")
+        parseCount, parseTime, _ = registry.timer("load.parse")
+        fillCount, fillTime, _ = registry.timer("load.fill")
+        labelsCount, labelsTime, _ = registry.timer("header.labels")
+        relabelCount, relabelTime, relabelMaximum = registry.timer("header.relabel")
+        paintCount, paintTime, paintMaximum = registry.timer("paint")
+        saveCount, saveTime, _ = registry.timer("save")
+
+        rows = [
+            (self.tr("Loading"), self.tr("{0} rows/s, {1}/s").format(locale.toString(registry.rate("load.rows", "load"), "f", 0),
+                locale.formattedDataSize(int(registry.rate("load.bytes", "load"))))),
+            (self.tr("Documents loaded"), locale.toString(loadCount)),
+            (self.tr("Parsing"), self._timeText(parseTime, parseCount)),
+            (self.tr("Filling the table"), self._timeText(fillTime, fillCount)),
+            (self.tr("Header labels"), self._timeText(labelsTime, labelsCount)),
+            (self.tr("Header relabeling"), self.tr("{0}, at most {1}").format(self._timeText(relabelTime, relabelCount), self._millisecondsText(relabelMaximum))),
+            (self.tr("Painting per frame"), self.tr("{0} on average, at most {1}").format(self._millisecondsText(paintTime / paintCount if paintCount else 0.0), self._millisecondsText(paintMaximum))),
+            (self.tr("Frames painted"), locale.toString(paintCount)),
+            (self.tr("Saving"), self.tr("{0} rows/s, {1}/s").format(locale.toString(registry.rate("save.rows", "save"), "f", 0),
+                locale.formattedDataSize(int(registry.rate("save.bytes", "save"))))),
+            (self.tr("Documents saved"), locale.toString(saveCount)),
+        ]
+
+        for name, size in sorted(registry.values("memory").items()):
+            rows.append((self.tr("Memory of {0}").format(name), locale.formattedDataSize(size)))
+
+        self._tableBox.setRowCount(len(rows))
+        for idx, (name, value) in enumerate(rows):
+            self._tableBox.setItem(idx, 0, QTableWidgetItem(name))
+            self._tableBox.setItem(idx, 1, QTableWidgetItem(value))
+
+        self._tableBox.resizeColumnToContents(0)
+
+
+    def _timeText(self, seconds, count):
+
+        return self.tr("{0} in {1} calls").format(self._millisecondsText(seconds), QLocale().toString(count))
+
+
+    def _millisecondsText(self, seconds):
+
+        return self.tr("{0} ms").format(QLocale().toString(seconds * 1000, "f", 2))
+
+
+    def _onResetClicked(self):
+
+        PerformanceRegistry.instance().reset()
+        self.refresh()
+
+
+    def _onExportClicked(self):
+
+        fileName = QFileDialog.getSaveFileName(self, self.tr("Export Measures"), "performance.json", self.tr("JSON Files (*.json);;All Files (*.*)"))[0]
+        if not fileName:
+            return
+
+        try:
+            PerformanceRegistry.instance().exportJson(fileName)
+        except OSError as error:
+            QMessageBox.warning(self, self.tr("Export Measures"), self.tr("Cannot write file {0}:\n{1}").format(fileName, error.strerror))
@@ -0,0 +1,161 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import json
+import threading
+import time
+
+
+_instance = None
+
+
+class PerformanceRegistry:
+
+    # Instrumented code checks this flag before measuring anything; nothing
+    # else is done while it is off.
+    Enabled = False
+
+
+    @staticmethod
+    def instance():
+
+        # Measures of all documents and threads are gathered in one registry
+        global _instance
+        if _instance is None:
+            _instance = PerformanceRegistry()
+
+        return _instance
+
+
+    def __init__(self):
+
+        # Measures are added from worker threads as well
+        self._lock = threading.Lock()
+
+        # Timers by name: [count, total seconds, maximum seconds]; counters by
+        # name; values by name and key, such as the memory of each document.
+        self._timers = {}
+        self._counters = {}
+        self._values = {}
+
+        # Measuring is enabled as long as anything asks for it
+        self._requesters = set()
+        self._startTime = time.time()
+
+
+    def setEnabled(self, enabled, requester=None):
+
+        if enabled:
+            self._requesters.add(requester)
+        else:
+            self._requesters.discard(requester)
+
+        PerformanceRegistry.Enabled = bool(self._requesters)
+
+
+    def isEnabled(self):
+
+        return PerformanceRegistry.Enabled
+
+
+    def reset(self):
+
+        with self._lock:
+            self._timers.clear()
+            self._counters.clear()
+            self._values.clear()
+            self._startTime = time.time()
+
+
+    def addTime(self, name, seconds):
+
+        with self._lock:
+            timer = self._timers.get(name)
+            if timer is None:
+                self._timers[name] = [1, seconds, seconds]
+            else:
+                timer[0] += 1
+                timer[1] += seconds
+                if seconds > timer[2]:
+                    timer[2] = seconds
+
+
+    def addCount(self, name, count=1):
+
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + count
+
+
+    def setValue(self, name, key, value):
+
+        with self._lock:
+            self._values.setdefault(name, {})[key] = value
+
+
+    def clearValues(self, name):
+
+        with self._lock:
+            self._values.pop(name, None)
+
+
+    def timer(self, name):
+
+        # Count, total and maximum seconds
+        with self._lock:
+            return tuple(self._timers.get(name, (0, 0.0, 0.0)))
+
+
+    def counter(self, name):
+
+        with self._lock:
+            return self._counters.get(name, 0)
+
+
+    def values(self, name):
+
+        with self._lock:
+            return dict(self._values.get(name, {}))
+
+
+    def rate(self, counterName, timerName):
+
+        # Count per second of time measured
+        seconds = self.timer(timerName)[1]
+
+        return self.counter(counterName) / seconds if seconds > 0 else 0.0
+
+
+    def toDict(self):
+
+        with self._lock:
+            return {
+                "started": self._startTime,
+                "exported": time.time(),
+                "timers": {name: {"count": count, "total": total, "maximum": maximum} for name, (count, total, maximum) in sorted(self._timers.items())},
+                "counters": dict(sorted(self._counters.items())),
+                "values": {name: dict(sorted(values.items())) for name, values in sorted(self._values.items())},
+            }
+
+
+    def exportJson(self, fileName):
+
+        with open(fileName, "w", encoding="utf-8") as file:
+            json.dump(self.toDict(), file, indent=4)
+            file.write("\n")
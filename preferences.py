@@ -20,7 +20,7 @@
 
 from enum import Enum
 
-from PySide2.QtCore import QSettings
+from settings_cache import SettingsCache
 
 
 class Preferences:
@@ -44,6 +44,23 @@ class Preferences:
         self._maximumRecentDocuments = 10
         self._restoreRecentDocuments = True
 
+        # Documents: Loading
+        self._maximumConcurrentLoads = 4
+        self._indexCacheBudget = 1024
+
+        # Documents: Saving
+        self._maximumConcurrentSaves = 4
+        self._autosaveInterval = 10
+
+        # Documents: Editing
+        self._undoMemoryLimit = 64
+
+        # Documents: Searching
+        self._buildSearchIndexes = True
+
+        # Documents: Sorting
+        self._sortMemoryBudget = 512
+
         # Document Presets: Header Labels
         self._defaultHeaderLabelHorizontal = self.HeaderLabel.Letter
         self._defaultHeaderLabelVertical = self.HeaderLabel.Decimal
@@ -55,7 +72,7 @@ class Preferences:
 
     def loadSettings(self):
 
-        settings = QSettings()
+        settings = SettingsCache.instance()
 
         settings.beginGroup("Preferences")
 
@@ -67,6 +84,23 @@ class Preferences:
         self.setMaximumRecentDocuments(int(settings.value("MaximumRecentDocuments", 10)))
         self.setRestoreRecentDocuments(self._valueToBool(settings.value("RestoreRecentDocuments", True)))
 
+        # Documents: Loading
+        self.setMaximumConcurrentLoads(int(settings.value("MaximumConcurrentLoads", 4)))
+        self.setIndexCacheBudget(int(settings.value("IndexCacheBudget", 1024)))
+
+        # Documents: Saving
+        self.setMaximumConcurrentSaves(int(settings.value("MaximumConcurrentSaves", 4)))
+        self.setAutosaveInterval(int(settings.value("AutosaveInterval", 10)))
+
+        # Documents: Editing
+        self.setUndoMemoryLimit(int(settings.value("UndoMemoryLimit", 64)))
+
+        # Documents: Searching
+        self.setBuildSearchIndexes(self._valueToBool(settings.value("BuildSearchIndexes", True)))
+
+        # Documents: Sorting
+        self.setSortMemoryBudget(int(settings.value("SortMemoryBudget", 512)))
+
         # Document Presets: Header Labels
         self.setDefaultHeaderLabelHorizontal(Preferences.HeaderLabel(int(settings.value("DefaultHeaderLabelHorizontal", self.HeaderLabel.Letter.value))))
         self.setDefaultHeaderLabelVertical(Preferences.HeaderLabel(int(settings.value("DefaultHeaderLabelVertical", self.HeaderLabel.Decimal.value))))
@@ -80,9 +114,9 @@ class Preferences:
 
     def saveSettings(self):
 
-        settings = QSettings()
+        settings = SettingsCache.instance()
 
-        settings.remove("Preferences")
+        # Only values which have changed are written
         settings.beginGroup("Preferences")
 
         # General: Geometry & State
@@ -93,6 +127,23 @@ class Preferences:
         settings.setValue("MaximumRecentDocuments", self._maximumRecentDocuments)
         settings.setValue("RestoreRecentDocuments", self._restoreRecentDocuments)
 
+        # Documents: Loading
+        settings.setValue("MaximumConcurrentLoads", self._maximumConcurrentLoads)
+        settings.setValue("IndexCacheBudget", self._indexCacheBudget)
+
+        # Documents: Saving
+        settings.setValue("MaximumConcurrentSaves", self._maximumConcurrentSaves)
+        settings.setValue("AutosaveInterval", self._autosaveInterval)
+
+        # Documents: Editing
+        settings.setValue("UndoMemoryLimit", self._undoMemoryLimit)
+
+        # Documents: Searching
+        settings.setValue("BuildSearchIndexes", self._buildSearchIndexes)
+
+        # Documents: Sorting
+        settings.setValue("SortMemoryBudget", self._sortMemoryBudget)
+
         # Document Presets: Header Labels
         settings.setValue("DefaultHeaderLabelHorizontal", self._defaultHeaderLabelHorizontal.value)
         settings.setValue("DefaultHeaderLabelVertical", self._defaultHeaderLabelVertical.value)
@@ -150,6 +201,76 @@ class Preferences:
         return self._restoreRecentDocuments if not isDefault else True
 
 
+    def setMaximumConcurrentLoads(self, value):
+
+        self._maximumConcurrentLoads = value if value >= 1 and value <= 64 else 4
+
+
+    def maximumConcurrentLoads(self, isDefault=False):
+
+        return self._maximumConcurrentLoads if not isDefault else 4
+
+
+    def setIndexCacheBudget(self, value):
+
+        self._indexCacheBudget = value if value >= 0 and value <= 1048576 else 1024
+
+
+    def indexCacheBudget(self, isDefault=False):
+
+        return self._indexCacheBudget if not isDefault else 1024
+
+
+    def setMaximumConcurrentSaves(self, value):
+
+        self._maximumConcurrentSaves = value if value >= 1 and value <= 64 else 4
+
+
+    def maximumConcurrentSaves(self, isDefault=False):
+
+        return self._maximumConcurrentSaves if not isDefault else 4
+
+
+    def setAutosaveInterval(self, value):
+
+        self._autosaveInterval = value if value >= 0 and value <= 3600 else 10
+
+
+    def autosaveInterval(self, isDefault=False):
+
+        return self._autosaveInterval if not isDefault else 10
+
+
+    def setUndoMemoryLimit(self, value):
+
+        self._undoMemoryLimit = value if value >= 1 and value <= 4096 else 64
+
+
+    def undoMemoryLimit(self, isDefault=False):
+
+        return self._undoMemoryLimit if not isDefault else 64
+
+
+    def setBuildSearchIndexes(self, value):
+
+        self._buildSearchIndexes = value
+
+
+    def buildSearchIndexes(self, isDefault=False):
+
+        return self._buildSearchIndexes if not isDefault else True
+
+
+    def setSortMemoryBudget(self, value):
+
+        self._sortMemoryBudget = value if value >= 16 and value <= 65536 else 512
+
+
+    def sortMemoryBudget(self, isDefault=False):
+
+        return self._sortMemoryBudget if not isDefault else 512
+
+
     def setDefaultHeaderLabelHorizontal(self, value):
 
         self._defaultHeaderLabelHorizontal = value
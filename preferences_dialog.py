@@ -130,6 +130,23 @@ class PreferencesDialog(QDialog):
         self._generalPage.setMaximumRecentDocuments(self._preferences.maximumRecentDocuments(isDefault))
         self._generalPage.setRestoreRecentDocuments(self._preferences.restoreRecentDocuments(isDefault))
 
+        # Documents: Loading
+        self._documentsPage.setMaximumConcurrentLoads(self._preferences.maximumConcurrentLoads(isDefault))
+        self._documentsPage.setIndexCacheBudget(self._preferences.indexCacheBudget(isDefault))
+
+        # Documents: Saving
+        self._documentsPage.setMaximumConcurrentSaves(self._preferences.maximumConcurrentSaves(isDefault))
+        self._documentsPage.setAutosaveInterval(self._preferences.autosaveInterval(isDefault))
+
+        # Documents: Editing
+        self._documentsPage.setUndoMemoryLimit(self._preferences.undoMemoryLimit(isDefault))
+
+        # Documents: Searching
+        self._documentsPage.setBuildSearchIndexes(self._preferences.buildSearchIndexes(isDefault))
+
+        # Documents: Sorting
+        self._documentsPage.setSortMemoryBudget(self._preferences.sortMemoryBudget(isDefault))
+
         # Document Presets: Header Labels
         self._documentPresetsPage.setDefaultHeaderLabelHorizontal(self._preferences.defaultHeaderLabelHorizontal(isDefault))
         self._documentPresetsPage.setDefaultHeaderLabelVertical(self._preferences.defaultHeaderLabelVertical(isDefault))
@@ -149,6 +166,23 @@ class PreferencesDialog(QDialog):
         self._preferences.setMaximumRecentDocuments(self._generalPage.maximumRecentDocuments())
         self._preferences.setRestoreRecentDocuments(self._generalPage.restoreRecentDocuments())
 
+        # Documents: Loading
+        self._preferences.setMaximumConcurrentLoads(self._documentsPage.maximumConcurrentLoads())
+        self._preferences.setIndexCacheBudget(self._documentsPage.indexCacheBudget())
+
+        # Documents: Saving
+        self._preferences.setMaximumConcurrentSaves(self._documentsPage.maximumConcurrentSaves())
+        self._preferences.setAutosaveInterval(self._documentsPage.autosaveInterval())
+
+        # Documents: Editing
+        self._preferences.setUndoMemoryLimit(self._documentsPage.undoMemoryLimit())
+
+        # Documents: Searching
+        self._preferences.setBuildSearchIndexes(self._documentsPage.buildSearchIndexes())
+
+        # Documents: Sorting
+        self._preferences.setSortMemoryBudget(self._documentsPage.sortMemoryBudget())
+
         # Document Presets: Header Labels
         self._preferences.setDefaultHeaderLabelHorizontal(self._documentPresetsPage.defaultHeaderLabelHorizontal())
         self._preferences.setDefaultHeaderLabelVertical(self._documentPresetsPage.defaultHeaderLabelVertical())
@@ -19,7 +19,7 @@
 #
 
 from PySide2.QtCore import Signal
-from PySide2.QtWidgets import QLabel, QVBoxLayout, QWidget
+from PySide2.QtWidgets import QCheckBox, QFormLayout, QGroupBox, QLabel, QSpinBox, QVBoxLayout, QWidget
 
 
 class PreferencesDocumentsPage(QWidget):
@@ -34,12 +34,100 @@ class PreferencesDocumentsPage(QWidget):
         title = QLabel(self.tr("<strong style=\"font-size:large;\">{0}</strong>").format(self.title()))
 
         #
-        # Content
+        # Content: Loading
 
+        self._spbMaximumConcurrentLoads = QSpinBox()
+        self._spbMaximumConcurrentLoads.setRange(1, 64)
+        self._spbMaximumConcurrentLoads.setToolTip(self.tr("Maximum number of documents loaded at the same time"))
+        self._spbMaximumConcurrentLoads.valueChanged.connect(self._onPreferencesChanged)
+
+        self._spbIndexCacheBudget = QSpinBox()
+        self._spbIndexCacheBudget.setRange(0, 1048576)
+        self._spbIndexCacheBudget.setSuffix(self.tr(" MiB"))
+        self._spbIndexCacheBudget.setSpecialValueText(self.tr("None"))
+        self._spbIndexCacheBudget.setToolTip(self.tr("Row indexes of read-only documents are kept on disk to reopen the documents faster"))
+        self._spbIndexCacheBudget.valueChanged.connect(self._onPreferencesChanged)
+
+        loadingLayout = QFormLayout()
+        loadingLayout.addRow(self.tr("Documents loaded at once"), self._spbMaximumConcurrentLoads)
+        loadingLayout.addRow(self.tr("Disk space for row indexes"), self._spbIndexCacheBudget)
+
+        loadingGroup = QGroupBox(self.tr("Loading"))
+        loadingGroup.setLayout(loadingLayout)
+
+        #
+        # Content: Saving
+
+        self._spbMaximumConcurrentSaves = QSpinBox()
+        self._spbMaximumConcurrentSaves.setRange(1, 64)
+        self._spbMaximumConcurrentSaves.setToolTip(self.tr("Maximum number of documents saved at the same time"))
+        self._spbMaximumConcurrentSaves.valueChanged.connect(self._onPreferencesChanged)
+
+        self._spbAutosaveInterval = QSpinBox()
+        self._spbAutosaveInterval.setRange(0, 3600)
+        self._spbAutosaveInterval.setSuffix(self.tr(" s"))
+        self._spbAutosaveInterval.setSpecialValueText(self.tr("Never"))
+        self._spbAutosaveInterval.setToolTip(self.tr("Unsaved edits are recorded next to the document and can be recovered after a crash"))
+        self._spbAutosaveInterval.valueChanged.connect(self._onPreferencesChanged)
+
+        savingLayout = QFormLayout()
+        savingLayout.addRow(self.tr("Documents saved at once"), self._spbMaximumConcurrentSaves)
+        savingLayout.addRow(self.tr("Record unsaved edits every"), self._spbAutosaveInterval)
+
+        savingGroup = QGroupBox(self.tr("Saving"))
+        savingGroup.setLayout(savingLayout)
+
+        #
+        # Content: Editing
+
+        self._spbUndoMemoryLimit = QSpinBox()
+        self._spbUndoMemoryLimit.setRange(1, 4096)
+        self._spbUndoMemoryLimit.setSuffix(self.tr(" MiB"))
+        self._spbUndoMemoryLimit.setToolTip(self.tr("The oldest edits can no longer be undone once the history takes more memory"))
+        self._spbUndoMemoryLimit.valueChanged.connect(self._onPreferencesChanged)
+
+        editingLayout = QFormLayout()
+        editingLayout.addRow(self.tr("Memory for undo history"), self._spbUndoMemoryLimit)
+
+        editingGroup = QGroupBox(self.tr("Editing"))
+        editingGroup.setLayout(editingLayout)
+
+        #
+        # Content: Searching
+
+        self._chkBuildSearchIndexes = QCheckBox(self.tr("Index a column when it is searched on its own the first time"))
+        self._chkBuildSearchIndexes.setToolTip(self.tr("Repeated searches of the current column are answered from its index instead of reading all cells again"))
+        self._chkBuildSearchIndexes.stateChanged.connect(self._onPreferencesChanged)
+
+        searchingLayout = QVBoxLayout()
+        searchingLayout.addWidget(self._chkBuildSearchIndexes)
+
+        searchingGroup = QGroupBox(self.tr("Searching"))
+        searchingGroup.setLayout(searchingLayout)
+
+        #
+        # Content: Sorting
+
+        self._spbSortMemoryBudget = QSpinBox()
+        self._spbSortMemoryBudget.setRange(16, 65536)
+        self._spbSortMemoryBudget.setSuffix(self.tr(" MiB"))
+        self._spbSortMemoryBudget.setToolTip(self.tr("Larger documents are sorted in parts on disk and merged"))
+        self._spbSortMemoryBudget.valueChanged.connect(self._onPreferencesChanged)
+
+        sortingLayout = QFormLayout()
+        sortingLayout.addRow(self.tr("Memory for sorting"), self._spbSortMemoryBudget)
+
+        sortingGroup = QGroupBox(self.tr("Sorting"))
+        sortingGroup.setLayout(sortingLayout)
 
         # Main layout
         self._layout = QVBoxLayout(self)
         self._layout.addWidget(title)
+        self._layout.addWidget(loadingGroup)
+        self._layout.addWidget(savingGroup)
+        self._layout.addWidget(editingGroup)
+        self._layout.addWidget(searchingGroup)
+        self._layout.addWidget(sortingGroup)
         self._layout.addStretch(1)
 
 
@@ -56,3 +144,73 @@ class PreferencesDocumentsPage(QWidget):
     def _onPreferencesChanged(self):
 
         self.preferencesChanged.emit()
+
+
+    def setMaximumConcurrentLoads(self, val):
+
+        self._spbMaximumConcurrentLoads.setValue(val)
+
+
+    def maximumConcurrentLoads(self):
+
+        return self._spbMaximumConcurrentLoads.value()
+
+
+    def setIndexCacheBudget(self, val):
+
+        self._spbIndexCacheBudget.setValue(val)
+
+
+    def indexCacheBudget(self):
+
+        return self._spbIndexCacheBudget.value()
+
+
+    def setMaximumConcurrentSaves(self, val):
+
+        self._spbMaximumConcurrentSaves.setValue(val)
+
+
+    def maximumConcurrentSaves(self):
+
+        return self._spbMaximumConcurrentSaves.value()
+
+
+    def setAutosaveInterval(self, val):
+
+        self._spbAutosaveInterval.setValue(val)
+
+
+    def autosaveInterval(self):
+
+        return self._spbAutosaveInterval.value()
+
+
+    def setUndoMemoryLimit(self, val):
+
+        self._spbUndoMemoryLimit.setValue(val)
+
+
+    def undoMemoryLimit(self):
+
+        return self._spbUndoMemoryLimit.value()
+
+
+    def setBuildSearchIndexes(self, checked):
+
+        self._chkBuildSearchIndexes.setChecked(checked)
+
+
+    def buildSearchIndexes(self):
+
+        return self._chkBuildSearchIndexes.isChecked()
+
+
+    def setSortMemoryBudget(self, val):
+
+        self._spbSortMemoryBudget.setValue(val)
+
+
+    def sortMemoryBudget(self):
+
+        return self._spbSortMemoryBudget.value()
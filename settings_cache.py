@@ -0,0 +1,221 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from PySide2.QtCore import QObject, QRunnable, QSettings, QThreadPool, QTimer
+
+
+_instance = None
+
+
+class SettingsCacheWriter(QRunnable):
+
+    def __init__(self, values, removedKeys):
+        super().__init__()
+
+        self._values = values
+        self._removedKeys = removedKeys
+
+
+    def run(self):
+
+        settings = QSettings()
+
+        for key in self._removedKeys:
+            settings.remove(key)
+        for key, value in self._values.items():
+            settings.setValue(key, value)
+
+        settings.sync()
+
+
+class SettingsCache(QObject):
+
+    # Changes are written once no more changes have been made for this long
+    FlushDelay = 1000
+
+
+    @staticmethod
+    def instance():
+
+        # Settings are read once per process and shared
+        global _instance
+        if _instance is None:
+            _instance = SettingsCache()
+
+        return _instance
+
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Values by key as used, and as last written; only the keys changed
+        # since are compared and written.
+        settings = QSettings()
+        self._values = {key: settings.value(key) for key in settings.allKeys()}
+        self._storedValues = dict(self._values)
+        self._changedKeys = set()
+
+        # Groups entered, innermost last: [name, array index, array size];
+        # the size is counted only for arrays written without a size.
+        self._groups = []
+
+        # Changes are written on a worker thread, one flush after the other
+        self._flushTimer = QTimer(self)
+        self._flushTimer.setSingleShot(True)
+        self._flushTimer.timeout.connect(self.flush)
+
+        self._writePool = QThreadPool(self)
+        self._writePool.setMaxThreadCount(1)
+
+
+    def beginGroup(self, prefix):
+
+        self._groups.append([prefix, None, None])
+
+
+    def endGroup(self):
+
+        self._groups.pop()
+
+
+    def beginReadArray(self, prefix):
+
+        size = int(self.value(prefix + "/size", 0))
+        self._groups.append([prefix, None, None])
+
+        return size
+
+
+    def beginWriteArray(self, prefix, size=-1):
+
+        # As with QSettings, a given size is written at once; otherwise the
+        # size is counted and written when the array ends.
+        if size >= 0:
+            self.setValue(prefix + "/size", size)
+            self._groups.append([prefix, None, None])
+        else:
+            self.remove(prefix + "/size")
+            self._groups.append([prefix, None, 0])
+
+
+    def setArrayIndex(self, index):
+
+        group = self._groups[-1]
+        group[1] = index
+        if group[2] is not None:
+            group[2] = max(group[2], index + 1)
+
+
+    def endArray(self):
+
+        prefix, _, size = self._groups.pop()
+        if size is not None:
+            self.setValue(prefix + "/size", size)
+
+
+    def contains(self, key):
+
+        return self._key(key) in self._values
+
+
+    def value(self, key, defaultValue=None):
+
+        return self._values.get(self._key(key), defaultValue)
+
+
+    def setValue(self, key, value):
+
+        key = self._key(key)
+
+        self._values[key] = value
+        self._changedKeys.add(key)
+        self._flushTimer.start(self.FlushDelay)
+
+
+    def remove(self, key):
+
+        # Removes the key and all keys below it
+        key = self._key(key)
+        prefix = key + "/"
+
+        for removedKey in [k for k in self._values if k == key or k.startswith(prefix)]:
+            del self._values[removedKey]
+            self._changedKeys.add(removedKey)
+
+        self._flushTimer.start(self.FlushDelay)
+
+
+    def flush(self):
+
+        # Keys set to the values they had are not written again
+        self._flushTimer.stop()
+
+        values = {}
+        removedKeys = []
+        for key in self._changedKeys:
+            if key in self._values:
+                if key not in self._storedValues or not self._isSameValue(self._storedValues[key], self._values[key]):
+                    values[key] = self._values[key]
+                    self._storedValues[key] = self._values[key]
+            elif key in self._storedValues:
+                removedKeys.append(key)
+                del self._storedValues[key]
+
+        self._changedKeys.clear()
+
+        if values or removedKeys:
+            self._writePool.start(SettingsCacheWriter(values, removedKeys))
+
+
+    def sync(self):
+
+        # Returns once all changes have been written
+        self.flush()
+        self._writePool.waitForDone()
+
+
+    @staticmethod
+    def _storedForm(value):
+
+        # Values as read back from the settings file: numbers and booleans as
+        # texts, lists of a single value as the value
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        elif isinstance(value, (int, float)):
+            return str(value)
+        elif isinstance(value, (list, tuple)):
+            if len(value) == 1:
+                return SettingsCache._storedForm(value[0])
+            return [SettingsCache._storedForm(item) for item in value] if value else None
+
+        return value
+
+
+    def _isSameValue(self, storedValue, value):
+
+        return storedValue == value or self._storedForm(storedValue) == self._storedForm(value)
+
+
+    def _key(self, key):
+
+        parts = [name if index is None else "{0}/{1}".format(name, index + 1) for name, index, _ in self._groups]
+        parts.append(key)
+
+        return "/".join(parts)
@@ -0,0 +1,67 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+import sys
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+import pytest
+from PySide2.QtCore import QCoreApplication, QEventLoop, QSettings, QStandardPaths, QThreadPool, QTimer
+from PySide2.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+
+    # Settings, caches and journal lists of the tests are kept apart from the user's
+    QStandardPaths.setTestModeEnabled(True)
+    QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, str(tmp_path_factory.mktemp("settings")))
+
+    app = QApplication.instance() or QApplication([])
+    app.setOrganizationName("NotNypical")
+    app.setApplicationName("Tabulator-QtPy Tests")
+
+    yield app
+
+
+def waitUntil(condition, timeout=10000):
+
+    # Processes events until the condition holds; returns whether it does
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.start(timeout)
+
+    while not condition() and timer.isActive():
+        QThreadPool.globalInstance().waitForDone(10)
+        QCoreApplication.processEvents(QEventLoop.AllEvents, 50)
+
+    return condition()
+
+
+def writeDocument(directory, name, rows):
+
+    fileName = os.path.join(directory, name)
+    with open(fileName, "w", encoding="utf-8", newline="") as file:
+        file.writelines(",".join(row) + "\n" for row in rows)
+
+    return os.path.realpath(fileName)
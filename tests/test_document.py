@@ -0,0 +1,267 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+
+from PySide2.QtCore import QItemSelection, QItemSelectionModel, QThreadPool
+from PySide2.QtWidgets import QMessageBox
+
+from conftest import waitUntil, writeDocument
+from document import Document
+from document_mapped_store import DocumentMappedStore
+from document_journal import DocumentJournal
+from document_table import DocumentTable
+
+
+def loadDocument(fileName, readOnly=False):
+
+    document = Document()
+
+    finished = []
+    document.loadFinished.connect(lambda succeeded, errorMessage: finished.append(succeeded))
+    assert document.load(fileName, readOnly)
+    document.startLoading()
+    assert waitUntil(lambda: finished) and finished[0]
+
+    return document
+
+
+def test_clear_sort_ignores_finished_sorter(app, tmp_path):
+
+    fileName = writeDocument(str(tmp_path), "sort.csv", [[str(row % 7), str(row)] for row in range(1000)])
+    document = loadDocument(fileName)
+    model = document.findChild(DocumentTable).model()
+
+    # The sorter finishes before the sort is cleared; its result is delivered after
+    assert document.sortRows(0)
+    QThreadPool.globalInstance().waitForDone()
+    document.clearSort()
+    waitUntil(lambda: False, 200)
+
+    assert not document.isSorting()
+    assert document.sortKeys() == []
+    assert model.rowOrder() is None
+
+    document.close()
+
+
+def test_copy_refused_while_loading(app, tmp_path):
+
+    fileName = writeDocument(str(tmp_path), "copy.csv", [[str(row), "text"] for row in range(500000)])
+
+    document = Document()
+    finished = []
+    document.loadFinished.connect(lambda succeeded, errorMessage: finished.append(succeeded))
+    assert document.load(fileName)
+    document.startLoading()
+
+    # The first rows have been read, the last ones not yet
+    table = document.findChild(DocumentTable)
+    assert waitUntil(lambda: table.model().rowCount() > 0)
+    table.selectAll()
+    assert document.isLoading()
+    assert not document.copy()
+
+    assert waitUntil(lambda: finished)
+    copied = []
+    document.copyFinished.connect(lambda succeeded, errorMessage: copied.append(succeeded))
+    table.selectAll()
+    assert document.copy()
+    assert waitUntil(lambda: copied) and copied[0]
+
+    document.close()
+
+
+def editedDocument(tmp_path, answer):
+
+    # A document with one edited cell, answering the question to save it on close
+    fileName = writeDocument(str(tmp_path), "edited.csv", [["a", "b"], ["1", "2"]])
+    document = loadDocument(fileName)
+    document._askSaveChanges = lambda: answer
+
+    model = document.findChild(DocumentTable).model()
+    assert model.setData(model.index(0, 0), "edited")
+    assert document.isModified()
+
+    closed = []
+    document.aboutToClose.connect(closed.append)
+
+    return document, fileName, closed
+
+
+def test_close_modified_canceled(app, tmp_path):
+
+    document, fileName, closed = editedDocument(tmp_path, QMessageBox.Cancel)
+
+    assert not document.close()
+    assert not closed and document.isModified()
+
+    document._askSaveChanges = lambda: QMessageBox.Discard
+    document.close()
+
+
+def test_close_modified_discarded(app, tmp_path):
+
+    document, fileName, closed = editedDocument(tmp_path, QMessageBox.Discard)
+
+    assert document.close()
+    assert closed
+    with open(fileName, encoding="utf-8") as file:
+        assert file.read() == "a,b\n1,2\n"
+
+
+def test_close_modified_saved(app, tmp_path):
+
+    document, fileName, closed = editedDocument(tmp_path, QMessageBox.Save)
+
+    # The document is closed once it has been saved
+    assert not document.close()
+    assert waitUntil(lambda: closed)
+    with open(fileName, encoding="utf-8") as file:
+        assert file.read() == "edited,b\n1,2\n"
+
+
+def test_close_canceled_keeps_journal(app, tmp_path):
+
+    document, fileName, closed = editedDocument(tmp_path, QMessageBox.Cancel)
+    document.flushJournal()
+    assert os.path.exists(DocumentJournal.journalName(fileName))
+
+    assert not document.close()
+    assert os.path.exists(DocumentJournal.journalName(fileName))
+
+    document._askSaveChanges = lambda: QMessageBox.Discard
+    document.close()
+
+
+def test_close_discarded_removes_journal(app, tmp_path):
+
+    document, fileName, closed = editedDocument(tmp_path, QMessageBox.Discard)
+    document.flushJournal()
+    assert os.path.exists(DocumentJournal.journalName(fileName))
+
+    assert document.close()
+    assert not os.path.exists(DocumentJournal.journalName(fileName))
+
+
+def test_close_saved_removes_journal(app, tmp_path):
+
+    document, fileName, closed = editedDocument(tmp_path, QMessageBox.Save)
+    document.flushJournal()
+    assert os.path.exists(DocumentJournal.journalName(fileName))
+
+    assert not document.close()
+    assert waitUntil(lambda: closed)
+    assert not os.path.exists(DocumentJournal.journalName(fileName))
+
+
+def test_close_not_saved_keeps_journal(app, tmp_path):
+
+    document, fileName, closed = editedDocument(tmp_path, QMessageBox.Save)
+    document.flushJournal()
+
+    # The document cannot be written over a directory
+    saved = []
+    document.saveFinished.connect(lambda succeeded, errorMessage: saved.append(succeeded))
+    os.remove(fileName)
+    os.mkdir(fileName)
+
+    assert not document.close()
+    assert waitUntil(lambda: saved) and not saved[0]
+    assert not closed and document.isModified()
+    assert os.path.exists(DocumentJournal.journalName(fileName))
+
+    document._askSaveChanges = lambda: QMessageBox.Discard
+    document.close()
+
+
+def test_search_locks_table(app, tmp_path):
+
+    fileName = writeDocument(str(tmp_path), "search.csv", [[str(row), "x"] for row in range(200000)])
+    document = loadDocument(fileName)
+    model = document.findChild(DocumentTable).model()
+
+    finished = []
+    document.searchFinished.connect(lambda succeeded, errorMessage: finished.append(succeeded))
+    document._findBar._ledText.setText("199999")
+    document.findAll()
+
+    # Cells cannot be edited while they are searched
+    assert model.isLocked()
+    assert waitUntil(lambda: finished) and finished[0]
+    assert not model.isLocked()
+
+    document._askSaveChanges = lambda: QMessageBox.Discard
+    document.close()
+
+
+def test_copy_and_paste_column_with_commas(app, tmp_path):
+
+    fileName = writeDocument(str(tmp_path), "clipboard.csv", [["\"a, b\"", "x"], ["c", "y"]])
+    document = loadDocument(fileName)
+    table = document.findChild(DocumentTable)
+    model = table.model()
+
+    table.selectionModel().select(QItemSelection(model.index(0, 0), model.index(1, 0)), QItemSelectionModel.ClearAndSelect)
+    assert document.copy()
+
+    table.selectionModel().select(model.index(0, 1), QItemSelectionModel.ClearAndSelect)
+    assert document.paste()
+    assert [model.index(row, 1).data() for row in range(2)] == ["a, b", "c"]
+
+    document._askSaveChanges = lambda: QMessageBox.Discard
+    document.close()
+
+
+def test_close_releases_mapped_document(app, tmp_path):
+
+    fileName = writeDocument(str(tmp_path), "mapped.csv", [["a", "b"], ["1", "2"]])
+    document = loadDocument(fileName, True)
+    store = document.findChild(DocumentTable).store()
+    assert isinstance(store, DocumentMappedStore)
+    assert store.rowValues(1) == ["1", "2"]
+
+    mapping = store._map
+    assert document.close()
+    assert mapping.closed
+    assert store.rowValues(0) == []
+
+
+def test_save_replaces_document(app, tmp_path):
+
+    fileName = writeDocument(str(tmp_path), "saved.csv", [["a", "b"], ["1", "2"]])
+    os.chmod(fileName, 0o640)
+    document = loadDocument(fileName)
+    model = document.findChild(DocumentTable).model()
+    assert model.setData(model.index(1, 1), "3, 4")
+
+    saved = []
+    document.saveFinished.connect(lambda succeeded, errorMessage: saved.append(succeeded))
+    assert document.save(fileName)
+    assert waitUntil(lambda: saved) and saved[0]
+
+    # The document is replaced as a whole and keeps its permissions
+    with open(fileName, encoding="utf-8") as file:
+        assert file.read() == "a,b\n1,\"3, 4\"\n"
+    assert os.stat(fileName).st_mode & 0o777 == 0o640
+    assert not [name for name in os.listdir(str(tmp_path)) if name.endswith(".tmp")]
+    assert not document.isModified()
+
+    document.close()
@@ -0,0 +1,73 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from document_clipboard_reader import DocumentClipboardReader
+from document_clipboard_writer import DocumentClipboardWriter
+from document_store import DocumentStore
+
+
+def copyText(rows, storeRows, columns):
+
+    store = DocumentStore()
+    store.appendRows(rows)
+
+    writer = DocumentClipboardWriter(store, storeRows, columns)
+    for _ in writer.writeBlocks():
+        pass
+
+    return writer.text()
+
+
+def pasteRows(text, delimiter="\t"):
+
+    reader = DocumentClipboardReader(text, delimiter)
+    for _ in reader.readBlocks():
+        pass
+
+    return reader.rows()
+
+
+def test_single_cell_is_not_quoted():
+
+    assert copyText([["a\"b", "c"]], range(0, 1), range(0, 1)) == "a\"b"
+    assert pasteRows("a\"b") == [["a\"b"]]
+    assert pasteRows("\"a\"\n") == [["\"a\""]]
+
+
+def test_column_with_commas_round_trip():
+
+    rows = [["a, b"], ["c"], ["d, e, f"]]
+    text = copyText(rows, range(0, 3), range(0, 1))
+
+    assert pasteRows(text) == rows
+
+
+def test_cells_round_trip():
+
+    rows = [["a\tb", "c\"d"], ["e\nf", ""]]
+    text = copyText(rows, range(0, 2), range(0, 2))
+
+    assert pasteRows(text) == rows
+
+
+def test_comma_separated_values_need_their_delimiter():
+
+    assert pasteRows("a,b\nc,d") == [["a,b"], ["c,d"]]
+    assert pasteRows("a,\"b,c\"\nd,e", ",") == [["a", "b,c"], ["d", "e"]]
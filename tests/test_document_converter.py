@@ -0,0 +1,67 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from conftest import writeDocument
+from document_converter import DocumentConverter
+from preferences import Preferences
+
+
+def convertDocument(directory, rows, inputHeader=None, columns=None, first=0):
+
+    inputName = writeDocument(directory, "input.csv", rows)
+    outputName = str(directory / "output.csv")
+
+    converter = DocumentConverter(inputName, outputName)
+    converter.setInputDialect(",", "\"", "utf-8")
+    converter.setHeaderLabel(Preferences.HeaderLabel.Letter)
+    converter.setInputHeader(inputHeader)
+    converter.setColumns(columns)
+    converter.setRows(first)
+    for _ in converter.convertBlocks():
+        pass
+
+    with open(outputName, encoding="utf-8") as file:
+        return [line.split(",") for line in file.read().splitlines()]
+
+
+def test_header_label_replaces_input_header(tmp_path):
+
+    rows = [["name", "count"], ["a", "1"], ["b", "2"]]
+
+    assert convertDocument(tmp_path, rows, True) == [["A", "B"], ["a", "1"], ["b", "2"]]
+    assert convertDocument(tmp_path, rows, True, [(1, 2)]) == [["A"], ["1"], ["2"]]
+    assert convertDocument(tmp_path, [["name", "count"]], True) == [["A", "B"]]
+
+
+def test_header_label_inserted_without_input_header(tmp_path):
+
+    rows = [["a", "1"], ["b", "2"]]
+
+    assert convertDocument(tmp_path, rows, False) == [["A", "B"], ["a", "1"], ["b", "2"]]
+
+    # Rows after the header row are labeled as well
+    assert convertDocument(tmp_path, [["name", "count"], ["a", "1"]], True, first=1) == [["A", "B"], ["a", "1"]]
+
+
+def test_header_label_input_header_detected(tmp_path):
+
+    rows = [["name", "count"]] + [[chr(ord("a") + row % 26), str(row)] for row in range(50)]
+
+    assert convertDocument(tmp_path, rows)[:2] == [["A", "B"], ["a", "0"]]
@@ -0,0 +1,64 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+from array import array
+
+from conftest import writeDocument
+from document_index_cache import DocumentIndexCache
+
+
+def commitIndex(cache, fileName, delimiter, columnCount):
+
+    # Offsets of the two rows of the document
+    cache.prepare()
+    with open(cache.temporaryFileName(fileName, delimiter), "wb") as file:
+        array("q", [0, 6]).tofile(file)
+
+    cache.commit(fileName, delimiter, "\"", "utf-8", 2, columnCount)
+
+
+def test_index_per_delimiter(tmp_path):
+
+    fileName = writeDocument(str(tmp_path), "document.csv", [["a;b", "c"], ["d;e", "f"]])
+    cache = DocumentIndexCache(str(tmp_path / "indexes"), 1024 * 1024)
+
+    commitIndex(cache, fileName, ",", 2)
+    assert cache.find(fileName, ";", "\"", "utf-8") is None
+
+    commitIndex(cache, fileName, ";", 3)
+    metadata, offsetsFileName = cache.find(fileName, ",", "\"", "utf-8")
+    assert metadata["delimiter"] == "," and metadata["columnCount"] == 2
+
+    metadata, offsetsFileName = cache.find(fileName, ";", "\"", "utf-8")
+    assert metadata["delimiter"] == ";" and metadata["columnCount"] == 3
+
+
+def test_index_of_changed_document_removed(tmp_path):
+
+    fileName = writeDocument(str(tmp_path), "document.csv", [["a", "b"], ["c", "d"]])
+    cache = DocumentIndexCache(str(tmp_path / "indexes"), 1024 * 1024)
+
+    commitIndex(cache, fileName, ",", 2)
+    with open(fileName, "a") as file:
+        file.write("e,f\n")
+
+    assert cache.find(fileName, ",", "\"", "utf-8") is None
+    assert os.listdir(str(tmp_path / "indexes")) == []
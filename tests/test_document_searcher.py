@@ -0,0 +1,69 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from array import array
+
+from document_search_index import DocumentSearchIndex
+from document_searcher import DocumentSearcher
+from document_store import DocumentStore
+
+
+def searchStore(rows, text, mode=DocumentSearcher.Mode.Substring, indexes=None, column=None):
+
+    store = DocumentStore()
+    store.appendRows(rows)
+
+    searcher = DocumentSearcher(store, text, mode, False, indexes, column)
+    searcher.setBlockSize(2)
+
+    return [match for matches in searcher.searchBlocks() for match in matches]
+
+
+def test_search_all_columns_builds_no_index():
+
+    indexes = {}
+    rows = [["a", "b"], ["b", "a"], ["ab", "c"]]
+
+    assert searchStore(rows, "a", indexes=indexes) == [(0, 0), (1, 1), (2, 0)]
+    assert indexes == {}
+
+
+def test_search_column_builds_its_index():
+
+    indexes = {}
+    rows = [["a", "b"], ["b", "a"], ["ab", "a"]]
+
+    assert searchStore(rows, "a", indexes=indexes, column=1) == [(1, 1), (2, 1)]
+    assert list(indexes) == [1]
+    assert isinstance(indexes[1].rows("a"), array)
+
+    # The index answers the next search of the column
+    assert searchStore(rows, "b", DocumentSearcher.Mode.WholeCell, indexes, 1) == [(0, 1)]
+
+
+def test_search_index_memory_cap(monkeypatch):
+
+    monkeypatch.setattr(DocumentSearchIndex, "MaximumBytes", 1024)
+
+    indexes = {}
+    rows = [[str(row)] for row in range(100)]
+
+    assert searchStore(rows, "99", DocumentSearcher.Mode.WholeCell, indexes, 0) == [(99, 0)]
+    assert indexes == {0: None}
@@ -0,0 +1,78 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from document_table import DocumentTable
+
+
+def menuAction(menu, text):
+
+    for action in menu.actions():
+        if action.text() == text:
+            return action
+        if action.menu():
+            found = menuAction(action.menu(), text)
+            if found:
+                return found
+
+    return None
+
+
+def test_insert_and_remove_columns_without_rows(app):
+
+    table = DocumentTable()
+    model = table.model()
+    model.resize(0, 3)
+
+    menu = table.horizontalHeaderMenu(1)
+    assert menuAction(menu, "Insert Column After").isEnabled()
+    menuAction(menu, "Insert Column After").trigger()
+    assert model.columnCount() == 4
+
+    menu = table.horizontalHeaderMenu(0)
+    assert menuAction(menu, "Remove Column").isEnabled()
+    menuAction(menu, "Remove Column").trigger()
+    assert model.columnCount() == 3
+
+
+def test_insert_rows_without_rows(app):
+
+    table = DocumentTable()
+    model = table.model()
+    model.resize(0, 3)
+
+    # Outside any section rows are inserted at the start; none can be removed
+    menu = table.verticalHeaderMenu(-1)
+    assert not menuAction(menu, "Remove Row").isEnabled()
+    assert menuAction(menu, "Insert Row Before").isEnabled()
+    menuAction(menu, "Insert Row Before").trigger()
+    assert model.rowCount() == 1
+
+    menu = table.verticalHeaderMenu(0)
+    assert menuAction(menu, "Remove Row").isEnabled()
+    menuAction(menu, "Remove Row").trigger()
+    assert model.rowCount() == 0
+
+
+def test_sort_actions_need_a_column(app):
+
+    table = DocumentTable()
+
+    assert not menuAction(table.horizontalHeaderMenu(-1), "Ascending").isEnabled()
+    assert menuAction(table.horizontalHeaderMenu(0), "Ascending").isEnabled()
@@ -0,0 +1,99 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+import stat
+
+import pytest
+
+from document_store import DocumentStore
+from document_writer import DocumentWriter
+
+
+def writeStore(fileName, rows):
+
+    store = DocumentStore()
+    store.appendRows(rows)
+
+    writer = DocumentWriter(fileName, store)
+    for _ in writer.writeBlocks():
+        pass
+
+    return writer
+
+
+def test_write_replaces_document(tmp_path):
+
+    fileName = str(tmp_path / "document.csv")
+    with open(fileName, "w") as file:
+        file.write("old\n")
+
+    writer = writeStore(fileName, [["a", "b,c"], ["d", "e"]])
+
+    with open(fileName, encoding="utf-8") as file:
+        assert file.read() == "a,\"b,c\"\nd,e\n"
+    assert writer.rowsWritten() == 2
+    assert os.listdir(str(tmp_path)) == ["document.csv"]
+
+
+def test_write_stopped_keeps_document(tmp_path):
+
+    fileName = str(tmp_path / "document.csv")
+    with open(fileName, "w") as file:
+        file.write("old\n")
+
+    def blocks():
+        yield [["a"]]
+        raise OSError("disk full")
+
+    writer = DocumentWriter(fileName, DocumentStore())
+    with pytest.raises(OSError):
+        for _ in writer.writeRowBlocks(blocks()):
+            pass
+
+    with open(fileName) as file:
+        assert file.read() == "old\n"
+    assert os.listdir(str(tmp_path)) == ["document.csv"]
+
+
+def test_write_keeps_permissions(tmp_path, monkeypatch):
+
+    fileName = str(tmp_path / "document.csv")
+    with open(fileName, "w") as file:
+        file.write("old\n")
+    os.chmod(fileName, 0o640)
+
+    # The process-wide umask is never changed
+    monkeypatch.setattr(os, "umask", None)
+    writeStore(fileName, [["a"]])
+
+    assert stat.S_IMODE(os.stat(fileName).st_mode) == 0o640
+
+
+def test_write_new_document_default_permissions(tmp_path):
+
+    umask = os.umask(0o022)
+    try:
+        fileName = str(tmp_path / "document.csv")
+        writeStore(fileName, [["a"]])
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(os.stat(fileName).st_mode) == 0o644
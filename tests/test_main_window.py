@@ -0,0 +1,61 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+from conftest import waitUntil, writeDocument
+from main_window import MainWindow
+
+
+def test_open_recent_document(app, tmp_path):
+
+    canonicalName = writeDocument(str(tmp_path), "recent.csv", [["a", "b"], ["1", "2"]])
+
+    window = MainWindow()
+    window._updateRecentDocuments(canonicalName)
+
+    action = window._actionRecentDocuments[0]
+    assert action.data() == canonicalName
+
+    action.trigger()
+
+    assert waitUntil(lambda: len(window._documentArea.subWindowList()) == 1)
+    assert window._documentArea.subWindowList()[0].widget().canonicalName() == canonicalName
+
+    window.close()
+
+
+def test_save_as_open_document_refused(app, tmp_path):
+
+    first = writeDocument(str(tmp_path), "first.csv", [["a", "b"]])
+    second = writeDocument(str(tmp_path), "second.csv", [["c", "d"]])
+
+    window = MainWindow()
+    assert window._openDocument(first) and window._openDocument(second)
+    assert waitUntil(lambda: not any(subWindow.widget().isLoading() for subWindow in window._documentArea.subWindowList()))
+
+    firstWindow = window._findDocumentWindow(first)
+    secondWindow = window._findDocumentWindow(second)
+
+    # The second document is neither written over nor unregistered
+    assert not window._saveDocument(firstWindow.widget(), second)
+    assert window._findDocumentWindow(second) is secondWindow
+    with open(second, encoding="utf-8") as file:
+        assert file.read() == "c,d\n"
+
+    window.close()
@@ -0,0 +1,109 @@
+# This Python file uses the following encoding: utf-8
+#
+# Copyright 2020-2021 NotNypical, <https://notnypical.github.io>.
+#
+# This file is part of Tabulator-QtPy, <https://github.com/notnypical/tabulator-qtpy>.
+#
+# Tabulator-QtPy is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Tabulator-QtPy is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Tabulator-QtPy.  If not, see <https://www.gnu.org/licenses/>.
+#
+
+import os
+
+import pytest
+from PySide2.QtCore import QSettings
+
+from settings_cache import SettingsCache
+
+
+def writeSettings(cache):
+
+    cache.beginGroup("Test")
+    cache.setValue("Number", 10)
+    cache.setValue("Enabled", True)
+    cache.setValue("Names", ["a", "b"])
+    cache.setValue("Name", ["a"])
+    cache.beginWriteArray("Documents")
+    for index, name in enumerate(["x", "y"]):
+        cache.setArrayIndex(index)
+        cache.setValue("Document", name)
+    cache.endArray()
+    cache.endGroup()
+
+
+def writtenKeys(cache, monkeypatch):
+
+    # Keys written by the next flush
+    keys = []
+    monkeypatch.setattr(cache._writePool, "start", lambda writer: keys.extend(list(writer._values) + writer._removedKeys))
+    cache.flush()
+
+    return sorted(keys)
+
+
+@pytest.fixture
+def settingsFile(app, tmp_path):
+
+    # Settings as read by a new process, from a file written beforehand
+    fileName = QSettings().fileName()
+    path = os.path.dirname(os.path.dirname(fileName))
+
+    os.makedirs(str(tmp_path / app.organizationName()))
+    with open(str(tmp_path / app.organizationName() / os.path.basename(fileName)), "w") as file:
+        file.write("[Test]\nNumber=10\nEnabled=true\nNames=a, b\nName=a\n"
+            "Documents\\1\\Document=x\nDocuments\\2\\Document=y\nDocuments\\size=2\n")
+
+    QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, str(tmp_path))
+    yield
+    QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, path)
+
+
+def test_unchanged_values_are_not_written(settingsFile, monkeypatch):
+
+    # Values are read back from the file as texts
+    cache = SettingsCache()
+    assert cache.value("Test/Number") == "10"
+    assert cache.value("Test/Documents/size") == "2"
+
+    writeSettings(cache)
+    assert writtenKeys(cache, monkeypatch) == []
+
+    cache.beginGroup("Test")
+    cache.setValue("Number", 11)
+    cache.endGroup()
+    assert writtenKeys(cache, monkeypatch) == ["Test/Number"]
+
+
+def test_array_size(settingsFile, monkeypatch):
+
+    # Arrays read are not written
+    cache = SettingsCache()
+    cache.beginGroup("Test")
+    assert cache.beginReadArray("Documents") == 2
+    cache.setArrayIndex(0)
+    assert cache.value("Document") == "x"
+    cache.endArray()
+    cache.endGroup()
+    assert writtenKeys(cache, monkeypatch) == []
+
+    # A size given is written at once, as QSettings does
+    cache.beginWriteArray("Sized", 3)
+    assert cache.value("size") == 3
+    cache.setArrayIndex(0)
+    cache.setValue("Document", "x")
+    cache.endArray()
+    assert cache.value("Sized/size") == 3
+
+    cache.beginWriteArray("Counted")
+    cache.endArray()
+    assert cache.value("Counted/size") == 0